@@ -2,60 +2,69 @@
 # Отслеживание версий
 VERSION = "1.6.5"
 
-import random
-import time
-import numpy as np
-import sys
+import argparse
 import os
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import List
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
+
+# Начало запуска: время импорта модулей входит в отчет --startup-profile
+_import_started = time.perf_counter()
 
 import pygame
-from highscores import HighScoreManager
+from assets import AssetManager
+from config import (
+    BALL_SIZE,
+    FPS,
+    FRAME_PACING_MODES,
+    MAX_LIVES,
+    PADDLE_SPEED,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    resource_path,
+)
+from display import SCALE_MODES, Display
+from engine import Scene, SceneManager
+from entities import Ball, Paddle
+from fonts import FontRegistry, default_font_registry
+from ghost import GhostReader, GhostRecorder
+from highscores import HIGHSCORE_HEADER, HIGHSCORE_SEPARATOR, HighScoreManager
+from hud import HUD_OPTIONAL_FIELDS, Hud
+from rng import RandomStreams
 from settings import SettingsManager
+from sprites import BrickAtlas, SpriteCache
+from startup import STARTUP, lazy_import
 
+# Модули игрового экрана используют NumPy и загружаются при первом обращении,
+# поэтому экран ввода имени появляется, не дожидаясь их импорта
+effects = lazy_import("effects")
+levels = lazy_import("levels")
+trajectory = lazy_import("trajectory")
 
-def resource_path(relative_path):
-    """Получает абсолютный путь к ресурсу, работает как в разработке, так и в exe"""
-    try:
-        # PyInstaller создает временную папку и сохраняет путь в _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+if TYPE_CHECKING:
+    from autopilot import Autopilot
+    from balls import BallPool
+    from bricks import BrickStore
+    from chunked_replay import ChunkedReplay
+    from levels import LevelPack
+    from memtrace import MemoryTracker
+    from replay import Replay, ReplayPilot
 
-    return os.path.join(base_path, relative_path)
+STARTUP.origin = _import_started
+STARTUP.add("импорт модулей", _import_started)
 
 
-# Настройки игры
-# Размеры экрана
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
-
-# Размеры и скорость платформы
-PADDLE_WIDTH = 120
-PADDLE_HEIGHT = 15
-PADDLE_SPEED = 9
-
-# Размеры и скорость мяча
-BALL_SIZE = 16
-BALL_SPEED_DEFAULT = 5  # Значение по умолчанию
-
-# Параметры кубиков
-BRICK_ROWS = 5
-BRICK_COLS = 10
-BRICK_WIDTH = 60
-BRICK_HEIGHT = 20
-BRICK_PADDING = 10
-BRICK_OFFSET_TOP = 60
-
-MAX_LIVES = 3  # Максимальное количество жизней
+# Изображения, загружаемые при старте игры
+ASSET_MANIFEST = ["resources/icon.png"]
 
 
 def generate_tone_sound(
     frequency: float, duration: float, sample_rate: int = 44100, volume: float = 0.3
 ) -> pygame.mixer.Sound:
     """Генерирует короткий тональный звук для звуковых эффектов"""
+    import numpy as np  # NumPy нужен только для синтеза звука
+
     frames = int(duration * sample_rate)
     t = np.linspace(0, duration, frames)
 
@@ -93,60 +102,214 @@ def generate_paddle_sound() -> pygame.mixer.Sound:
     return generate_tone_sound(330, 0.15, volume=0.4)  # E4 - 330 Гц
 
 
-def get_player_name(
+def build_bricks(level_index: int = 0) -> "BrickStore":
+    """Создает кубики уровня с номером level_index"""
+    return levels.default_level_pack().build(level_index)
+
+
+def draw_bricks(
+    screen: pygame.Surface, bricks: "BrickStore", atlas: "BrickAtlas"
+) -> None:
+    """Рисует кубики из атласа спрайтов одним вызовом blits()"""
+    atlas.draw(screen, bricks)
+
+
+LANDING_MARKER_COLOR = (255, 255, 0)
+
+
+def draw_landing_marker(screen: pygame.Surface, session) -> None:
+    """
+    Подсказка (--assist): кольцо в точке, где основной мяч долетит
+    до платформы. Если до платформы мяч ударится о кубик, подсказки нет.
+    """
+    balls, paddle = session.balls, session.paddle
+    index = balls.primary()
+    if index < 0:
+        return
+    landing = trajectory.predict_landing(
+        int(balls.x[index]),
+        int(balls.y[index]),
+        int(balls.vel_x[index]),
+        int(balls.vel_y[index]),
+        balls.size,
+        paddle.rect.top,
+        bricks=session.bricks,
+    )
+    if landing is not None:
+        center = (round(landing[1]), paddle.rect.top - balls.size // 2)
+        pygame.draw.circle(screen, LANDING_MARKER_COLOR, center, balls.size // 2, 2)
+
+
+def show_message(screen: pygame.Surface, font: pygame.font.Font, message: str) -> None:
+    surf = font.render(message, True, (255, 255, 255))
+    rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+    screen.blit(surf, rect)
+
+
+def render_colored_hint(
     screen: pygame.Surface,
     font: pygame.font.Font,
-    big_font: pygame.font.Font,
-    highscore_manager: HighScoreManager,
-) -> tuple[str, bool, bool]:
-    """Возвращает имя игрока, введенное с клавиатуры, состояние музыки и флаг выхода из игры"""
-    input_text = ""
-    input_active = True
-    music_enabled = True
-    exit_game = False
-
-    while input_active:
-        # Обработка событий
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                exit_game = True
-                return "", music_enabled, exit_game  # Выход из игры по крестику
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    if input_text.strip():
-                        input_active = False
-                elif event.key == pygame.K_BACKSPACE:
-                    input_text = input_text[:-1]
-                elif (
-                    len(input_text) < 20
-                    and event.unicode
-                    and is_valid_player_name_char(event.unicode)
-                ):  # Ограничение длины имени и допустимых символов
-                    input_text += event.unicode
-                elif event.key == pygame.K_ESCAPE:
-                    # Выход из игры
-                    return "", music_enabled, True
-                elif event.key == pygame.K_m:
-                    # Переключение фоновой музыки
-                    if music_enabled:
-                        pygame.mixer.music.stop()
-                        music_enabled = False
-                    else:
-                        pygame.mixer.music.play(-1)
-                        music_enabled = True
-
-        # Отрисовка экрана
+    text: str,
+    pos: tuple,
+    base_color=(200, 200, 200),
+    key_color=(255, 255, 0),
+) -> None:
+    """Отображает подсказку с выделенными ключевыми словами цветом"""
+    words = text.split()
+    x, y = pos
+    key_words = ["Enter", "H", "M", "ESC"]
+
+    for word in words:
+        # Убираем знаки препинания для сравнения
+        clean_word = word.rstrip(".,:!?")
+
+        if clean_word in key_words:
+            # Выделяем ключевое слово цветом
+            color = key_color
+        else:
+            color = base_color
+
+        surf = font.render(word, True, color)
+        screen.blit(surf, (x, y))
+        x += surf.get_width() + font.size(" ")[0]  # добавляем пробел
+
+    return x - pos[0]  # возвращаем ширину текста
+
+
+def draw_start_hint(screen: pygame.Surface, font: pygame.font.Font) -> None:
+    text = "Для начала игры нажми ← или →"
+    surf = font.render(text, True, (255, 255, 255))
+    rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+    screen.blit(surf, rect)
+
+
+def reset_game(
+    paddle: Paddle,
+    ball: "BallPool",
+    bricks: "BrickStore",
+    score: int,
+    lives_left: int,
+    game_over: bool,
+    game_started: bool,
+    ball_trail: list,
+    game_start_time: float,
+    settings_manager: SettingsManager = None,
+) -> tuple:
+    """
+    Сброс игры для кода, хранящего состояние в отдельных переменных.
+    Платформа, мяч (или пул мячей) и шлейф сбрасываются на месте, без новых объектов.
+    Сама игра хранит состояние в GameSession и сбрасывает его через GameSession.reset().
+    """
+    paddle.reset()
+
+    # Устанавливаем скорость мяча из настроек
+    if settings_manager is None:
+        settings_manager = SettingsManager()
+    ball.set_speed(settings_manager.get_ball_speed())
+    ball.serve(paddle.rect)
+    ball_trail.clear()
+
+    new_bricks = build_bricks()
+
+    # Возвращаем сброшенные значения
+    return (
+        paddle,
+        ball,
+        new_bricks,
+        0,
+        MAX_LIVES,
+        False,
+        False,
+        ball_trail,
+        time.time(),
+    )
+
+
+@dataclass
+class GameContext:
+    """Общие ресурсы всех экранов игры"""
+
+    font: pygame.font.Font
+    big_font: pygame.font.Font
+    highscore_manager: HighScoreManager = None
+    settings_manager: SettingsManager = None
+    sprite_cache: SpriteCache = field(default_factory=SpriteCache)
+    paddle_bounce_sound: pygame.mixer.Sound = None
+    brick_hit_sounds: List[pygame.mixer.Sound] = None
+    sounds_loaded: bool = False
+    music_enabled: bool = True
+    player_name: str = ""
+    fonts: FontRegistry = field(default_factory=default_font_registry)
+    memory: Optional["MemoryTracker"] = None  # Диагностика памяти (--trace-memory)
+    rng: RandomStreams = field(default_factory=RandomStreams)  # Зерно - --seed
+    hud_fields: Tuple[str, ...] = ()  # Дополнительные поля HUD (параметр --hud)
+    assist: bool = False  # Подсказка точки падения мяча (параметр --assist)
+    level_pack: Optional["LevelPack"] = None  # Уровни; None - уровни игры
+    ghost: bool = False  # Призрак лучшей партии (параметр --ghost)
+
+    def toggle_music(self) -> None:
+        """Переключение фоновой музыки"""
+        if self.music_enabled:
+            pygame.mixer.music.stop()
+            self.music_enabled = False
+        else:
+            pygame.mixer.music.play(-1)
+            self.music_enabled = True
+
+
+class NameInputScene(Scene):
+    """
+    Экран ввода имени игрока.
+    Если задан next_scene, после ввода имени экран заменяется созданным им экраном.
+    """
+
+    def __init__(
+        self,
+        context: GameContext,
+        next_scene: Optional[Callable[[], Scene]] = None,
+    ):
+        super().__init__()
+        self.context = context
+        self.next_scene = next_scene
+        self.input_text = ""
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_RETURN:
+            if self.input_text.strip():
+                self.context.player_name = self.input_text.strip()
+                if self.next_scene is None:
+                    self.manager.pop()
+                else:
+                    self.manager.replace(self.next_scene())
+        elif event.key == pygame.K_BACKSPACE:
+            self.input_text = self.input_text[:-1]
+        elif (
+            len(self.input_text) < 20
+            and event.unicode
+            and is_valid_player_name_char(event.unicode)
+        ):  # Ограничение длины имени и допустимых символов
+            self.input_text += event.unicode
+        elif event.key == pygame.K_ESCAPE:
+            # Выход из игры
+            self.manager.quit()
+        elif event.key == pygame.K_m:
+            self.context.toggle_music()
+
+    def draw(self, screen: pygame.Surface) -> None:
+        font = self.context.font
         screen.fill((10, 10, 30))
 
         # Заголовок
-        title = big_font.render("Введите ваше имя:", True, (255, 255, 255))
+        title = self.context.big_font.render("Введите ваше имя:", True, (255, 255, 255))
         title_rect = title.get_rect(
             center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)
         )
         screen.blit(title, title_rect)
 
         # Поле ввода
-        input_surface = font.render(input_text, True, (255, 255, 255))
+        input_surface = font.render(self.input_text, True, (255, 255, 255))
         input_rect = input_surface.get_rect(
             center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
         )
@@ -179,117 +342,99 @@ def get_player_name(
             (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 80),
         )
 
-        pygame.display.flip()
-
-    return input_text.strip(), music_enabled, exit_game
 
-
-def show_highscores(
+def get_player_name(
     screen: pygame.Surface,
     font: pygame.font.Font,
+    big_font: pygame.font.Font,
     highscore_manager: HighScoreManager,
-    exit_on_esc: bool = False,
-) -> tuple[bool, bool]:
+) -> tuple[str, bool, bool]:
+    """Возвращает имя игрока, введенное с клавиатуры, состояние музыки и флаг выхода из игры"""
+    context = GameContext(font, big_font, highscore_manager)
+    exit_game = SceneManager(screen, FPS).run(NameInputScene(context))
+    return context.player_name, context.music_enabled, exit_game
+
+
+def render_highscore_table(
+    rows: List[str], mono_font: pygame.font.Font, font: pygame.font.Font
+) -> pygame.Surface:
+    """Рисует таблицу рекордов (строки rows) в прозрачную поверхность размером с экран"""
+    table = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    center_x = SCREEN_WIDTH // 2
+
+    # Заголовок
+    title = font.render("ТАБЛИЦА РЕКОРДОВ", True, (255, 255, 255))
+    table.blit(title, title.get_rect(center=(center_x, 30)))
+
+    if not rows:
+        no_scores = font.render("Пока нет рекордов", True, (200, 200, 200))
+        table.blit(no_scores, no_scores.get_rect(center=(center_x, 150)))
+        return table
+
+    # Заголовки колонок между двумя линиями разделителя
+    separator_surf = mono_font.render(HIGHSCORE_SEPARATOR, True, (150, 150, 150))
+    headers_surf = mono_font.render(f"   {HIGHSCORE_HEADER}", True, (255, 255, 255))
+    table.blit(separator_surf, separator_surf.get_rect(center=(center_x, 70)))
+    table.blit(headers_surf, headers_surf.get_rect(center=(center_x, 95)))
+    table.blit(separator_surf, separator_surf.get_rect(center=(center_x, 120)))
+
+    # Данные таблицы
+    for i, row in enumerate(rows):
+        row_surf = mono_font.render(row, True, (255, 255, 255))
+        table.blit(row_surf, row_surf.get_rect(center=(center_x, 145 + i * 25)))
+    return table
+
+
+class HighscoresScene(Scene):
     """
-    Отображает таблицу рекордов.
-    Возвращает (состояние_музыки, exit_game).
-    Если exit_on_esc=True, то ESC выходит из игры полностью, иначе возвращает False.
+    Экран таблицы рекордов.
+    Если exit_on_esc=True, то ESC выходит из игры полностью, иначе возвращает назад.
     """
-    # Создаем моноширинный шрифт для правильного отображения таблицы
-    try:
-        mono_font = pygame.font.SysFont("consolas", 18)  # Моноширинный шрифт Windows
-    except:
-        try:
-            mono_font = pygame.font.SysFont(
-                "courier", 18
-            )  # Альтернативный моноширинный шрифт
-        except:
-            mono_font = font  # Если не получилось, используем обычный шрифт
-
-    # Состояние фоновой музыки
-    music_enabled = True
-
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return music_enabled, True  # Выход из игры по крестику
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if exit_on_esc:
-                        return music_enabled, True  # Выход из игры
-                    else:
-                        waiting = False  # Возвращаемся назад
-                elif event.key == pygame.K_BACKSPACE:
-                    waiting = False  # Возвращаемся назад
-                elif event.key == pygame.K_m:
-                    # Переключение фоновой музыки
-                    if music_enabled:
-                        pygame.mixer.music.stop()
-                        music_enabled = False
-                    else:
-                        pygame.mixer.music.play(-1)
-                        music_enabled = True
-
-        # Отрисовка экрана рекордов
-        screen.fill((10, 10, 30))
 
-        # Заголовок
-        title = font.render("ТАБЛИЦА РЕКОРДОВ", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 30))
-        screen.blit(title, title_rect)
-
-        # Получаем отформатированные данные для отображения
-        highscores = highscore_manager.get_top_scores()
-
-        if not highscores:
-            no_scores = font.render("Пока нет рекордов", True, (200, 200, 200))
-            no_scores_rect = no_scores.get_rect(center=(SCREEN_WIDTH // 2, 150))
-            screen.blit(no_scores, no_scores_rect)
-        else:
-            # Линии разделителя
-            separator_line = "=" * 69
-            separator_surf = mono_font.render(separator_line, True, (150, 150, 150))
-            separator_rect = separator_surf.get_rect(center=(SCREEN_WIDTH // 2, 70))
-            screen.blit(separator_surf, separator_rect)
-
-            # Заголовки колонок
-            headers = "   Место | Игрок               | Очки | Время  "
-            headers_surf = mono_font.render(headers, True, (255, 255, 255))
-            headers_rect = headers_surf.get_rect(center=(SCREEN_WIDTH // 2, 95))
-            screen.blit(headers_surf, headers_rect)
-
-            # Вторая линия разделителя
-            separator_surf2 = mono_font.render(separator_line, True, (150, 150, 150))
-            separator_rect2 = separator_surf2.get_rect(center=(SCREEN_WIDTH // 2, 120))
-            screen.blit(separator_surf2, separator_rect2)
-
-            # Данные таблицы
-            y_offset = 145
-            for i, score_data in enumerate(highscores, 1):
-                # Форматируем данные точно как в правильном файле
-                if i < 10:
-                    place = f"   {i}.  "
-                else:
-                    place = f"  {i}.  "
-
-                player_name = score_data["player_name"]
-                player = f"{player_name[:20]:<20}"
-                score = f"{score_data['score']:>3}"
-                time = f"{score_data['time_formatted']:>5}"
-
-                # Собираем строку
-                row = f"{place}| {player}| {score}  | {time}"
+    def __init__(self, context: GameContext, exit_on_esc: bool = False):
+        super().__init__()
+        self.context = context
+        self.exit_on_esc = exit_on_esc
+        self.mono_font = context.font
+
+    def enter(self) -> None:
+        # Моноширинный шрифт для правильного отображения таблицы:
+        # consolas (Windows) или courier; если их нет - обычный шрифт.
+        # Шрифт создается один раз и общий для всех открытий таблицы
+        self.mono_font = (
+            self.context.fonts.first_available(("consolas", "courier"), 18)
+            or self.context.font
+        )
 
-                # Отображаем строку
-                row_surf = mono_font.render(row, True, (255, 255, 255))
-                row_rect = row_surf.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                screen.blit(row_surf, row_rect)
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            if self.exit_on_esc:
+                self.manager.quit()  # Выход из игры
+            else:
+                self.manager.pop()  # Возвращаемся назад
+        elif event.key == pygame.K_BACKSPACE:
+            self.manager.pop()  # Возвращаемся назад
+        elif event.key == pygame.K_m:
+            self.context.toggle_music()
+
+    def draw(self, screen: pygame.Surface) -> None:
+        font = self.context.font
+        mono_font = self.mono_font
+        screen.fill((10, 10, 30))
 
-                y_offset += 25
+        # Заголовок и таблица рисуются в поверхность один раз и перерисовывается
+        # только после изменения рекордов
+        leaderboard = self.context.highscore_manager.leaderboard()
+        table = leaderboard.cached(
+            ("surface", mono_font, font),
+            lambda: render_highscore_table(leaderboard.rows(), mono_font, font),
+        )
+        screen.blit(table, (0, 0))
 
         # Подсказки для возврата
-        if exit_on_esc:
+        if self.exit_on_esc:
             render_colored_hint(
                 screen,
                 font,
@@ -304,75 +449,76 @@ def show_highscores(
                 (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 70),
             )
 
-        pygame.display.flip()
-
-    return music_enabled, False  # Возвращаемся, не выходя из игры
-
 
-def show_game_results(
+def show_highscores(
     screen: pygame.Surface,
     font: pygame.font.Font,
-    big_font: pygame.font.Font,
-    score: int,
-    player_name: str,
-    game_time_seconds: int,
     highscore_manager: HighScoreManager,
-    settings_manager: SettingsManager,
-    ball: "Ball",
-) -> tuple[bool, bool, bool]:
-    """Отображает экран с результатами игры и таблицей рекордов. Возвращает (состояние_музыки, перезапуск_игры, выход_из_игры)."""
-    game_time_formatted = f"{game_time_seconds // 60}:{game_time_seconds % 60:02d}"
-
-    # Добавляем результат в рекорды и проверяем, попал ли он в топ-10
-    score_saved = highscore_manager.add_score(player_name, score, game_time_seconds)
-
-    # Состояние фоновой музыки
-    music_enabled = True
-    restart_game = False
-    exit_game = False
-
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                exit_game = True
-                return music_enabled, False, exit_game  # Выход из игры по крестику
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    exit_game = True
-                    return music_enabled, False, exit_game  # Выход из игры
-                elif event.key == pygame.K_RETURN:
-                    waiting = False
-                    restart_game = True
-                elif event.key == pygame.K_h:
-                    # Показываем таблицу рекордов (ESC выходит из игры)
-                    music_enabled, exit_game = show_highscores(
-                        screen, font, highscore_manager, exit_on_esc=True
-                    )
-                    if exit_game:
-                        exit_game = True
-                        return music_enabled, False, exit_game  # Выход из игры
-                elif event.key == pygame.K_m:
-                    # Переключение фоновой музыки
-                    if music_enabled:
-                        pygame.mixer.music.stop()
-                        music_enabled = False
-                    else:
-                        pygame.mixer.music.play(-1)
-                        music_enabled = True
-                elif event.key == pygame.K_UP:
-                    # Открытие окна настроек
-                    paused = True
-                    music_enabled = show_settings_window(
-                        screen, font, big_font, settings_manager, ball, music_enabled
-                    )
-                    paused = False
+    exit_on_esc: bool = False,
+) -> tuple[bool, bool]:
+    """
+    Отображает таблицу рекордов.
+    Возвращает (состояние_музыки, exit_game).
+    Если exit_on_esc=True, то ESC выходит из игры полностью, иначе возвращает False.
+    """
+    context = GameContext(font, font, highscore_manager)
+    exit_game = SceneManager(screen, FPS).run(HighscoresScene(context, exit_on_esc))
+    return context.music_enabled, exit_game
+
+
+class ResultsScene(Scene):
+    """Экран с результатами игры. Enter - новая игра, H - рекорды, ↑ - настройки"""
+
+    def __init__(
+        self,
+        context: GameContext,
+        score: int,
+        game_time_seconds: int,
+        ball: "BallPool",
+        ghost: Optional[bytes] = None,
+    ):
+        super().__init__()
+        self.context = context
+        self.score = score
+        self.game_time_seconds = game_time_seconds
+        self.ball = ball
+        self.ghost = ghost  # Запись партии для призрака (сохраняется с рекордом)
+        self.score_saved = False
+        self.restart_game = False
+
+    def enter(self) -> None:
+        # Добавляем результат в рекорды и проверяем, попал ли он в топ-10
+        self.score_saved = self.context.highscore_manager.add_score(
+            self.context.player_name, self.score, self.game_time_seconds, self.ghost
+        )
 
-        # Отрисовка экрана результатов
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.manager.quit()  # Выход из игры
+        elif event.key == pygame.K_RETURN:
+            self.restart_game = True
+            self.manager.pop()
+        elif event.key == pygame.K_h:
+            # Показываем таблицу рекордов (ESC выходит из игры)
+            self.manager.push(HighscoresScene(self.context, exit_on_esc=True))
+        elif event.key == pygame.K_m:
+            self.context.toggle_music()
+        elif event.key == pygame.K_UP:
+            # Открытие окна настроек
+            self.manager.push(SettingsScene(self.context, self.ball))
+
+    def draw(self, screen: pygame.Surface) -> None:
+        font = self.context.font
+        big_font = self.context.big_font
+        game_time_formatted = (
+            f"{self.game_time_seconds // 60}:{self.game_time_seconds % 60:02d}"
+        )
         screen.fill((10, 10, 30))
 
         # Заголовок
-        if score > 0:
+        if self.score > 0:
             title = big_font.render("Игра окончена!", True, (255, 255, 255))
         else:
             title = big_font.render("Игра окончена", True, (255, 255, 255))
@@ -380,8 +526,8 @@ def show_game_results(
         screen.blit(title, title_rect)
 
         # Результаты игрока
-        result_text = f"Игрок: {player_name}"
-        score_text = f"Очки: {score}"
+        result_text = f"Игрок: {self.context.player_name}"
+        score_text = f"Очки: {self.score}"
         time_text = f"Время игры: {game_time_formatted}"
 
         surf1 = font.render(result_text, True, (255, 255, 255))
@@ -393,7 +539,7 @@ def show_game_results(
         screen.blit(surf3, (SCREEN_WIDTH // 2 - 100, 300))
 
         # Сообщение о топ-10
-        if not score_saved:
+        if not self.score_saved:
             warning_text = "Результат не попал в топ-10, таблица рекордов не обновлена"
             warning_surface = font.render(warning_text, True, (255, 200, 100))
             warning_rect = warning_surface.get_rect(center=(SCREEN_WIDTH // 2, 360))
@@ -410,185 +556,32 @@ def show_game_results(
             screen, font, "ESC - выход из игры", (SCREEN_WIDTH // 2 - 150, 430)
         )
 
-        pygame.display.flip()
-
-    return music_enabled, restart_game, exit_game
 
-
-@dataclass
-class Paddle:
-    rect: pygame.Rect = field(
-        default_factory=lambda: pygame.Rect(
-            (SCREEN_WIDTH - PADDLE_WIDTH) // 2,
-            SCREEN_HEIGHT - 60,
-            PADDLE_WIDTH,
-            PADDLE_HEIGHT,
-        )
-    )
-
-    def move(self, direction: int) -> None:
-        """direction = -1 (влево) / 1 (вправо)."""
-        self.rect.x += direction * PADDLE_SPEED
-        self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
-
-
-@dataclass
-class Ball:
-    """Класс мяча с интегрированным управлением скоростью"""
-
-    rect: pygame.Rect = field(
-        default_factory=lambda: pygame.Rect(
-            (SCREEN_WIDTH - BALL_SIZE) // 2,
-            SCREEN_HEIGHT // 2,
-            BALL_SIZE,
-            BALL_SIZE,
-        )
-    )
-    vel_x: int = field(
-        default_factory=lambda: random.choice([-BALL_SPEED_DEFAULT, BALL_SPEED_DEFAULT])
-    )
-    vel_y: int = field(default_factory=lambda: -BALL_SPEED_DEFAULT)
-    current_speed: int = field(default_factory=lambda: BALL_SPEED_DEFAULT)
-
-    def update(self) -> None:
-        self.rect.x += self.vel_x
-        self.rect.y += self.vel_y
-
-        if self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH:
-            self.vel_x *= -1
-        if self.rect.top <= 0:
-            self.vel_y *= -1
-
-    def bounce_vertical(self) -> None:
-        self.vel_y *= -1
-
-    def reset(self, paddle_rect: pygame.Rect) -> None:
-        """Сброс мяча на платформу с текущей скоростью"""
-        self.rect.center = paddle_rect.midtop
-        self.rect.y -= BALL_SIZE
-        self.vel_x = random.choice([-self.current_speed, self.current_speed])
-        self.vel_y = -self.current_speed
-
-    def set_speed(self, speed: int, settings_manager: SettingsManager = None) -> None:
-        """Устанавливает скорость мяча и обновляет настройки"""
-        if 1 <= speed <= 10:
-            old_speed = self.current_speed
-            self.current_speed = speed
-            self.vel_x = (
-                int(self.vel_x * speed / old_speed) if old_speed != 0 else speed
-            )
-            self.vel_y = (
-                int(self.vel_y * speed / old_speed) if old_speed != 0 else -speed
-            )
-
-            if settings_manager:
-                settings_manager.set_ball_speed(speed)
-
-    def increase_speed(self, settings_manager: SettingsManager = None) -> None:
-        """Увеличивает скорость на 1 (максимум 10)"""
-        if self.current_speed < 10:
-            self.set_speed(self.current_speed + 1, settings_manager)
-
-    def decrease_speed(self, settings_manager: SettingsManager = None) -> None:
-        """Уменьшает скорость на 1 (минимум 1)"""
-        if self.current_speed > 1:
-            self.set_speed(self.current_speed - 1, settings_manager)
-
-    def get_speed(self) -> int:
-        """Возвращает текущую скорость мяча"""
-        return self.current_speed
-
-
-def build_bricks() -> List[pygame.Rect]:
-    bricks = []
-    start_x = (
-        SCREEN_WIDTH - (BRICK_COLS * BRICK_WIDTH + (BRICK_COLS - 1) * BRICK_PADDING)
-    ) // 2
-    for row in range(BRICK_ROWS):
-        for col in range(BRICK_COLS):
-            x = start_x + col * (BRICK_WIDTH + BRICK_PADDING)
-            y = BRICK_OFFSET_TOP + row * (BRICK_HEIGHT + BRICK_PADDING)
-            bricks.append(pygame.Rect(x, y, BRICK_WIDTH, BRICK_HEIGHT))
-    return bricks
-
-
-def draw_bricks(screen: pygame.Surface, bricks: List[pygame.Rect]) -> None:
-    colors = [
-        (200, 80, 80),
-        (200, 160, 80),
-        (80, 200, 120),
-        (80, 140, 220),
-        (150, 80, 220),
-    ]
-    for idx, brick in enumerate(bricks):
-        pygame.draw.rect(screen, colors[idx // BRICK_COLS % len(colors)], brick)
-        pygame.draw.rect(screen, (30, 30, 30), brick, 2)
-
-
-def draw_hud(
-    screen: pygame.Surface,
-    score: int,
-    lives_left: int,
-    font: pygame.font.Font,
-    ball: Ball,
-) -> None:
-    text = f"Очки: {score} | Жизни: {lives_left} | Скорость: {ball.get_speed()} | ↑↓ - скорость"
-    surf = font.render(text, True, (255, 255, 255))
-    screen.blit(surf, (SCREEN_WIDTH - surf.get_width() - 20, 20))
-
-
-def show_message(screen: pygame.Surface, font: pygame.font.Font, message: str) -> None:
-    surf = font.render(message, True, (255, 255, 255))
-    rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-    screen.blit(surf, rect)
-
-
-def render_colored_hint(
+def show_game_results(
     screen: pygame.Surface,
     font: pygame.font.Font,
-    text: str,
-    pos: tuple,
-    base_color=(200, 200, 200),
-    key_color=(255, 255, 0),
-) -> None:
-    """Отображает подсказку с выделенными ключевыми словами цветом"""
-    words = text.split()
-    x, y = pos
-    key_words = ["Enter", "H", "M", "ESC"]
-
-    for word in words:
-        # Убираем знаки препинания для сравнения
-        clean_word = word.rstrip(".,:!?")
-
-        if clean_word in key_words:
-            # Выделяем ключевое слово цветом
-            color = key_color
-        else:
-            color = base_color
-
-        surf = font.render(word, True, color)
-        screen.blit(surf, (x, y))
-        x += surf.get_width() + font.size(" ")[0]  # добавляем пробел
-
-    return x - pos[0]  # возвращаем ширину текста
+    big_font: pygame.font.Font,
+    score: int,
+    player_name: str,
+    game_time_seconds: int,
+    highscore_manager: HighScoreManager,
+    settings_manager: SettingsManager,
+    ball: "BallPool",
+) -> tuple[bool, bool, bool]:
+    """Отображает экран с результатами игры и таблицей рекордов. Возвращает (состояние_музыки, перезапуск_игры, выход_из_игры)."""
+    context = GameContext(
+        font, big_font, highscore_manager, settings_manager, player_name=player_name
+    )
+    scene = ResultsScene(context, score, game_time_seconds, ball)
+    exit_game = SceneManager(screen, FPS).run(scene)
+    return context.music_enabled, scene.restart_game and not exit_game, exit_game
 
 
-def draw_start_hint(screen: pygame.Surface, font: pygame.font.Font) -> None:
-    text = "Для начала игры нажми ← или →"
-    surf = font.render(text, True, (255, 255, 255))
-    rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-    screen.blit(surf, rect)
+class SettingsScene(Scene):
+    """Окно настроек со слайдером скорости мяча (рисуется поверх предыдущего экрана)"""
 
+    overlay = True
 
-def show_settings_window(
-    screen: pygame.Surface,
-    font: pygame.font.Font,
-    big_font: pygame.font.Font,
-    settings_manager: SettingsManager,
-    ball: Ball,
-    music_enabled: bool,
-) -> bool:
-    """Отображает окно настроек с слайдером скорости мяча. Возвращает состояние музыки."""
     # Параметры слайдера
     slider_x = 200
     slider_y = 250
@@ -596,67 +589,66 @@ def show_settings_window(
     slider_height = 20
     knob_radius = 15
 
-    # Текущая скорость
-    current_speed = ball.get_speed()
-
-    dragging = False
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    waiting = False  # Закрыть окно
-                elif event.key == pygame.K_m:
-                    # Переключение музыки
-                    if music_enabled:
-                        pygame.mixer.music.stop()
-                        music_enabled = False
-                    else:
-                        pygame.mixer.music.play(-1)
-                        music_enabled = True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Левая кнопка мыши
-                    mouse_x, mouse_y = event.pos
-                    # Проверить, нажали ли на бегунок
-                    knob_x = slider_x + (current_speed - 1) * (slider_width / 9)
-                    knob_y = slider_y + slider_height // 2
-                    if (mouse_x - knob_x) ** 2 + (
-                        mouse_y - knob_y
-                    ) ** 2 <= knob_radius**2:
-                        dragging = True
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
-                    dragging = False
-            elif event.type == pygame.MOUSEMOTION:
-                if dragging:
-                    mouse_x, _ = event.pos
-                    # Вычислить новую скорость
-                    relative_x = mouse_x - slider_x
-                    if relative_x < 0:
-                        new_speed = 1
-                    elif relative_x > slider_width:
-                        new_speed = 10
-                    else:
-                        new_speed = int(1 + (relative_x / slider_width) * 9)
-                    if new_speed != current_speed:
-                        current_speed = new_speed
-                        ball.set_speed(current_speed, settings_manager)
+    def __init__(self, context: GameContext, ball: "BallPool"):
+        super().__init__()
+        self.context = context
+        self.ball = ball
+        self.current_speed = ball.get_speed()
+        self.dragging = False
+
+    def _knob_x(self) -> float:
+        return self.slider_x + (self.current_speed - 1) * (self.slider_width / 9)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()  # Закрыть окно
+            elif event.key == pygame.K_m:
+                self.context.toggle_music()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Левая кнопка мыши
+                mouse_x, mouse_y = event.pos
+                # Проверить, нажали ли на бегунок
+                knob_y = self.slider_y + self.slider_height // 2
+                if (mouse_x - self._knob_x()) ** 2 + (
+                    mouse_y - knob_y
+                ) ** 2 <= self.knob_radius**2:
+                    self.dragging = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:
+                self.dragging = False
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                mouse_x, _ = event.pos
+                # Вычислить новую скорость
+                relative_x = mouse_x - self.slider_x
+                if relative_x < 0:
+                    new_speed = 1
+                elif relative_x > self.slider_width:
+                    new_speed = 10
+                else:
+                    new_speed = int(1 + (relative_x / self.slider_width) * 9)
+                if new_speed != self.current_speed:
+                    self.current_speed = new_speed
+                    self.ball.set_speed(
+                        self.current_speed, self.context.settings_manager
+                    )
+
+    def draw(self, screen: pygame.Surface) -> None:
+        font = self.context.font
 
         # Отрисовка оверлея
         pygame.draw.rect(screen, (100, 100, 100), (150, 100, 500, 400), 5)  # Рамка
         pygame.draw.rect(screen, (50, 50, 50), (150, 100, 500, 400))  # Фон
 
         # Заголовок
-        title = big_font.render("Настройки", True, (255, 255, 255))
+        title = self.context.big_font.render("Настройки", True, (255, 255, 255))
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
         screen.blit(title, title_rect)
 
         # Текст скорости
         speed_text = font.render(
-            f"Скорость мяча: {current_speed}", True, (255, 255, 255)
+            f"Скорость мяча: {self.current_speed}", True, (255, 255, 255)
         )
         speed_rect = speed_text.get_rect(center=(SCREEN_WIDTH // 2, 180))
         screen.blit(speed_text, speed_rect)
@@ -664,13 +656,19 @@ def show_settings_window(
         # Слайдер
         # Полоса
         pygame.draw.rect(
-            screen, (100, 100, 100), (slider_x, slider_y, slider_width, slider_height)
+            screen,
+            (100, 100, 100),
+            (self.slider_x, self.slider_y, self.slider_width, self.slider_height),
         )
         # Бегунок
-        knob_x = slider_x + (current_speed - 1) * (slider_width / 9)
-        knob_y = slider_y + slider_height // 2
-        pygame.draw.circle(screen, (255, 255, 255), (int(knob_x), knob_y), knob_radius)
-        pygame.draw.circle(screen, (0, 0, 0), (int(knob_x), knob_y), knob_radius, 2)
+        knob_x = self._knob_x()
+        knob_y = self.slider_y + self.slider_height // 2
+        pygame.draw.circle(
+            screen, (255, 255, 255), (int(knob_x), knob_y), self.knob_radius
+        )
+        pygame.draw.circle(
+            screen, (0, 0, 0), (int(knob_x), knob_y), self.knob_radius, 2
+        )
 
         # Подсказки
         render_colored_hint(
@@ -686,365 +684,623 @@ def show_settings_window(
             (SCREEN_WIDTH // 2 - 150, 380),
         )
 
-        pygame.display.flip()
-
-    return music_enabled
 
+def show_settings_window(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    big_font: pygame.font.Font,
+    settings_manager: SettingsManager,
+    ball: "BallPool",
+    music_enabled: bool,
+) -> bool:
+    """Отображает окно настроек с слайдером скорости мяча. Возвращает состояние музыки."""
+    context = GameContext(
+        font, big_font, settings_manager=settings_manager, music_enabled=music_enabled
+    )
+    SceneManager(screen, FPS).run(SettingsScene(context, ball))
+    return context.music_enabled
+
+
+class GameScene(Scene):
+    """Игровой экран: платформа, мячи, кубики, бонусы и уровни"""
+
+    def __init__(
+        self,
+        context: GameContext,
+        pilot: Optional[Union["Autopilot", "ReplayPilot"]] = None,
+        recording: Optional[Union["Replay", "ChunkedReplay"]] = None,
+        restart: bool = True,
+    ):
+        super().__init__()
+        self.context = context
+        # Автопилот (режим --autoplay) или запись партии управляет платформой
+        # вместо игрока
+        self.pilot = pilot
+        # Оконченная партия без игрока сразу начинается заново; иначе
+        # экран останавливается на итоговом состоянии (session.game_over)
+        # до явного reset() - так итог партии видят среда обучения и анализ уровней
+        self.restart = restart
+        self.recording: Optional[Union["Replay", "ChunkedReplay"]] = None
+        self.games_played = 0
+        self.last_score = 0  # Счет последней оконченной партии (без игрока)
+        self.last_cleared = False  # Последняя партия окончена прохождением уровней
+        # Партия игрока записывается для призрака; призрак лучшей партии
+        # читается с диска по кадрам (параметр --ghost)
+        self.ghost_recorder = GhostRecorder() if pilot is None else None
+        self.ghost: Optional[GhostReader] = None
+        self.ghost_frame = None
+        self.ghost_level = 0
+        # Звуки синтезируются при первом входе в игру, а не при запуске
+        if not context.sounds_loaded:
+            with STARTUP.phase("синтез звуков"):
+                load_sounds(context)
+        with STARTUP.phase("игровые модули и уровни"):
+            from session import GameSession
+
+            # Панель состояния перерисовывает текст только при изменениях
+            self.hud = Hud(context.font, context.hud_fields)
+            # Частицы выделяются один раз и переиспользуются
+            self.particles = effects.ParticlePool(rng=context.rng.numpy("effects"))
+            # Все состояние партии в одном объекте; уровни загружаются один раз
+            self.session = GameSession(context.level_pack, rng=context.rng)
+        self.reset()
+        # Ввод первой партии записывается сюда (параметр --record)
+        self.recording = recording
+
+    def reset(self) -> None:
+        """Начинает новую игру с первого уровня (объекты переиспользуются)"""
+        settings_manager = self.context.settings_manager
+        self.session.reset(
+            settings_manager.get_ball_speed() if settings_manager else None
+        )
+        self.particles.clear()
+        # Записывается только первая партия: ход следующих зависит
+        # от состояния генераторов после предыдущих
+        self.recording = None
+        if self.ghost_recorder is not None:
+            self.ghost_recorder.clear()
+        self.open_ghost()
+        if self.context.memory is not None:
+            self.context.memory.restart()
+
+    def open_ghost(self) -> None:
+        """Открывает запись призрака лучшего результата (с первого уровня)"""
+        if self.ghost is not None:
+            self.ghost.close()
+            self.ghost = None
+        highscore_manager = self.context.highscore_manager
+        if self.context.ghost and highscore_manager is not None:
+            path = highscore_manager.best_ghost_path()
+            if path is not None:
+                try:
+                    self.ghost = GhostReader(path)
+                    self.ghost.start_level(0)
+                except (OSError, ValueError) as e:
+                    print(f"Призрак не загружен: {e}")
+        self.ghost_frame = None
+        self.ghost_level = 0
+
+    def update_ghost(self) -> None:
+        """Кадр призрака и запись положения платформы и мяча игрока"""
+        session = self.session
+        if session.level_index != self.ghost_level:
+            # Новый уровень: призрак начинает этот уровень вместе с игроком
+            self.ghost_level = session.level_index
+            if self.ghost_recorder is not None:
+                self.ghost_recorder.next_level()
+            if self.ghost is not None:
+                self.ghost.start_level(self.ghost_level)
+        if self.ghost is not None:
+            self.ghost_frame = self.ghost.next_frame()
+        if self.ghost_recorder is not None:
+            paddle, balls = session.paddle.rect, session.balls
+            index = balls.primary()
+            if index >= 0:
+                self.ghost_recorder.record(
+                    paddle.x, paddle.width, balls.x[index], balls.y[index]
+                )
+
+    def enter(self) -> None:
+        # Запускаем музыку после ввода имени (если она включена)
+        if self.context.music_enabled:
+            try:
+                pygame.mixer.music.play(-1)  # Цикличное воспроизведение
+            except pygame.error:
+                print("Не удалось запустить фоновую музыку")
+        self.session.start_time = time.time()
+        # Движения мыши и нажатия на прошлых экранах не сдвигают платформу
+        self.manager.input.clear()
+
+    def exit(self) -> None:
+        # Файл призрака закрывается; партия, не попавшая в рекорды, не нужна
+        if self.ghost is not None:
+            self.ghost.close()
+            self.ghost = None
+        if self.ghost_recorder is not None:
+            self.ghost_recorder.clear()
+
+    def resume(self) -> None:
+        if self.session.game_over:
+            # Возврат с экрана результатов - новая игра
+            self.reset()
+        # Щелчки и нажатия в окне настроек или результатов не сдвигают платформу
+        self.manager.input.clear()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            # Выход из игры
+            self.manager.quit()
+        elif event.key == pygame.K_m:
+            # Переключение фоновой музыки
+            self.context.toggle_music()
+        elif event.key == pygame.K_UP:
+            # Увеличение скорости мяча
+            self.session.balls.increase_speed(self.context.settings_manager)
+        elif event.key == pygame.K_DOWN:
+            # Уменьшение скорости мяча
+            self.session.balls.decrease_speed(self.context.settings_manager)
+
+    def finish(self) -> None:
+        """Игра окончена: показываем результаты"""
+        session = self.session
+        if self.pilot is not None:
+            # Самостоятельная игра: результат не сохраняется
+            self.games_played += 1
+            self.last_score = session.score
+            self.last_cleared = not session.bricks
+            if self.restart:
+                self.reset()
+            else:
+                session.game_over = True
+            return
+        session.game_over = True
+        # Рассчитываем время игры и сохраняем результат
+        self.manager.push(
+            ResultsScene(
+                self.context,
+                session.score,
+                session.elapsed_seconds(),
+                session.balls,
+                self.ghost_recorder.to_bytes() if self.ghost_recorder else None,
+            )
+        )
 
-def reset_game(
-    paddle: Paddle,
-    ball: Ball,
-    bricks: List[pygame.Rect],
-    score: int,
-    lives_left: int,
-    game_over: bool,
-    game_started: bool,
-    ball_trail: list,
-    game_start_time: list,
-) -> tuple:
-    """Универсальная функция для сброса игры, устраняющая дублирование кода"""
-    # Создаем новые объекты
-    new_paddle = Paddle()
-    new_ball = Ball()
+    def update(self) -> None:
+        self.update_ghost()
+        session = self.session
+        paddle, balls, bricks = session.paddle, session.balls, session.bricks
+        if self.pilot is not None:
+            travel, direction = self.pilot.control(session)
+        else:
+            # Клавиатура и геймпад: сдвиг с учетом нажатий между кадрами;
+            # мышь и касание ставят платформу под указатель
+            controls = self.manager.input
+            travel, direction = controls.paddle(PADDLE_SPEED)
+            pointer_x = controls.take_pointer()
+            if pointer_x is not None:
+                travel = pointer_x - paddle.rect.centerx
+            click_x = controls.take_click()
+            if click_x is not None and not direction:
+                direction = -1 if click_x < paddle.rect.centerx else 1
+        if self.recording is not None:
+            if self.recording.keyframe_due():
+                # Опорный кадр для перемотки: состояние до ввода этого кадра
+                self.recording.add_keyframe(session)
+            self.recording.record(travel, direction, balls.get_speed())
+
+        if not session.game_started:
+            balls.hold(paddle.rect)
+            if direction:
+                session.game_started = True
+                balls.launch(direction)
+
+        self.particles.update()
+        if session.game_over:
+            return
+
+        paddle.shift(travel)
+
+        if not session.game_started:
+            return
+
+        balls.update()
+        if not balls.active[session.trail_ball]:
+            # Мяч со шлейфом потерян - шлейф переходит к другому мячу
+            session.trail_ball = balls.primary()
+            session.ball_trail.clear()
+        session.ball_trail.append(balls.rect(session.trail_ball).center)
+
+        # Отскок всех мячей от платформы
+        if balls.collide_paddle(paddle.rect):
+            if self.context.paddle_bounce_sound:
+                self.context.paddle_bounce_sound.play()
+
+        # Столкновения всех мячей с кубиками одной пакетной проверкой
+        brick_hit_sounds = self.context.brick_hit_sounds
+        for hit_index in balls.collide_bricks(bricks):
+            was_alive = bricks.alive[hit_index]
+            session.score += bricks.hit(hit_index)
+            if was_alive and not bricks.alive[hit_index]:
+                # Кубик разрушен: разлет осколков и, возможно, бонус
+                brick_center = bricks.rect(hit_index).center
+                self.particles.burst(brick_center, bricks.color[hit_index])
+                session.powerups.maybe_spawn(brick_center)
+            if brick_hit_sounds:
+                self.context.rng.audio.choice(brick_hit_sounds).play()
+
+        # Бонусы, пойманные платформой
+        paddle.tick()
+        for kind in session.powerups.update(paddle.rect, SCREEN_HEIGHT):
+            if kind == effects.POWERUP_MULTIBALL:
+                balls.split()
+            elif kind == effects.POWERUP_WIDE:
+                paddle.widen()
+            elif kind == effects.POWERUP_LIFE:
+                session.lives_left = min(session.lives_left + 1, MAX_LIVES)
+
+        # Мяч потерян, только если упали все мячи
+        balls.remove_lost(SCREEN_HEIGHT)
+        if not balls:
+            session.powerups.clear()
+            session.lives_left -= 1
+            if session.lives_left <= 0:
+                self.finish()
+                return
+            session.serve()
+
+        if not bricks and session.has_next_level():
+            # Уровень пройден - переходим к следующему;
+            # бонусы и осколки прошлого уровня не переходят на новый
+            session.next_level()
+            self.particles.clear()
+        elif not bricks:
+            self.finish()
+
+    def draw(self, screen: pygame.Surface) -> None:
+        context = self.context
+        sprite_cache = context.sprite_cache
+        session = self.session
+        paddle, balls, ball_trail = session.paddle, session.balls, session.ball_trail
 
-    # Устанавливаем скорость мяча из настроек
-    settings_manager = SettingsManager()
-    ball_speed = settings_manager.get_ball_speed()
-    new_ball.set_speed(ball_speed)
+        screen.fill((10, 10, 30))
+        draw_bricks(screen, session.bricks, sprite_cache.bricks)
+        session.powerups.draw(screen, sprite_cache)
+        self.particles.draw(screen, sprite_cache)
+        if self.ghost_frame is not None:
+            # Полупрозрачные платформа и мяч лучшей партии под настоящими
+            ghost_x, ghost_width, ghost_ball_x, ghost_ball_y = self.ghost_frame
+            screen.blit(
+                sprite_cache.ghost("paddle", ghost_width, paddle.rect.height),
+                (ghost_x, paddle.rect.y),
+            )
+            screen.blit(
+                sprite_cache.ghost("ball", balls.size, balls.size),
+                (ghost_ball_x, ghost_ball_y),
+            )
+        # Отрисовка платформы с цветными секциями для подсказки направления отскока
+        screen.blit(
+            sprite_cache.paddle(paddle.rect.width, paddle.rect.height), paddle.rect
+        )
+        # Отрисовка шлейфа мяча только когда игра начата
+        if session.game_started:
+            for i in range(len(ball_trail) - 1, -1, -1):
+                pos = ball_trail[i]
+                radius = BALL_SIZE // 2 * (i + 1) // len(ball_trail)
+                if radius > 0:
+                    fade = (len(ball_trail) - 1 - i) * 20
+                    color = (
+                        max(0, 230 - fade),
+                        max(0, 90 - fade // 2),
+                        max(0, 90 - fade // 2),
+                    )
+                    pygame.draw.circle(screen, color, pos, radius)
+        if context.assist and session.game_started:
+            draw_landing_marker(screen, session)
+        ball_sprite = sprite_cache.ball(balls.size, balls.size)
+        screen.blits([(ball_sprite, rect) for rect in balls.rects()], doreturn=False)
+        hud = self.hud
+        hud.draw(
+            screen,
+            session.level_index + 1,
+            session.score,
+            session.lives_left,
+            balls.get_speed(),
+            fps=self.manager.average_fps() if "fps" in hud.fields else 0.0,
+            elapsed=session.elapsed_seconds() if "time" in hud.fields else 0,
+            bricks_left=len(session.bricks),
+        )
 
-    new_ball.reset(new_paddle.rect)
-    new_ball.vel_y = 0
+        if not session.game_started:
+            draw_start_hint(screen, context.big_font)
 
-    new_bricks = build_bricks()
 
-    # Возвращаем сброшенные значения
-    return (
-        new_paddle,
-        new_ball,
-        new_bricks,
-        0,
-        MAX_LIVES,
-        False,
-        False,
-        [],
-        time.time(),
-    )
+def load_music() -> None:
+    """Загрузка фоновой музыки (запускается после ввода имени игрока)"""
+    try:
+        pygame.mixer.music.load(resource_path("sounds/Night_Prowler.ogg"))
+        pygame.mixer.music.set_volume(0.3)
+    except pygame.error:
+        print("Фоновая музыка не загружена")
 
 
-def main() -> None:
-    pygame.init()
-    pygame.mixer.init()  # Инициализация аудио микшера
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Арканоид")
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont("arial", 20)
-    big_font = pygame.font.SysFont("arial", 42, bold=True)
-
-    # Инициализация менеджеров
-    highscore_manager = HighScoreManager()
-    settings_manager = SettingsManager()
-
-    paddle = Paddle()
-    ball = Ball()
-    # Устанавливаем скорость из настроек
-    ball_speed = settings_manager.get_ball_speed()
-    ball.set_speed(ball_speed)
-    ball.reset(paddle.rect)
-    ball.vel_y = 0
-    bricks = build_bricks()
-
-    # Загрузка звуковых эффектов и генерация звуков удара по кубикам
+def load_sounds(context: GameContext) -> None:
+    """Генерация звука отскока и звуков удара по кубикам"""
+    context.sounds_loaded = True
     try:
         # Генерируем звук отскока от платформы
-        paddle_bounce_sound = generate_paddle_sound()
+        context.paddle_bounce_sound = generate_paddle_sound()
 
         # Генерируем разные тональные звуки для ударов по кубикам
-        brick_hit_sounds = [
+        context.brick_hit_sounds = [
             generate_tone_sound(440, 0.2),  # A4 - 440 Гц
             generate_tone_sound(523.25, 0.2),  # C5 - ~523 Гц
             generate_tone_sound(659.25, 0.2),  # E5 - ~659 Гц
         ]
-        # Пытаемся загрузить фоновую музыку (но не запускаем автоматически)
-        try:
-            pygame.mixer.music.load(resource_path("sounds/Night_Prowler.ogg"))
-            pygame.mixer.music.set_volume(0.3)
-            # Музыка будет запущена после ввода имени игрока
-        except pygame.error:
-            print("Фоновая музыка не загружена")
     except pygame.error as e:
         print(f"Звуковые эффекты не загружены: {e}")
-        paddle_bounce_sound = None
-        brick_hit_sounds = None
-
-    score = 0
-    lives_left = MAX_LIVES
-    game_over = False
-    game_started = False
-    ball_trail = []  # Список для хранения позиций мяча для шлейфа
-    running = True
-    exit_game = False
-    paused = False  # Флаг паузы для окна настроек
-
-    # Ввод имени игрока
-    player_name, music_enabled, exit_game = get_player_name(
-        screen, font, big_font, highscore_manager
-    )
-    if exit_game:
-        pygame.quit()
-        return
+        context.paddle_bounce_sound = None
+        context.brick_hit_sounds = None
 
-    # Запускаем музыку после ввода имени (если она включена)
-    if music_enabled:
-        try:
-            pygame.mixer.music.play(-1)  # Цикличное воспроизведение фоновой музыки
-        except pygame.error:
-            print("Не удалось запустить фоновую музыку")
-
-    # Отсчет времени игры
-    game_start_time = time.time()
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    # Выход из игры
-                    running = False
-                elif event.key == pygame.K_m:
-                    # Переключение фоновой музыки
-                    if music_enabled:
-                        pygame.mixer.music.stop()
-                        music_enabled = False
-                    else:
-                        pygame.mixer.music.play(-1)
-                        music_enabled = True
-                elif event.key == pygame.K_UP:
-                    # Увеличение скорости мяча
-                    ball.increase_speed(settings_manager)
-                elif event.key == pygame.K_DOWN:
-                    # Уменьшение скорости мяча
-                    ball.decrease_speed(settings_manager)
-
-        keys = pygame.key.get_pressed()
-
-        if not game_started:
-            ball.rect.center = paddle.rect.midtop
-            ball.rect.y -= BALL_SIZE
-            if keys[pygame.K_LEFT]:
-                game_started = True
-                ball.vel_x = -ball.get_speed()
-                ball.vel_y = -ball.get_speed()
-            elif keys[pygame.K_RIGHT]:
-                game_started = True
-                ball.vel_x = ball.get_speed()
-                ball.vel_y = -ball.get_speed()
-
-        # Обработка перезапуска после окончания игры
-        if game_over and keys[pygame.K_r]:
-            (
-                paddle,
-                ball,
-                bricks,
-                score,
-                lives_left,
-                game_over,
-                game_started,
-                ball_trail,
-                game_start_time,
-            ) = reset_game(
-                paddle,
-                ball,
-                bricks,
-                score,
-                lives_left,
-                game_over,
-                game_started,
-                ball_trail,
-                game_start_time,
-            )
 
-        if not game_over and not paused:
-            if keys[pygame.K_LEFT]:
-                paddle.move(-1)
-            if keys[pygame.K_RIGHT]:
-                paddle.move(1)
-
-            if game_started:
-                ball.update()
-                ball_trail.append(ball.rect.center)
-                if len(ball_trail) > 20:  # Увеличил длину шлейфа до 20 позиций
-                    ball_trail.pop(0)
-
-                if ball.rect.colliderect(paddle.rect) and ball.vel_y > 0:
-                    ball.bounce_vertical()
-                    offset = (ball.rect.centerx - paddle.rect.centerx) / (
-                        paddle.rect.width / 2
-                    )
-                    ball.vel_x = int(
-                        max(
-                            -ball.get_speed(),
-                            min(ball.get_speed(), ball.get_speed() * offset),
-                        )
-                    )
-                    # Play paddle bounce sound
-                    if paddle_bounce_sound:
-                        paddle_bounce_sound.play()
-
-                hit_index = ball.rect.collidelist(bricks)
-                if hit_index != -1:
-                    ball.bounce_vertical()
-                    bricks.pop(hit_index)
-                    score += 1
-                    # Play random brick hit sound
-                    if brick_hit_sounds:
-                        brick_hit_sounds[
-                            random.randint(0, len(brick_hit_sounds) - 1)
-                        ].play()
-
-                if ball.rect.bottom >= SCREEN_HEIGHT:
-                    lives_left -= 1
-                    if lives_left <= 0:
-                        game_over = True
-                        # Рассчитываем время игры и сохраняем результат
-                        game_time_seconds = int(time.time() - game_start_time)
-                        music_enabled, restart_game, exit_game = show_game_results(
-                            screen,
-                            font,
-                            big_font,
-                            score,
-                            player_name,
-                            game_time_seconds,
-                            highscore_manager,
-                            settings_manager,
-                            ball,
-                        )
-
-                        # Если игрок хочет выйти из игры
-                        if exit_game:
-                            pygame.quit()
-                            return
-
-                        # Если игрок хочет начать новую игру, перезапускаем
-                        if restart_game:
-                            (
-                                paddle,
-                                ball,
-                                bricks,
-                                score,
-                                lives_left,
-                                game_over,
-                                game_started,
-                                ball_trail,
-                                game_start_time,
-                            ) = reset_game(
-                                paddle,
-                                ball,
-                                bricks,
-                                score,
-                                lives_left,
-                                game_over,
-                                game_started,
-                                ball_trail,
-                                game_start_time,
-                            )
-                    else:
-                        ball.reset(paddle.rect)
-                        ball.vel_y = 0
-                        game_started = False
-
-                if not bricks:
-                    game_over = True
-                    # Рассчитываем время игры и сохраняем результат
-                    game_time_seconds = int(time.time() - game_start_time)
-                    music_enabled, restart_game, exit_game = show_game_results(
-                        screen,
-                        font,
-                        big_font,
-                        score,
-                        player_name,
-                        game_time_seconds,
-                        highscore_manager,
-                        settings_manager,
-                        ball,
-                    )
+def window_size(text: str) -> tuple:
+    """Размер окна из параметра --window в формате ШИРИНАxВЫСОТА"""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается ШИРИНАxВЫСОТА: {text}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"размер окна должен быть больше 0: {text}")
+    return width, height
+
+
+def hud_fields(text: str) -> Tuple[str, ...]:
+    """Дополнительные поля HUD из параметра --hud (через запятую)"""
+    fields = tuple(name.strip() for name in text.split(",") if name.strip())
+    unknown = [name for name in fields if name not in HUD_OPTIONAL_FIELDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"неизвестные поля: {', '.join(unknown)} "
+            f"(доступны: {', '.join(HUD_OPTIONAL_FIELDS)})"
+        )
+    return fields
 
-                    # Если игрок хочет выйти из игры
-                    if exit_game:
-                        pygame.quit()
-                        return
-
-                    # Если игрок хочет начать новую игру, перезапускаем
-                    if restart_game:
-                        (
-                            paddle,
-                            ball,
-                            bricks,
-                            score,
-                            lives_left,
-                            game_over,
-                            game_started,
-                            ball_trail,
-                            game_start_time,
-                        ) = reset_game(
-                            paddle,
-                            ball,
-                            bricks,
-                            score,
-                            lives_left,
-                            game_over,
-                            game_started,
-                            ball_trail,
-                            game_start_time,
-                        )
 
-        screen.fill((10, 10, 30))
-        draw_bricks(screen, bricks)
-        # Отрисовка платформы с цветными секциями для подсказки направления отскока
-        left_rect = pygame.Rect(
-            paddle.rect.x, paddle.rect.y, paddle.rect.width // 3, paddle.rect.height
-        )
-        pygame.draw.rect(screen, (255, 0, 0), left_rect)  # Красный для отскока влево
-        mid_rect = pygame.Rect(
-            paddle.rect.x + paddle.rect.width // 3,
-            paddle.rect.y,
-            paddle.rect.width // 3,
-            paddle.rect.height,
+def parse_args(argv=None) -> argparse.Namespace:
+    """Разбор параметров командной строки"""
+    parser = argparse.ArgumentParser(description="Арканоид")
+    parser.add_argument(
+        "--asset-stats",
+        action="store_true",
+        help="вывести время загрузки ресурсов при старте",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="вывести время этапов запуска (в формате python -X importtime)",
+    )
+    parser.add_argument(
+        "--autoplay",
+        action="store_true",
+        help="игра на автопилоте без ввода имени (долгий прогон)",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=1,
+        metavar="N",
+        help="количество партий в режиме --autoplay (по умолчанию 1)",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="без окна и звука, без ограничения частоты кадров",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="зерно генераторов случайных чисел (одинаковое зерно - одинаковая игра)",
+    )
+    parser.add_argument(
+        "--window",
+        type=window_size,
+        metavar="WxH",
+        help="размер окна, например 1920x1080 (игра масштабируется, см. --scale)",
+    )
+    parser.add_argument(
+        "--fullscreen",
+        action="store_true",
+        help="полноэкранный режим (по умолчанию в разрешении рабочего стола)",
+    )
+    parser.add_argument(
+        "--scale",
+        choices=SCALE_MODES,
+        help="масштабирование: scaled - средствами SDL (видеокарта), "
+        "integer - целое увеличение, smooth - сглаженное, none - без масштабирования "
+        "(по умолчанию smooth, если задан --window или --fullscreen)",
+    )
+    parser.add_argument(
+        "--pacing",
+        choices=FRAME_PACING_MODES,
+        help="темп кадров: tick - Clock.tick, busy - точный tick_busy_loop, "
+        "vsync - вертикальная синхронизация, uncapped - без ограничения "
+        "(по умолчанию из настроек, frame_pacing в settings.json)",
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="вывести среднее время кадра и его разброс (выбор режима --pacing)",
+    )
+    parser.add_argument(
+        "--hud",
+        type=hud_fields,
+        default=(),
+        metavar="FIELDS",
+        help="дополнительные поля панели через запятую: "
+        + ", ".join(HUD_OPTIONAL_FIELDS),
+    )
+    parser.add_argument(
+        "--assist",
+        action="store_true",
+        help="показывать, куда упадет мяч (подсказка точки падения)",
+    )
+    parser.add_argument(
+        "--ghost",
+        action="store_true",
+        help="показывать призрак лучшей партии из таблицы рекордов",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="записать ввод первой партии в файл (воспроизведение - export.py); "
+        "файл .zrec - сжатая запись с опорными кадрами для перемотки",
+    )
+    parser.add_argument(
+        "--input-latency",
+        action="store_true",
+        help="вывести задержку от получения события ввода до вывода кадра",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="снимки памяти (tracemalloc) при перезапусках и смене экранов",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        metavar="KB",
+        help="допустимый рост памяти между перезапусками; "
+        "при превышении прогон завершается с ошибкой (включает --trace-memory)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    memory = None
+    if args.trace_memory or args.memory_limit is not None:
+        from memtrace import MemoryTracker
+
+        limit = None if args.memory_limit is None else args.memory_limit * 1024
+        memory = MemoryTracker(limit)
+        memory.start()
+    if args.headless:
+        # Драйверы SDL выбираются при инициализации pygame
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    with STARTUP.phase("инициализация pygame"):
+        pygame.init()
+        pygame.mixer.init()  # Инициализация аудио микшера
+    with STARTUP.phase("создание окна"):
+        # Режим темпа кадров нужен до создания окна (vsync задается в set_mode)
+        settings_manager = SettingsManager()
+        pacing = args.pacing or settings_manager.get_frame_pacing()
+        if args.headless:
+            pacing = "uncapped"
+        scale = args.scale
+        if scale is None:
+            scale = "smooth" if args.window or args.fullscreen else "none"
+        display = Display(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), args.window, args.fullscreen, scale
         )
-        pygame.draw.rect(screen, (240, 240, 240), mid_rect)  # Белый для прямого отскока
-        right_rect = pygame.Rect(
-            paddle.rect.x + 2 * paddle.rect.width // 3,
-            paddle.rect.y,
-            paddle.rect.width - 2 * paddle.rect.width // 3,
-            paddle.rect.height,
+        screen = display.open(vsync=pacing == "vsync")
+        if pacing == "vsync" and not display.vsync:
+            print("Вертикальная синхронизация недоступна, используется режим busy")
+            pacing = "busy"
+        pygame.display.set_caption("Арканоид")
+    # Загружаем изображения один раз и сразу приводим к формату экрана
+    with STARTUP.phase("ресурсы"):
+        asset_manager = AssetManager(resource_path)
+        if asset_manager.preload(ASSET_MANIFEST):
+            pygame.display.set_icon(asset_manager.image("resources/icon.png"))
+        load_music()
+    if args.asset_stats:
+        print(asset_manager.format_stats())
+
+    # Общие ресурсы экранов: шрифты, менеджеры и спрайты
+    with STARTUP.phase("шрифты"):
+        fonts = default_font_registry()
+        font = fonts.get("arial", 20)
+        big_font = fonts.get("arial", 42, bold=True)
+    with STARTUP.phase("настройки и рекорды"):
+        context = GameContext(
+            font=font,
+            big_font=big_font,
+            highscore_manager=HighScoreManager(),
+            settings_manager=settings_manager,
+            fonts=fonts,
+            memory=memory,
+            rng=RandomStreams(args.seed),
+            hud_fields=args.hud,
+            assist=args.assist,
+            ghost=args.ghost,
         )
-        pygame.draw.rect(screen, (0, 0, 255), right_rect)  # Синий для отскока вправо
-        # Отрисовка шлейфа мяча только когда игра начата
-        if game_started:
-            for i in range(len(ball_trail) - 1, -1, -1):
-                pos = ball_trail[i]
-                radius = BALL_SIZE // 2 * (i + 1) // len(ball_trail)
-                if radius > 0:
-                    fade = (len(ball_trail) - 1 - i) * 20
-                    color = (
-                        max(0, 230 - fade),
-                        max(0, 90 - fade // 2),
-                        max(0, 90 - fade // 2),
-                    )
-                    pygame.draw.circle(screen, color, pos, radius)
-        pygame.draw.ellipse(screen, (230, 90, 90), ball.rect)
-        draw_hud(screen, score, lives_left, font, ball)
-
-        if not game_started:
-            draw_start_hint(screen, big_font)
-
-        # Экран окончания игры теперь обрабатывается в show_game_results()
 
-        pygame.display.flip()
-        clock.tick(FPS)
+    manager = SceneManager(screen, FPS, display, pacing)
+    if memory is not None:
+        manager.on_transition = memory.checkpoint
+    recording = None
+    if args.record:
+        from chunked_replay import CHUNKED_REPLAY_EXTENSION, ChunkedReplay
+        from replay import Replay
 
+        if args.record.endswith(CHUNKED_REPLAY_EXTENSION):
+            recording = ChunkedReplay(context.rng.seed)
+        else:
+            recording = Replay(context.rng.seed)
+    exit_code = 0
+    if args.autoplay:
+        from autopilot import Autopilot
+        from soak import run_soak
+
+        context.player_name = "Автопилот"
+        scene = GameScene(context, Autopilot(), recording)
+        report = run_soak(manager, scene, args.games)
+        report.seed = context.rng.seed
+        print(report.format())
+        exit_code = 1 if report.errors else 0
+    else:
+        # Игровой экран (уровни, NumPy, звуки) создается после ввода имени
+        manager.push(
+            NameInputScene(
+                context, next_scene=lambda: GameScene(context, recording=recording)
+            )
+        )
+        manager.running = True
+        manager.step()
+        STARTUP.mark_first_frame()
+        manager.run()
+    # Экраны освобождают ресурсы (файл призрака) и при выходе по Esc
+    manager.close()
+
+    if recording is not None:
+        recording.save(args.record)
+        print(f"Партия записана в {args.record} ({len(recording)} кадров)")
+    if args.startup_profile:
+        print(STARTUP.report())
+    if args.frame_stats:
+        average, deviation, worst = manager.frame_stats()
+        print(
+            f"Кадры ({manager.pacing}): {manager.average_fps():.1f} FPS, "
+            f"среднее {average:.2f} мс, отклонение {deviation:.2f} мс, "
+            f"худший {worst:.2f} мс"
+        )
+    if args.input_latency:
+        average, worst, count = manager.input.latency_stats()
+        print(
+            f"Задержка ввода: средняя {average:.1f} мс, "
+            f"максимальная {worst:.1f} мс ({count} событий)"
+        )
+    if memory is not None:
+        print(memory.report())
+        if memory.exceeded():
+            exit_code = 1
+        memory.stop()
+    fonts.clear()
     pygame.quit()
+    return exit_code
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
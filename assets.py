@@ -0,0 +1,98 @@
+"""
+Менеджер ресурсов игры Арканоид
+Загружает изображения один раз, приводит их к формату экрана
+(convert/convert_alpha) и хранит в кэше по пути
+"""
+
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pygame
+
+
+class AssetManager:
+    """
+    Центральный загрузчик изображений.
+    Поверхности, загруженные до создания окна, приводятся к формату экрана
+    позже вызовом convert_pending().
+    """
+
+    def __init__(self, path_resolver: Optional[Callable[[str], str]] = None):
+        self._resolve = path_resolver or os.path.abspath
+        self._images: Dict[str, pygame.Surface] = {}
+        self._pending: List[str] = []  # Поверхности, ещё не приведённые к формату экрана
+        self.load_times: Dict[str, float] = {}  # Время загрузки каждого ресурса, мс
+
+    @staticmethod
+    def _display_ready() -> bool:
+        """Проверяет, создано ли окно (без него convert() недоступен)"""
+        return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+    @staticmethod
+    def _convert(surface: pygame.Surface) -> pygame.Surface:
+        """Приводит поверхность к формату экрана, сохраняя прозрачность"""
+        if surface.get_flags() & pygame.SRCALPHA or surface.get_alpha() is not None:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def image(self, relative_path: str) -> pygame.Surface:
+        """Возвращает изображение из кэша, при первом обращении загружает его"""
+        surface = self._images.get(relative_path)
+        if surface is not None:
+            return surface
+
+        start = time.perf_counter()
+        surface = pygame.image.load(self._resolve(relative_path))
+        if self._display_ready():
+            surface = self._convert(surface)
+        else:
+            self._pending.append(relative_path)
+        self.load_times[relative_path] = (time.perf_counter() - start) * 1000
+        self._images[relative_path] = surface
+        return surface
+
+    def convert_pending(self) -> int:
+        """Приводит к формату экрана изображения, загруженные до создания окна"""
+        if not self._display_ready():
+            return 0
+        converted = 0
+        for relative_path in self._pending:
+            self._images[relative_path] = self._convert(self._images[relative_path])
+            converted += 1
+        self._pending.clear()
+        return converted
+
+    def preload(self, manifest: Iterable[str]) -> Dict[str, float]:
+        """
+        Загружает все ресурсы из списка при старте игры.
+        Возвращает время загрузки каждого ресурса в миллисекундах;
+        ресурсы, которые не удалось загрузить, пропускаются.
+        """
+        stats = {}
+        for relative_path in manifest:
+            try:
+                self.image(relative_path)
+            except (pygame.error, FileNotFoundError):
+                print(f"Ресурс не загружен: {relative_path}")
+                continue
+            stats[relative_path] = self.load_times[relative_path]
+        return stats
+
+    def format_stats(self) -> str:
+        """Возвращает сводку по времени загрузки ресурсов"""
+        lines = [
+            f"{path}: {elapsed:.2f} мс"
+            for path, elapsed in sorted(
+                self.load_times.items(), key=lambda item: -item[1]
+            )
+        ]
+        total = sum(self.load_times.values())
+        lines.append(f"Всего: {len(self.load_times)} ресурсов, {total:.2f} мс")
+        return "\n".join(lines)
+
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self._images
+
+    def __len__(self) -> int:
+        return len(self._images)
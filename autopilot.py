@@ -0,0 +1,92 @@
+"""
+Автопилот игры Арканоид
+Ведет платформу к точке, где мяч долетит до линии платформы.
+Используется режимом самостоятельной игры (--autoplay) для долгих прогонов.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from config import PADDLE_SPEED, SCREEN_WIDTH
+from trajectory import predict_landing
+
+
+# Точка удара по платформе (доля полуширины от центра, знак + - в сторону
+# кубиков). Если за подлет мяча не разбит ни один кубик, берется следующая,
+# чтобы мяч не ходил по одной и той же траектории
+AIM_OFFSETS = (0.5, -0.5, 0.3, 0.8, -0.3, -0.8)
+
+
+class Autopilot:
+    """
+    Управление платформой без игрока.
+    steer() возвращает направление движения платформы (-1, 0, 1), как если бы
+    игрок держал стрелку; до начала игры то же направление запускает мяч.
+    control() - то же в виде (сдвиг платформы, направление) для GameScene.
+    """
+
+    def __init__(self):
+        self.serve_direction = 1  # Направление запуска мяча, чередуется
+        self.aim_index = 0
+        self._frames_left = 0  # Кадров до линии платформы на прошлом кадре
+        self._bricks_left = -1  # Кубиков на начало прошлого подлета мяча
+
+    def landing(self, session) -> Optional[Tuple[int, float]]:
+        """(кадров, x центра) для мяча, который раньше всех долетит до платформы"""
+        balls, paddle = session.balls, session.paddle
+        best = None
+        for index in balls.indices().tolist():
+            landing = predict_landing(
+                int(balls.x[index]),
+                int(balls.y[index]),
+                int(balls.vel_x[index]),
+                int(balls.vel_y[index]),
+                balls.size,
+                paddle.rect.top,
+            )
+            if landing is not None and (best is None or landing[0] < best[0]):
+                best = landing
+        return best
+
+    def control(self, session) -> Tuple[int, int]:
+        """(сдвиг платформы, направление) на этот кадр - как у ReplayPilot"""
+        direction = self.steer(session)
+        return direction * PADDLE_SPEED, direction
+
+    def steer(self, session) -> int:
+        """Направление платформы на этот кадр"""
+        paddle = session.paddle
+        if not session.game_started:
+            self.serve_direction = -self.serve_direction
+            return self.serve_direction
+
+        landing = self.landing(session)
+        if landing is None:
+            return 0
+        frames, landing_x = landing
+        if frames > self._frames_left:
+            # Начался новый подлет мяча: меняем точку удара, если прошлый
+            # отскок не разбил ни одного кубика
+            bricks_left = len(session.bricks)
+            if bricks_left == self._bricks_left:
+                self.aim_index += 1
+            self._bricks_left = bricks_left
+        self._frames_left = frames
+
+        # Мяч отражается от платформы тем круче, чем дальше от ее центра удар:
+        # подставляем нужную точку платформы, чтобы мяч полетел к кубикам
+        bricks = session.bricks
+        breakable = bricks.alive & ~bricks.indestructible
+        if breakable.any():
+            bricks_x = float(np.mean(bricks.x[breakable] + bricks.width[breakable] / 2))
+        else:
+            bricks_x = SCREEN_WIDTH / 2
+        side = 1 if bricks_x < landing_x else -1
+        aim = AIM_OFFSETS[self.aim_index % len(AIM_OFFSETS)]
+        goal = landing_x + side * aim * paddle.rect.width / 2
+
+        offset = goal - paddle.rect.centerx
+        if abs(offset) <= PADDLE_SPEED / 2:
+            return 0
+        return 1 if offset > 0 else -1
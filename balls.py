@@ -0,0 +1,276 @@
+"""
+Пул мячей игры Арканоид
+Все мячи хранятся в массивах NumPy и обновляются одной векторной операцией,
+что позволяет держать на экране сотни мячей (бонус «мультимяч»)
+"""
+
+import random
+from typing import Dict, List, Optional
+
+import numpy as np
+import pygame
+
+from config import BALL_SIZE, BALL_SPEED_DEFAULT, MAX_BALLS, SCREEN_WIDTH
+from settings import SettingsManager
+
+BALL_STATE_FIELDS = ("x", "y", "vel_x", "vel_y", "active")
+
+
+class BallPool:
+    """
+    Набор мячей одинакового размера.
+    Мяч i описывается элементами x[i], y[i] (левый верхний угол) и vel_x[i], vel_y[i];
+    свободные ячейки помечены в массиве active.
+    Методы управления скоростью совпадают с классом Ball.
+    """
+
+    def __init__(
+        self,
+        capacity: int = MAX_BALLS,
+        size: int = BALL_SIZE,
+        rng: Optional[random.Random] = None,
+    ):
+        self.size = size
+        # Генератор направления подачи (RandomStreams.physics в игре)
+        self.rng = random.Random() if rng is None else rng
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.vel_x = np.zeros(capacity, dtype=np.int32)
+        self.vel_y = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.current_speed = BALL_SPEED_DEFAULT
+
+    @property
+    def capacity(self) -> int:
+        return len(self.x)
+
+    def __len__(self) -> int:
+        """Количество мячей в игре"""
+        return int(np.count_nonzero(self.active))
+
+    def indices(self) -> np.ndarray:
+        """Индексы мячей в игре"""
+        return np.flatnonzero(self.active)
+
+    def primary(self) -> int:
+        """Индекс основного (первого) мяча или -1, если мячей нет"""
+        index = int(np.argmax(self.active))
+        return index if self.active[index] else -1
+
+    def rect(self, index: int) -> pygame.Rect:
+        """Прямоугольник мяча"""
+        return pygame.Rect(int(self.x[index]), int(self.y[index]), self.size, self.size)
+
+    def rects(self) -> List[pygame.Rect]:
+        """Прямоугольники всех мячей в игре"""
+        return [
+            pygame.Rect(x, y, self.size, self.size)
+            for x, y in zip(self.x[self.active].tolist(), self.y[self.active].tolist())
+        ]
+
+    def spawn(self, x: int, y: int, vel_x: int, vel_y: int) -> int:
+        """Добавляет мяч в свободную ячейку. Возвращает индекс или -1, если пул заполнен"""
+        index = int(np.argmin(self.active))
+        if self.active[index]:
+            return -1
+        self.x[index] = x
+        self.y[index] = y
+        self.vel_x[index] = vel_x
+        self.vel_y[index] = vel_y
+        self.active[index] = True
+        return index
+
+    def copy(self) -> "BallPool":
+        """Независимая копия пула"""
+        clone = BallPool(self.capacity, self.size, random.Random())
+        clone.copy_from(self)
+        return clone
+
+    def copy_from(self, other: "BallPool") -> None:
+        """Переносит мячи other в этот пул (той же емкости) без выделения памяти"""
+        for name in ("x", "y", "vel_x", "vel_y", "active"):
+            np.copyto(getattr(self, name), getattr(other, name))
+        self.current_speed = other.current_speed
+        self.rng.setstate(other.rng.getstate())
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        """Мячи и скорость массивами (опорный кадр записи, без генератора)"""
+        state = {name: getattr(self, name).copy() for name in BALL_STATE_FIELDS}
+        state["speed"] = np.array([self.current_speed], dtype=np.int32)
+        return state
+
+    def restore_arrays(self, state: Dict[str, np.ndarray]) -> None:
+        """Восстанавливает мячи из state_arrays() на месте"""
+        for name in BALL_STATE_FIELDS:
+            np.copyto(getattr(self, name), state[name])
+        self.current_speed = int(state["speed"][0])
+
+    def clear(self) -> None:
+        """Убирает все мячи"""
+        self.active[:] = False
+
+    def reset(self, paddle_rect: pygame.Rect) -> None:
+        """Оставляет один мяч на платформе с текущей скоростью (как Ball.reset)"""
+        self.clear()
+        self.spawn(
+            0,
+            0,
+            self.rng.choice([-self.current_speed, self.current_speed]),
+            -self.current_speed,
+        )
+        self.hold(paddle_rect)
+
+    def serve(self, paddle_rect: pygame.Rect) -> None:
+        """Оставляет один мяч на платформе в ожидании запуска (как Ball.serve)"""
+        self.reset(paddle_rect)
+        self.vel_y[self.primary()] = 0
+
+    def hold(self, paddle_rect: pygame.Rect) -> None:
+        """Держит основной мяч над центром платформы до начала игры"""
+        index = self.primary()
+        if index != -1:
+            rect = self.rect(index)
+            rect.center = paddle_rect.midtop
+            self.x[index] = rect.x
+            self.y[index] = rect.y - self.size
+
+    def launch(self, direction: int) -> None:
+        """Запускает основной мяч вверх: direction = -1 (влево) / 1 (вправо)"""
+        index = self.primary()
+        if index != -1:
+            self.vel_x[index] = direction * self.current_speed
+            self.vel_y[index] = -self.current_speed
+
+    def split(self, copies: int = 2) -> int:
+        """
+        Бонус «мультимяч»: каждый мяч порождает copies новых мячей,
+        летящих вверх попеременно влево и вправо. Возвращает число новых мячей.
+        """
+        spawned = 0
+        for parent in self.indices():
+            for i in range(copies):
+                direction = -1 if i % 2 == 0 else 1
+                index = self.spawn(
+                    int(self.x[parent]),
+                    int(self.y[parent]),
+                    direction * self.current_speed,
+                    -self.current_speed,
+                )
+                if index == -1:
+                    return spawned
+                spawned += 1
+        return spawned
+
+    def update(self) -> None:
+        """Перемещает все мячи и отражает их от стен (как Ball.update)"""
+        active = self.active
+        self.x[active] += self.vel_x[active]
+        self.y[active] += self.vel_y[active]
+
+        # Скорость направляется от стены, чтобы мяч не застревал в ней
+        hit_left = active & (self.x <= 0)
+        self.vel_x[hit_left] = np.abs(self.vel_x[hit_left])
+        hit_right = active & (self.x + self.size >= SCREEN_WIDTH)
+        self.vel_x[hit_right] = -np.abs(self.vel_x[hit_right])
+        hit_top = active & (self.y <= 0)
+        self.vel_y[hit_top] = np.abs(self.vel_y[hit_top])
+
+    def collide_paddle(self, paddle_rect: pygame.Rect) -> int:
+        """
+        Отражает от платформы все падающие на нее мячи.
+        Горизонтальная скорость зависит от точки удара, как в одиночной игре.
+        Возвращает количество отскочивших мячей.
+        """
+        hit = (
+            self.active
+            & (self.vel_y > 0)
+            & (self.x < paddle_rect.right)
+            & (self.x + self.size > paddle_rect.left)
+            & (self.y < paddle_rect.bottom)
+            & (self.y + self.size > paddle_rect.top)
+        )
+        if not hit.any():
+            return 0
+
+        speed = self.current_speed
+        self.vel_y[hit] *= -1
+        center_x = self.x[hit] + self.size // 2
+        offset = (center_x - paddle_rect.centerx) / (paddle_rect.width / 2)
+        self.vel_x[hit] = np.trunc(np.clip(speed * offset, -speed, speed))
+        return int(np.count_nonzero(hit))
+
+    def collide_bricks(self, bricks) -> List[int]:
+        """
+        Проверяет столкновения всех мячей с кубиками через индекс кубиков.
+        Мяч отражается по оси меньшего перекрытия с кубиком и выталкивается
+        из него, поэтому одно касание - один удар даже для прочных кубиков и стен.
+        Возвращает индексы задетых кубиков (по одному на отскочивший мяч).
+        """
+        balls = self.indices()
+        if not len(balls) or not bricks.capacity:
+            return []
+
+        hits = bricks.collide_boxes(self.x[balls], self.y[balls], self.size, self.size)
+        hit = hits != -1
+        balls, hits = balls[hit], hits[hit]
+        if not len(balls):
+            return []
+
+        size = self.size
+        x, y = self.x[balls], self.y[balls]
+        left, top = bricks.x[hits], bricks.y[hits]
+        right, bottom = left + bricks.width[hits], top + bricks.height[hits]
+        overlap_x = np.minimum(x + size, right) - np.maximum(x, left)
+        overlap_y = np.minimum(y + size, bottom) - np.maximum(y, top)
+        # Центр мяча левее/выше центра кубика - выталкиваем влево/вверх
+        before_x = 2 * x + size < left + right
+        before_y = 2 * y + size < top + bottom
+
+        side = overlap_x < overlap_y
+        side_balls, vertical_balls = balls[side], balls[~side]
+        self.x[side_balls] = np.where(before_x[side], left[side] - size, right[side])
+        speed_x = np.abs(self.vel_x[side_balls])
+        self.vel_x[side_balls] = np.where(before_x[side], -speed_x, speed_x)
+
+        vertical = ~side
+        self.y[vertical_balls] = np.where(
+            before_y[vertical], top[vertical] - size, bottom[vertical]
+        )
+        speed_y = np.abs(self.vel_y[vertical_balls])
+        self.vel_y[vertical_balls] = np.where(before_y[vertical], -speed_y, speed_y)
+        return hits.tolist()
+
+    def remove_lost(self, bottom: int) -> int:
+        """Убирает мячи, упавшие ниже линии bottom. Возвращает их количество"""
+        lost = self.active & (self.y + self.size >= bottom)
+        self.active[lost] = False
+        return int(np.count_nonzero(lost))
+
+    def set_speed(self, speed: int, settings_manager: SettingsManager = None) -> None:
+        """Устанавливает скорость всех мячей и обновляет настройки"""
+        if 1 <= speed <= 10:
+            old_speed = self.current_speed
+            self.current_speed = speed
+            if old_speed != 0:
+                self.vel_x[:] = np.trunc(self.vel_x * speed / old_speed)
+                self.vel_y[:] = np.trunc(self.vel_y * speed / old_speed)
+            else:
+                self.vel_x[:] = speed
+                self.vel_y[:] = -speed
+
+            if settings_manager:
+                settings_manager.set_ball_speed(speed)
+
+    def increase_speed(self, settings_manager: SettingsManager = None) -> None:
+        """Увеличивает скорость на 1 (максимум 10)"""
+        if self.current_speed < 10:
+            self.set_speed(self.current_speed + 1, settings_manager)
+
+    def decrease_speed(self, settings_manager: SettingsManager = None) -> None:
+        """Уменьшает скорость на 1 (минимум 1)"""
+        if self.current_speed > 1:
+            self.set_speed(self.current_speed - 1, settings_manager)
+
+    def get_speed(self) -> int:
+        """Возвращает текущую скорость мячей"""
+        return self.current_speed
@@ -0,0 +1,106 @@
+"""
+Замер отрисовки кубиков игры Арканоид
+Сравнивает прежнюю отрисовку (два вызова pygame.draw.rect на кубик)
+с атласом спрайтов BrickAtlas и одним вызовом Surface.blits()
+на 50, 500 и 5000 кубиках:
+
+    python benchmarks/bench_bricks.py [--frames N]
+
+Для атласа замеряются два случая: кубики не менялись (список отрисовки
+из кэша) и кубик разбит в каждом кадре (список собирается заново).
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from bricks import (
+    BRICK_BORDER_COLOR,
+    BRICK_COLORS,
+    BRICK_NORMAL,
+    BRICK_STRONG,
+    BrickStore,
+)
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from sprites import BrickAtlas
+
+BRICK_COUNTS = (50, 500, 5000)
+PADDING = 2
+
+
+def make_bricks(count: int) -> BrickStore:
+    """count кубиков сеткой на весь экран, цвета палитры по очереди"""
+    cols = math.ceil(math.sqrt(count * SCREEN_WIDTH / SCREEN_HEIGHT))
+    rows = math.ceil(count / cols)
+    cells = range(count)
+    bricks = BrickStore.grid(
+        [cell % cols for cell in cells],
+        [cell // cols for cell in cells],
+        # Каждый третий кубик прочный: после удара появляются темные оттенки
+        [BRICK_STRONG if cell % 3 == 0 else BRICK_NORMAL for cell in cells],
+        [cell % len(BRICK_COLORS) for cell in cells],
+        origin=(0, 0),
+        brick_size=(SCREEN_WIDTH // cols - PADDING, SCREEN_HEIGHT // rows - PADDING),
+        padding=PADDING,
+    )
+    for index in range(0, count, 6):
+        bricks.hit(index)  # Поврежденные кубики - отдельные спрайты атласа
+    return bricks
+
+
+def draw_rects(screen: pygame.Surface, bricks: BrickStore) -> None:
+    """Прежняя отрисовка: заливка и рамка каждого кубика"""
+    for brick, color in bricks:
+        pygame.draw.rect(screen, color, brick)
+        pygame.draw.rect(screen, BRICK_BORDER_COLOR, brick, 2)
+
+
+def measure(draw, frames: int) -> float:
+    """Среднее время кадра draw(), мс"""
+    draw()  # Прогрев: атлас и кэши заполняются до замера
+    started = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return 1000 * (time.perf_counter() - started) / frames
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Замер отрисовки кубиков")
+    parser.add_argument("--frames", type=int, default=200, metavar="N")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    header = [f"{'кубиков':>8}"]
+    header += [f"{column:>10}" for column in ("draw.rect", "blits", "blits*")]
+    print(" | ".join(header + ["ускорение"]))
+    for count in BRICK_COUNTS:
+        bricks = make_bricks(count)
+        atlas = BrickAtlas()
+
+        def draw_changed():
+            bricks.version += 1  # Как после удара: список собирается заново
+            atlas.draw(screen, bricks)
+
+        rects = measure(lambda: draw_rects(screen, bricks), args.frames)
+        cached = measure(lambda: atlas.draw(screen, bricks), args.frames)
+        changed = measure(draw_changed, args.frames)
+        print(
+            f"{count:>8} | {rects:>7.3f} мс | {cached:>7.3f} мс | "
+            f"{changed:>7.3f} мс | {rects / cached:.1f}x"
+        )
+    print("blits* - кубики меняются в каждом кадре (список отрисовки пересобирается)")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Замер предсказания точки падения мяча игры Арканоид
+Сравнивает покадровое повторение движения мяча (step_landing)
+с аналитическим расчетом (predict_landing) и расчетом с проверкой
+кубиков по индексу (predict_landing(..., bricks=...)):
+
+    python benchmarks/bench_predictor.py [--calls N]
+
+Время вызова сравнивается с бюджетом кадра при 60 кадрах/с
+и пересчитывается на наибольшее число мячей (MAX_BALLS).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BALL_SIZE, FPS, MAX_BALLS, SCREEN_HEIGHT, SCREEN_WIDTH
+from levels import default_level_pack
+from trajectory import predict_landing, step_landing
+
+LINE_Y = SCREEN_HEIGHT - 60  # Верх платформы
+
+
+def make_states(count: int, seed: int = 1) -> list:
+    """Положения и скорости мячей под кубиками, половина летит вверх"""
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        vel_x = rng.choice((-1, 1)) * rng.randint(1, 10)
+        vel_y = rng.choice((-1, 1)) * rng.randint(3, 10)
+        x = rng.randint(0, SCREEN_WIDTH - BALL_SIZE)
+        y = rng.randint(250, LINE_Y - BALL_SIZE)
+        states.append((x, y, vel_x, vel_y, BALL_SIZE, LINE_Y))
+    return states
+
+
+def measure(predict, states) -> float:
+    """Среднее время вызова, мкс"""
+    for state in states[:100]:
+        predict(*state)  # Прогрев (индекс кубиков строится при первом вызове)
+    started = time.perf_counter()
+    for state in states:
+        predict(*state)
+    return 1e6 * (time.perf_counter() - started) / len(states)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Замер предсказания точки падения")
+    parser.add_argument("--calls", type=int, default=5000, metavar="N")
+    args = parser.parse_args(argv)
+
+    states = make_states(args.calls)
+    bricks = default_level_pack().build(0)
+    budget = 1e6 / FPS
+    results = (
+        ("покадрово", measure(step_landing, states)),
+        ("аналитически", measure(predict_landing, states)),
+        (
+            "с кубиками",
+            measure(lambda *state: predict_landing(*state, bricks=bricks), states),
+        ),
+    )
+    print(f"{'способ':>14} | {'вызов':>10} | доля кадра")
+    for name, micros in results:
+        print(f"{name:>14} | {micros:>6.1f} мкс | {100 * micros / budget:.3f}%")
+    print(f"ускорение без кубиков: {results[0][1] / results[1][1]:.0f}x")
+    # Автопилот предсказывает падение каждого мяча в каждом кадре
+    print(
+        f"{MAX_BALLS} мячей за кадр: {MAX_BALLS * results[1][1] / 1000:.2f} мс "
+        f"(покадрово {MAX_BALLS * results[0][1] / 1000:.2f} мс)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
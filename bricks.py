@@ -0,0 +1,286 @@
+"""
+Хранилище кубиков игры Арканоид
+Кубики хранятся не списком pygame.Rect, а набором массивов NumPy
+(структура массивов): координаты, тип, прочность, очки, цвет, признак «жив»
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pygame
+
+# Палитра цветов кубиков: буква в файле уровня -> RGB
+BRICK_PALETTE = {
+    "r": (200, 80, 80),
+    "o": (200, 160, 80),
+    "g": (80, 200, 120),
+    "b": (80, 140, 220),
+    "p": (150, 80, 220),
+}
+BRICK_COLOR_KEYS = tuple(BRICK_PALETTE)
+BRICK_COLORS = tuple(BRICK_PALETTE.values())
+
+# Цвет рамки кубика
+BRICK_BORDER_COLOR = (30, 30, 30)
+
+# Во сколько раз темнеет кубик после удара, который его не разрушил
+DAMAGE_SHADE = 0.75
+
+
+@dataclass(frozen=True)
+class BrickType:
+    """Тип кубика: прочность, очки за разрушение и цвет"""
+
+    name: str
+    hp: int
+    score: int
+    indestructible: bool = False
+    color: Optional[Tuple[int, int, int]] = None  # None - цвет из палитры уровня
+
+
+# Типы кубиков; индекс в кортеже - код типа в файле уровня
+BRICK_TYPES = (
+    BrickType("normal", hp=1, score=1),
+    BrickType("strong", hp=2, score=2),
+    BrickType("armored", hp=3, score=3),
+    BrickType("wall", hp=1, score=0, indestructible=True, color=(120, 120, 130)),
+)
+BRICK_NORMAL, BRICK_STRONG, BRICK_ARMORED, BRICK_WALL = range(len(BRICK_TYPES))
+
+# Таблицы типов в виде массивов, чтобы заполнять свойства кубиков одной операцией
+TYPE_HP = np.array([t.hp for t in BRICK_TYPES], dtype=np.uint8)
+TYPE_SCORE = np.array([t.score for t in BRICK_TYPES], dtype=np.uint16)
+TYPE_INDESTRUCTIBLE = np.array([t.indestructible for t in BRICK_TYPES], dtype=bool)
+TYPE_HAS_COLOR = np.array([t.color is not None for t in BRICK_TYPES], dtype=bool)
+TYPE_COLOR = np.array([t.color or (0, 0, 0) for t in BRICK_TYPES], dtype=np.uint8)
+PALETTE_RGB = np.array(BRICK_COLORS, dtype=np.uint8)
+
+
+class BrickStore:
+    """
+    Набор кубиков уровня.
+    Кубик i описывается элементами x[i], y[i], width[i], height[i], kind[i],
+    hp[i], score[i], indestructible[i], color[i]; разрушенные кубики не удаляются,
+    а помечаются в массиве alive, поэтому индексы стабильны в течение уровня.
+    """
+
+    def __init__(self, x, y, width, height, kind, color):
+        self.x = np.asarray(x, dtype=np.int32)
+        self.y = np.asarray(y, dtype=np.int32)
+        self.width = np.asarray(width, dtype=np.int32)
+        self.height = np.asarray(height, dtype=np.int32)
+        self.kind = np.asarray(kind, dtype=np.uint8)  # Индекс в BRICK_TYPES
+
+        # Свойства кубиков берутся из таблиц типов
+        self.hp = TYPE_HP[self.kind]
+        self.score = TYPE_SCORE[self.kind]
+        self.indestructible = TYPE_INDESTRUCTIBLE[self.kind]
+        self.color = np.where(
+            TYPE_HAS_COLOR[self.kind][:, None],
+            TYPE_COLOR[self.kind],
+            PALETTE_RGB[np.asarray(color, dtype=np.intp)],
+        ).astype(np.uint8)
+
+        self.alive = np.ones(len(self.x), dtype=bool)
+        # Номер версии: растет при каждом изменении прочности, цвета или alive
+        # (по нему пересобирается список отрисовки кубиков)
+        self.version = 0
+        self._index = None  # Карта кубиков по пикселям, строится при первом запросе
+        # Уровень пройден, когда не осталось разрушаемых кубиков
+        self._alive_count = int(np.count_nonzero(~self.indestructible))
+
+    @classmethod
+    def grid(
+        cls,
+        cols,
+        rows,
+        kind,
+        color,
+        origin: Tuple[int, int],
+        brick_size: Tuple[int, int],
+        padding: int,
+    ) -> "BrickStore":
+        """Создает кубики по координатам клеток сетки (столбец, ряд)"""
+        brick_width, brick_height = brick_size
+        cols = np.asarray(cols, dtype=np.int32)
+        rows = np.asarray(rows, dtype=np.int32)
+        x = origin[0] + cols * (brick_width + padding)
+        y = origin[1] + rows * (brick_height + padding)
+        return cls(
+            x,
+            y,
+            np.full(len(x), brick_width),
+            np.full(len(y), brick_height),
+            kind,
+            color,
+        )
+
+    def copy(self) -> "BrickStore":
+        """
+        Копия кубиков. Координаты, типы и индекс после создания не меняются
+        и остаются общими; копируется только состояние (прочность, цвет, alive).
+        """
+        clone = object.__new__(type(self))
+        clone.copy_from(self)
+        return clone
+
+    def copy_from(self, other: "BrickStore") -> None:
+        """Переносит кубики other на место этого хранилища"""
+        previous_version = getattr(self, "version", 0)
+        if getattr(self, "x", None) is other.x:
+            # Тот же уровень: состояние копируется без выделения памяти
+            np.copyto(self.hp, other.hp)
+            np.copyto(self.color, other.color)
+            np.copyto(self.alive, other.alive)
+        else:
+            self.__dict__.update(other.__dict__)
+            self.hp = other.hp.copy()
+            self.color = other.color.copy()
+            self.alive = other.alive.copy()
+        self._alive_count = other._alive_count
+        self.version = max(previous_version, other.version) + 1
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        """Прочность, цвет и alive (опорный кадр записи)"""
+        return {
+            "hp": self.hp.copy(),
+            "color": self.color.copy(),
+            "alive": self.alive.copy(),
+        }
+
+    def restore_arrays(self, state: Dict[str, np.ndarray]) -> None:
+        """Восстанавливает state_arrays() кубиков того же уровня на месте"""
+        np.copyto(self.hp, state["hp"])
+        np.copyto(self.color, state["color"])
+        np.copyto(self.alive, state["alive"])
+        self._alive_count = int(np.count_nonzero(self.alive & ~self.indestructible))
+        self.version += 1
+
+    def __len__(self) -> int:
+        """Количество оставшихся разрушаемых кубиков"""
+        return self._alive_count
+
+    @property
+    def capacity(self) -> int:
+        """Общее количество кубиков уровня, включая разрушенные"""
+        return len(self.x)
+
+    def rect(self, index: int) -> pygame.Rect:
+        """Возвращает прямоугольник кубика"""
+        return pygame.Rect(
+            int(self.x[index]),
+            int(self.y[index]),
+            int(self.width[index]),
+            int(self.height[index]),
+        )
+
+    def collide(self, rect: pygame.Rect) -> int:
+        """
+        Возвращает индекс первого живого кубика, пересекающегося с rect, или -1.
+        Проверка пересечения совпадает с pygame.Rect.colliderect.
+        """
+        if not self.capacity:
+            return -1
+        hits = (
+            self.alive
+            & (self.x < rect.right)
+            & (self.x + self.width > rect.left)
+            & (self.y < rect.bottom)
+            & (self.y + self.height > rect.top)
+        )
+        index = int(np.argmax(hits))
+        return index if hits[index] else -1
+
+    def _build_index(self) -> tuple:
+        """
+        Строит индекс кубиков: карту пикселей области кубиков,
+        где в каждой точке записан индекс кубика (-1 - пусто).
+        Кубики не двигаются, поэтому карта строится один раз за уровень.
+        """
+        left = int(self.x.min())
+        top = int(self.y.min())
+        right = int((self.x + self.width).max())
+        bottom = int((self.y + self.height).max())
+        dtype = np.int16 if self.capacity < np.iinfo(np.int16).max else np.int32
+        cells = np.full((bottom - top, right - left), -1, dtype=dtype)
+        # Обратный порядок: при наложении побеждает кубик с меньшим индексом
+        for i in range(self.capacity - 1, -1, -1):
+            x = self.x[i] - left
+            y = self.y[i] - top
+            cells[y : y + self.height[i], x : x + self.width[i]] = i
+        return left, top, cells
+
+    def collide_boxes(self, x, y, width: int, height: int) -> np.ndarray:
+        """
+        Пакетная проверка столкновений прямоугольников одного размера с кубиками.
+        Для каждого прямоугольника возвращает индекс первого живого кубика или -1.
+        Прямоугольник не больше кубика, поэтому хотя бы один его угол лежит
+        внутри задетого кубика - достаточно проверить 4 угла по индексу.
+        """
+        x = np.asarray(x, dtype=np.int32)
+        y = np.asarray(y, dtype=np.int32)
+        result = np.full(len(x), -1, dtype=np.intp)
+        if not self.capacity or not len(x):
+            return result
+        if width > self.width.min() or height > self.height.min():
+            # Крупные объекты проверяются напрямую
+            for i in range(len(x)):
+                result[i] = self.collide(pygame.Rect(int(x[i]), int(y[i]), width, height))
+            return result
+
+        if self._index is None:
+            self._index = self._build_index()
+        left, top, cells = self._index
+        rows, cols = cells.shape
+
+        best = np.full(len(x), self.capacity, dtype=np.intp)
+        for corner_x, corner_y in (
+            (x, y),
+            (x + width - 1, y),
+            (x, y + height - 1),
+            (x + width - 1, y + height - 1),
+        ):
+            col = corner_x - left
+            row = corner_y - top
+            inside = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+            found = np.full(len(x), -1, dtype=np.intp)
+            found[inside] = cells[row[inside], col[inside]]
+            valid = found != -1
+            valid[valid] = self.alive[found[valid]]
+            best = np.where(valid, np.minimum(best, found), best)
+
+        hit = best < self.capacity
+        result[hit] = best[hit]
+        return result
+
+    def hit(self, index: int) -> int:
+        """
+        Наносит удар по кубику.
+        Возвращает очки за разрушение (0, если кубик устоял или неразрушаем).
+        """
+        if not self.alive[index] or self.indestructible[index]:
+            return 0
+        self.hp[index] -= 1
+        self.version += 1
+        if self.hp[index] > 0:
+            # Повреждённый кубик становится темнее
+            self.color[index] = (self.color[index] * DAMAGE_SHADE).astype(np.uint8)
+            return 0
+        self.alive[index] = False
+        self._alive_count -= 1
+        return int(self.score[index])
+
+    def alive_indices(self) -> np.ndarray:
+        """Индексы оставшихся кубиков (включая неразрушаемые)"""
+        return np.flatnonzero(self.alive)
+
+    def __iter__(self) -> Iterator[Tuple[list, list]]:
+        """Перебирает оставшиеся кубики: ([x, y, ширина, высота], [r, g, b])"""
+        alive = self.alive_indices()
+        rects = np.column_stack(
+            (self.x[alive], self.y[alive], self.width[alive], self.height[alive])
+        ).tolist()
+        colors = self.color[alive].tolist()
+        for rect, color in zip(rects, colors):
+            yield rect, color
@@ -0,0 +1,297 @@
+"""
+Сжатая запись партии игры Арканоид с перемоткой
+Ввод партии (сдвиг платформы, направление, скорость мяча) упаковывается
+в битовое поле кадра, и кадры хранятся частями по CHUNK_FRAMES: внутри части
+одинаковые подряд поля сворачиваются в пары (поле, число кадров), часть
+сжимается zlib. В начале каждой KEYFRAME_CHUNKS-й части хранится опорный
+кадр - состояние партии (мячи, платформа, маска и прочность кубиков, счет,
+жизни, генераторы; GameSession.keyframe()). Оглавление частей в конце файла
+позволяет перейти к любому кадру: партия восстанавливается из ближайшего
+опорного кадра и доигрывается не больше минуты, а не с начала.
+
+Файл: заголовок, сжатые части, оглавление (смещение, размер, кадров,
+есть ли опорный кадр) и концевик со смещением оглавления. Запись ведется
+в памяти сжатыми частями и сохраняется в файл при выходе, как Replay;
+файлы с расширением CHUNKED_REPLAY_EXTENSION пишет --record FILE.
+"""
+
+import io
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from config import FPS
+from replay import Replay
+
+CHUNKED_REPLAY_MAGIC = b"ARKZ"
+CHUNKED_REPLAY_VERSION = 1
+CHUNKED_REPLAY_EXTENSION = ".zrec"
+CHUNK_FRAMES = 10 * FPS  # Кадров в части (10 секунд)
+KEYFRAME_CHUNKS = 6  # Опорный кадр в каждой 6-й части (раз в минуту)
+CHUNK_LEVEL = 6  # Уровень сжатия zlib
+
+# Сигнатура, версия, кадров в части, частей между опорными кадрами, зерно
+REPLAY_HEADER = struct.Struct("<4sHIIq")
+CHUNK_ENTRY = struct.Struct("<QIIB")  # Смещение, размер, кадров, опорный кадр
+REPLAY_FOOTER = struct.Struct("<QII4s")  # Смещение оглавления, частей, кадров
+KEYFRAME_SIZE = struct.Struct("<I")  # Размер опорного кадра в начале части
+# Пара «битовое поле ввода, сколько кадров подряд»
+RUN_DTYPE = np.dtype([("code", "<u4"), ("count", "<u2")])
+
+# Битовое поле кадра: сдвиг платформы (16 бит со знаком), направление + 1
+# (2 бита), скорость мяча (остальные биты)
+TRAVEL_MASK = 0xFFFF
+DIRECTION_SHIFT = 16
+SPEED_SHIFT = 18
+
+FrameInput = Tuple[int, int, int]  # Сдвиг платформы, направление, скорость
+
+
+def encode_inputs(inputs: np.ndarray) -> np.ndarray:
+    """Ввод кадров (N x 3) -> пары RUN_DTYPE (поле, число одинаковых кадров)"""
+    travel = np.clip(inputs[:, 0], -0x8000, 0x7FFF).astype(np.int64) & TRAVEL_MASK
+    codes = (
+        travel
+        | (inputs[:, 1].astype(np.int64) + 1) << DIRECTION_SHIFT
+        | inputs[:, 2].astype(np.int64) << SPEED_SHIFT
+    )
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    runs = np.empty(len(starts), dtype=RUN_DTYPE)
+    runs["code"] = codes[starts]
+    runs["count"] = np.diff(starts, append=len(codes))
+    return runs
+
+
+def decode_inputs(runs: np.ndarray) -> List[FrameInput]:
+    """Пары RUN_DTYPE -> ввод по кадрам"""
+    codes = np.repeat(runs["code"].astype(np.int64), runs["count"])
+    travel = (codes & TRAVEL_MASK).astype(np.uint16).view(np.int16)
+    direction = (codes >> DIRECTION_SHIFT & 3) - 1
+    speed = codes >> SPEED_SHIFT
+    return list(zip(travel.tolist(), direction.tolist(), speed.tolist()))
+
+
+def pack_keyframe(state: Dict[str, np.ndarray]) -> bytes:
+    """Опорный кадр (массивы по именам) -> байты формата .npz"""
+    buffer = io.BytesIO()
+    np.savez(buffer, **state)
+    return buffer.getvalue()
+
+
+def unpack_keyframe(data: bytes) -> Dict[str, np.ndarray]:
+    with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+        return {name: arrays[name] for name in arrays.files}
+
+
+class ChunkedReplay:
+    """
+    Запись партии частями. Интерфейс записи как у Replay: record() на каждый
+    кадр, save() в конце; перед record() экран сохраняет опорный кадр
+    add_keyframe(), когда keyframe_due().
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        chunk_frames: int = CHUNK_FRAMES,
+        keyframe_chunks: int = KEYFRAME_CHUNKS,
+    ):
+        # Число кадров пары RUN_DTYPE - 16 бит: часть из одинаковых кадров
+        # должна в него помещаться
+        max_frames = int(np.iinfo(RUN_DTYPE["count"]).max)
+        if not 0 < chunk_frames <= max_frames:
+            raise ValueError(
+                f"Кадров в части должно быть от 1 до {max_frames}. "
+                f"Получено: {chunk_frames}"
+            )
+        if keyframe_chunks < 1:
+            raise ValueError(
+                f"Частей между опорными кадрами должно быть не меньше 1. "
+                f"Получено: {keyframe_chunks}"
+            )
+        self.seed = seed
+        self.chunk_frames = chunk_frames
+        self.keyframe_chunks = keyframe_chunks
+        self.chunks: List[bytes] = []  # Сжатые заполненные части
+        self.keyframes: List[bool] = []  # Есть ли у части опорный кадр
+        self._inputs = np.zeros((chunk_frames, 3), dtype=np.int32)
+        self._count = 0  # Кадров в текущей части
+        self._keyframe: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        return len(self.chunks) * self.chunk_frames + self._count
+
+    def keyframe_due(self) -> bool:
+        """Начинается часть, которой нужен опорный кадр"""
+        return (
+            self._count == 0
+            and self._keyframe is None
+            and len(self.chunks) % self.keyframe_chunks == 0
+        )
+
+    def add_keyframe(self, session) -> None:
+        """Опорный кадр текущей части: состояние партии до ввода этого кадра"""
+        self._keyframe = pack_keyframe(session.keyframe())
+
+    def record(self, travel: int, direction: int, speed: int) -> None:
+        """Добавляет ввод очередного кадра"""
+        self._inputs[self._count] = (travel, direction, speed)
+        self._count += 1
+        if self._count == self.chunk_frames:
+            self.chunks.append(self._compress())
+            self.keyframes.append(self._keyframe is not None)
+            self._count = 0
+            self._keyframe = None
+
+    def _compress(self) -> bytes:
+        """Сжатая текущая часть"""
+        keyframe = self._keyframe or b""
+        runs = encode_inputs(self._inputs[: self._count])
+        return zlib.compress(
+            KEYFRAME_SIZE.pack(len(keyframe)) + keyframe + runs.tobytes(), CHUNK_LEVEL
+        )
+
+    def save(self, path: str) -> None:
+        """Сохраняет запись (начатая часть сохраняется неполной)"""
+        chunks = list(zip(self.chunks, [self.chunk_frames] * len(self.chunks)))
+        keyframes = list(self.keyframes)
+        if self._count:
+            chunks.append((self._compress(), self._count))
+            keyframes.append(self._keyframe is not None)
+        with open(path, "wb") as f:
+            f.write(
+                REPLAY_HEADER.pack(
+                    CHUNKED_REPLAY_MAGIC,
+                    CHUNKED_REPLAY_VERSION,
+                    self.chunk_frames,
+                    self.keyframe_chunks,
+                    self.seed,
+                )
+            )
+            entries = []
+            for (data, frames), keyframe in zip(chunks, keyframes):
+                entries.append(CHUNK_ENTRY.pack(f.tell(), len(data), frames, keyframe))
+                f.write(data)
+            index_offset = f.tell()
+            f.write(b"".join(entries))
+            f.write(
+                REPLAY_FOOTER.pack(
+                    index_offset, len(chunks), len(self), CHUNKED_REPLAY_MAGIC
+                )
+            )
+
+
+class ChunkedReplayFile:
+    """
+    Чтение записи ChunkedReplay. При открытии читаются только заголовок
+    и оглавление; части распаковываются по мере обращения к кадрам.
+    frames[i] - ввод кадра i, поэтому запись воспроизводит ReplayPilot.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            magic, version, self.chunk_frames, self.keyframe_chunks, self.seed = (
+                REPLAY_HEADER.unpack(self._file.read(REPLAY_HEADER.size))
+            )
+            if magic != CHUNKED_REPLAY_MAGIC or version != CHUNKED_REPLAY_VERSION:
+                raise ValueError(f"Неподдерживаемый файл записи: {path}")
+            self._file.seek(-REPLAY_FOOTER.size, io.SEEK_END)
+            index_offset, count, self.frame_count, magic = REPLAY_FOOTER.unpack(
+                self._file.read(REPLAY_FOOTER.size)
+            )
+            if magic != CHUNKED_REPLAY_MAGIC:
+                raise ValueError(f"Запись не завершена: {path}")
+            self._file.seek(index_offset)
+            self.index = list(
+                CHUNK_ENTRY.iter_unpack(self._file.read(count * CHUNK_ENTRY.size))
+            )
+        except (struct.error, OSError, ValueError):
+            self._file.close()
+            raise
+        self.frames = ChunkedFrames(self)
+        self._cached_index = -1
+        self._cached: Tuple[bytes, List[FrameInput]] = (b"", [])
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    def chunk(self, chunk_index: int) -> Tuple[bytes, List[FrameInput]]:
+        """(опорный кадр или b"", ввод по кадрам) части chunk_index"""
+        if chunk_index != self._cached_index:
+            offset, size = self.index[chunk_index][:2]
+            self._file.seek(offset)
+            data = zlib.decompress(self._file.read(size))
+            (keyframe_size,) = KEYFRAME_SIZE.unpack_from(data)
+            start = KEYFRAME_SIZE.size
+            keyframe = data[start : start + keyframe_size]
+            runs = np.frombuffer(data, dtype=RUN_DTYPE, offset=start + keyframe_size)
+            self._cached = (keyframe, decode_inputs(runs))
+            self._cached_index = chunk_index
+        return self._cached
+
+    def keyframe_before(
+        self, frame: int
+    ) -> Tuple[int, Optional[Dict[str, np.ndarray]]]:
+        """
+        Ближайший опорный кадр не позже кадра frame: (номер кадра, состояние).
+        (0, None), если опорного кадра нет: партия начинается с зерна.
+        """
+        chunk_index = min(frame // self.chunk_frames, len(self.index) - 1)
+        for index in range(chunk_index, -1, -1):
+            if self.index[index][3]:
+                keyframe = self.chunk(index)[0]
+                return index * self.chunk_frames, unpack_keyframe(keyframe)
+        return 0, None
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ChunkedFrames:
+    """Ввод кадров записи ChunkedReplayFile по номеру кадра (как Replay.frames)"""
+
+    def __init__(self, replay: ChunkedReplayFile):
+        self.replay = replay
+
+    def __len__(self) -> int:
+        return len(self.replay)
+
+    def __getitem__(self, frame: int) -> FrameInput:
+        if not 0 <= frame < len(self.replay):
+            raise IndexError(frame)
+        chunk_index, offset = divmod(frame, self.replay.chunk_frames)
+        return self.replay.chunk(chunk_index)[1][offset]
+
+
+def load_replay(path: str) -> Union[Replay, ChunkedReplayFile]:
+    """Открывает запись любого формата (по сигнатуре файла)"""
+    with open(path, "rb") as f:
+        magic = f.read(len(CHUNKED_REPLAY_MAGIC))
+    if magic == CHUNKED_REPLAY_MAGIC:
+        return ChunkedReplayFile(path)
+    return Replay.load(path)
+
+
+def seek(scene, pilot, frame: int) -> int:
+    """
+    Переводит экран воспроизведения scene (ReplayPilot pilot) к кадру frame
+    вперед или назад: партия восстанавливается из ближайшего опорного кадра
+    и доигрывается до frame без отрисовки. Запись без опорных кадров (Replay)
+    доигрывается от текущего кадра и только вперед. Возвращает номер кадра.
+    """
+    frame = min(frame, len(pilot.replay))
+    if isinstance(pilot.replay, ChunkedReplayFile):
+        start, state = pilot.replay.keyframe_before(frame)
+        # Опорный кадр нужен, если он ближе текущего кадра или надо назад
+        if state is not None and (start > pilot.frame or frame < pilot.frame):
+            scene.session.restore_keyframe(state)
+            scene.particles.clear()
+            pilot.frame = start
+    if frame < pilot.frame:
+        raise ValueError("Запись без опорных кадров не перематывается назад")
+    while pilot.frame < frame:
+        scene.update()
+    return pilot.frame
@@ -0,0 +1,57 @@
+"""
+Общие настройки игры Арканоид
+Размеры экрана и игровых объектов, используемые всеми модулями игры
+"""
+
+import os
+import sys
+
+
+def resource_path(relative_path):
+    """Получает абсолютный путь к ресурсу, работает как в разработке, так и в exe"""
+    try:
+        # PyInstaller создает временную папку и сохраняет путь в _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+
+# Настройки игры
+# Размеры экрана
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+FPS = 60
+# Режимы темпа кадров:
+# tick - Clock.tick (ожидание через sleep, зависит от точности таймера ОС),
+# busy - Clock.tick_busy_loop (точное ожидание с занятым циклом),
+# vsync - темп задает вертикальная синхронизация при выводе кадра,
+# uncapped - без ограничения частоты кадров (замеры производительности)
+FRAME_PACING_MODES = ("tick", "busy", "vsync", "uncapped")
+
+# Размеры и скорость платформы
+PADDLE_WIDTH = 120
+PADDLE_HEIGHT = 15
+PADDLE_SPEED = 9
+PADDLE_WIDE_WIDTH = 180  # Ширина платформы с бонусом «широкая платформа»
+PADDLE_WIDE_FRAMES = 600  # Длительность бонуса в кадрах (10 секунд)
+
+# Размеры и скорость мяча
+BALL_SIZE = 16
+BALL_SPEED_DEFAULT = 5  # Значение по умолчанию
+MAX_BALLS = 256  # Максимальное количество мячей одновременно (бонус «мультимяч»)
+
+# Параметры кубиков
+BRICK_ROWS = 5
+BRICK_COLS = 10
+BRICK_WIDTH = 60
+BRICK_HEIGHT = 20
+BRICK_PADDING = 10
+BRICK_OFFSET_TOP = 60
+
+MAX_LIVES = 3  # Максимальное количество жизней
+
+# Уровни
+LEVELS_DIR = "resources/levels"
+LEVEL_MAX_ROWS = 10  # Максимальное количество рядов кубиков в уровне
@@ -0,0 +1,196 @@
+"""
+Ввод игры Арканоид: клавиатура, геймпад, мышь и сенсорный экран
+События забираются из очереди pygame несколько раз за кадр и получают
+отметку времени, поэтому короткое нажатие между кадрами не теряется,
+а платформа сдвигается на долю кадра, в течение которой была нажата клавиша.
+Для каждого события замеряется задержка до вывода кадра на экран.
+"""
+
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+# Клавиши движения платформы: клавиша -> направление
+PADDLE_KEYS = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}
+
+JOYSTICK_DEADZONE = 0.2  # Отклонение стика, ниже которого он считается в центре
+JOYSTICK_LAUNCH_BUTTON = 0  # Кнопка геймпада, запускающая мяч
+
+LATENCY_STATS_SIZE = 300  # Сколько последних замеров задержки хранится
+
+# События, для которых замеряется задержка до вывода кадра
+INPUT_EVENTS = {
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.FINGERDOWN,
+    pygame.FINGERMOTION,
+    pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+}
+
+
+class InputState:
+    """
+    Буфер событий ввода с отметками времени (clock, по умолчанию time.perf_counter).
+    pump() забирает события из очереди pygame (можно вызывать чаще,
+    чем раз в кадр), drain() отдает накопленные события экранам,
+    paddle() - перемещение платформы за кадр по всем устройствам.
+    """
+
+    def __init__(
+        self,
+        width: Optional[int] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.width = width  # Ширина окна для координат касаний (0..1)
+        self.clock = clock
+        # Перевод координат окна в координаты логической поверхности
+        # (Display.to_logical, если окно масштабируется)
+        self.to_logical: Callable[[Tuple[float, float]], Tuple[int, int]] = (
+            lambda pos: (int(pos[0]), int(pos[1]))
+        )
+        self._pending: Deque[Tuple[float, pygame.event.Event]] = deque()
+        self._applied: List[float] = []  # Отметки событий, ждущих вывода кадра
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_STATS_SIZE)  # Секунды
+        self.joysticks: Dict[int, "pygame.joystick.JoystickType"] = {}
+
+        now = self.clock()
+        self._pressed = set()  # Нажатые клавиши движения платформы
+        self._stick = 0.0  # Направление по стику или крестовине геймпада
+        self._value = 0.0  # Итоговое направление с момента _since
+        self._since = now
+        self._frame_start = now
+        self._travel = 0.0  # Сумма направление * время за текущий кадр
+        self._tap = 0  # Направление нажатия, отпущенного до конца кадра
+        self._carry = 0.0  # Дробная часть сдвига платформы
+        self._pointer_x: Optional[int] = None
+        self._click_x: Optional[int] = None
+
+    def pump(self) -> None:
+        """Забирает события из очереди pygame и отмечает время их получения"""
+        now = self.clock()
+        for event in pygame.event.get():
+            self._pending.append((now, event))
+            self._apply(event, now)
+
+    def drain(self) -> List[pygame.event.Event]:
+        """События, накопленные с прошлого вызова, в порядке поступления"""
+        events = []
+        while self._pending:
+            stamp, event = self._pending.popleft()
+            if event.type in INPUT_EVENTS:
+                self._applied.append(stamp)
+            events.append(event)
+        return events
+
+    def presented(self) -> None:
+        """Кадр выведен на экран: записывает задержку примененных событий"""
+        if self._applied:
+            now = self.clock()
+            self.latencies.extend(now - stamp for stamp in self._applied)
+            self._applied.clear()
+
+    def latency_stats(self) -> Tuple[float, float, int]:
+        """(средняя, максимальная задержка в мс, количество замеров)"""
+        if not self.latencies:
+            return 0.0, 0.0, 0
+        return (
+            1000 * sum(self.latencies) / len(self.latencies),
+            1000 * max(self.latencies),
+            len(self.latencies),
+        )
+
+    def _set_direction(self, now: float) -> None:
+        """Новое направление с момента now; прошлое учитывается в сдвиге кадра"""
+        self._travel += self._value * (now - self._since)
+        self._since = now
+        keys = sum(PADDLE_KEYS[key] for key in self._pressed)
+        self._value = max(-1.0, min(1.0, keys + self._stick))
+
+    def _apply(self, event: pygame.event.Event, now: float) -> None:
+        """Обновляет состояние устройств по событию"""
+        if event.type == pygame.KEYDOWN and event.key in PADDLE_KEYS:
+            self._pressed.add(event.key)
+            self._tap = PADDLE_KEYS[event.key]
+            self._set_direction(now)
+        elif event.type == pygame.KEYUP and event.key in PADDLE_KEYS:
+            self._pressed.discard(event.key)
+            self._set_direction(now)
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Отпускание клавиш вне окна не приходит - считаем их отпущенными
+            self._pressed.clear()
+            self._set_direction(now)
+        elif event.type == pygame.JOYDEVICEADDED:
+            joystick = pygame.joystick.Joystick(event.device_index)
+            self.joysticks[joystick.get_instance_id()] = joystick
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.joysticks.pop(event.instance_id, None)
+            self._stick = 0.0
+            self._set_direction(now)
+        elif event.type == pygame.JOYAXISMOTION and event.axis == 0:
+            self._stick = event.value if abs(event.value) >= JOYSTICK_DEADZONE else 0.0
+            self._set_direction(now)
+        elif event.type == pygame.JOYHATMOTION:
+            self._stick = float(event.value[0])
+            self._set_direction(now)
+        elif event.type == pygame.JOYBUTTONDOWN:
+            if event.button == JOYSTICK_LAUNCH_BUTTON:
+                self._tap = self._tap or 1
+        elif event.type == pygame.MOUSEMOTION:
+            self._pointer_x = self.to_logical(event.pos)[0]
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._click_x = self.to_logical(event.pos)[0]
+        elif event.type in (pygame.FINGERMOTION, pygame.FINGERDOWN) and self.width:
+            self._pointer_x = self.to_logical((event.x * self.width, 0))[0]
+            if event.type == pygame.FINGERDOWN:
+                self._click_x = self._pointer_x
+
+    def paddle(self, speed: int) -> Tuple[int, int]:
+        """
+        Перемещение платформы за кадр от клавиатуры и геймпада:
+        (сдвиг в пикселях, направление -1/0/1). Сдвиг пропорционален доле
+        кадра, в течение которой было нажато направление; короткое нажатие,
+        отпущенное до начала кадра, сдвигает платформу как один полный кадр.
+        """
+        now = self.clock()
+        self._set_direction(now)
+        duration = now - self._frame_start
+        share = self._travel / duration if duration > 0 else self._value
+        if not share and self._tap:
+            share = float(self._tap)
+        self._frame_start = now
+        self._travel = 0.0
+        self._tap = 0
+
+        # Дробные пиксели переносятся на следующий кадр
+        self._carry = self._carry + share * speed if share else 0.0
+        travel = int(self._carry)
+        self._carry -= travel
+        direction = (share > 0) - (share < 0)
+        return travel, direction
+
+    def clear(self) -> None:
+        """Забывает накопленные сдвиги и нажатия (например, при входе в игру)"""
+        now = self.clock()
+        self._set_direction(now)
+        self._frame_start = now
+        self._travel = 0.0
+        self._tap = 0
+        self._carry = 0.0
+        self._pointer_x = None
+        self._click_x = None
+
+    def take_pointer(self) -> Optional[int]:
+        """X мыши или касания, если указатель сдвинулся с прошлого вызова"""
+        pointer_x, self._pointer_x = self._pointer_x, None
+        return pointer_x
+
+    def take_click(self) -> Optional[int]:
+        """X нажатия кнопки мыши или касания с прошлого вызова"""
+        click_x, self._click_x = self._click_x, None
+        return click_x
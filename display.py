@@ -0,0 +1,137 @@
+"""
+Окно игры Арканоид
+Игра рисует в логическую поверхность постоянного размера
+(SCREEN_WIDTH x SCREEN_HEIGHT), а окно может быть любого размера:
+раз в кадр логическая поверхность масштабируется в заранее выделенную
+область окна. Геометрия и физика игры от размера окна не зависят.
+"""
+
+from typing import Optional, Tuple
+
+import pygame
+
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Режимы масштабирования (параметр --scale)
+SCALE_MODES = ("none", "scaled", "integer", "smooth")
+
+BORDER_COLOR = (0, 0, 0)  # Цвет полей вокруг изображения
+
+
+def fit_rect(
+    size: Tuple[int, int], window: Tuple[int, int], integer: bool = False
+) -> pygame.Rect:
+    """
+    Область окна window для изображения размера size с сохранением
+    пропорций, по центру окна. integer - только целое увеличение
+    (если окно меньше изображения, уменьшение остается дробным).
+    """
+    scale = min(window[0] / size[0], window[1] / size[1])
+    if integer and scale >= 1:
+        scale = int(scale)
+    rect = pygame.Rect(0, 0, int(size[0] * scale), int(size[1] * scale))
+    rect.center = (window[0] // 2, window[1] // 2)
+    return rect
+
+
+class Display:
+    """
+    Окно и логическая поверхность, в которую рисуют экраны игры.
+    Режимы масштабирования:
+    none - окно размером с логическую поверхность, рисование прямо в окно;
+    scaled - флаг pygame.SCALED: масштабирует SDL (видеокартой, если есть
+    ускорение), размер окна выбирает SDL;
+    integer - целое увеличение (четкие пиксели), остаток окна - поля;
+    smooth - сглаженное увеличение до размера окна с сохранением пропорций.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        window_size: Optional[Tuple[int, int]] = None,
+        fullscreen: bool = False,
+        mode: str = "none",
+    ):
+        if mode not in SCALE_MODES:
+            raise ValueError(f"Неизвестный режим масштабирования: {mode}")
+        self.size = size
+        self.window_size = window_size
+        self.fullscreen = fullscreen
+        self.mode = mode
+        self.vsync = False  # Включена ли вертикальная синхронизация
+        self.window: Optional[pygame.Surface] = None
+        self.surface: Optional[pygame.Surface] = None  # Логическая поверхность
+        self.area = pygame.Rect((0, 0), size)  # Изображение в координатах окна
+        self._dest: Optional[pygame.Surface] = None  # Область окна под изображение
+
+    @property
+    def scaled(self) -> bool:
+        """Масштабирует ли игра сама (логическая поверхность отдельно от окна)"""
+        return self._dest is not None
+
+    def open(self, vsync: bool = False) -> pygame.Surface:
+        """
+        Создает окно и возвращает логическую поверхность.
+        vsync - вертикальная синхронизация; pygame поддерживает ее только
+        с рендерером SDL, поэтому она включает режим scaled.
+        Удалось ли ее включить, показывает атрибут vsync.
+        """
+        fullscreen = pygame.FULLSCREEN if self.fullscreen else 0
+        self._dest = None
+        self.vsync = False
+        if vsync and self.mode != "scaled":
+            print(f"Вертикальная синхронизация: режим {self.mode} заменен на scaled")
+            self.mode = "scaled"
+        if self.mode == "scaled":
+            try:
+                self.window = pygame.display.set_mode(
+                    self.size, fullscreen | pygame.SCALED, vsync=int(vsync)
+                )
+                self.vsync = vsync
+                return self._use_window()
+            except pygame.error as error:
+                # Без рендерера SDL (например, драйвер dummy) масштабируем сами
+                print(f"Режим scaled недоступен ({error}), используется smooth")
+                self.mode = "smooth"
+        if self.mode == "none":
+            self.window = pygame.display.set_mode(self.size, fullscreen)
+            return self._use_window()
+
+        window_size = self.window_size or ((0, 0) if self.fullscreen else self.size)
+        self.window = pygame.display.set_mode(window_size, fullscreen)
+        self.area = fit_rect(
+            self.size, self.window.get_size(), integer=self.mode == "integer"
+        )
+        if self.area.size == self.size:
+            # Масштаб 1: копирование без масштабирования
+            self.window.fill(BORDER_COLOR)
+            self.surface = self.window.subsurface(self.area)
+            return self.surface
+        if self.mode == "smooth" and self.window.get_bitsize() < 24:
+            self.mode = "integer"  # smoothscale работает только с 24/32 битами
+        # Логическая поверхность в формате окна: масштабирование без
+        # преобразования пикселей, в одну и ту же область окна каждый кадр
+        self.surface = pygame.Surface(self.size, 0, self.window)
+        self._dest = self.window.subsurface(self.area)
+        self.window.fill(BORDER_COLOR)
+        return self.surface
+
+    def _use_window(self) -> pygame.Surface:
+        self.surface = self.window
+        self.area = self.window.get_rect()
+        return self.surface
+
+    def present(self) -> None:
+        """Масштабирует логическую поверхность в окно и выводит кадр"""
+        if self._dest is not None:
+            if self.mode == "smooth":
+                pygame.transform.smoothscale(self.surface, self.area.size, self._dest)
+            else:
+                pygame.transform.scale(self.surface, self.area.size, self._dest)
+        pygame.display.flip()
+
+    def to_logical(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        """Координаты окна (мышь, касание) в координатах логической поверхности"""
+        x = (pos[0] - self.area.x) * self.size[0] / self.area.width
+        y = (pos[1] - self.area.y) * self.size[1] / self.area.height
+        return int(x), int(y)
@@ -0,0 +1,257 @@
+"""
+Эффекты игры Арканоид: частицы разрушенных кубиков и падающие бонусы
+Объекты хранятся в заранее выделенных массивах NumPy; свободные ячейки
+выдаются из стека свободных индексов, поэтому в игровом цикле
+не создается ни одного нового объекта Python на частицу
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from rng import numpy_state_array, set_numpy_state_array
+
+MAX_PARTICLES = 2048
+PARTICLES_PER_BRICK = 16
+PARTICLE_LIFETIME = 30  # Кадров
+PARTICLE_SIZE = 3
+PARTICLE_GRAVITY = 0.25
+
+MAX_POWERUPS = 32
+POWERUP_WIDTH = 30
+POWERUP_HEIGHT = 12
+POWERUP_FALL_SPEED = 3
+POWERUP_DROP_CHANCE = 0.15  # Вероятность выпадения бонуса из разрушенного кубика
+POWERUP_STATE_FIELDS = ("x", "y", "kind", "active")
+
+
+@dataclass(frozen=True)
+class PowerUpType:
+    """Тип бонуса: название и цвет капсулы"""
+
+    name: str
+    color: Tuple[int, int, int]
+
+
+# Типы бонусов; индекс в кортеже - код бонуса
+POWERUP_TYPES = (
+    PowerUpType("multiball", (230, 90, 90)),
+    PowerUpType("wide", (80, 140, 220)),
+    PowerUpType("life", (80, 200, 120)),
+)
+POWERUP_MULTIBALL, POWERUP_WIDE, POWERUP_LIFE = range(len(POWERUP_TYPES))
+
+
+class FreeList:
+    """Стек свободных индексов пула фиксированного размера"""
+
+    def __init__(self, capacity: int):
+        self._items = np.arange(capacity - 1, -1, -1, dtype=np.intp)
+        self._top = capacity
+
+    def __len__(self) -> int:
+        """Количество свободных ячеек"""
+        return self._top
+
+    def allocate(self, count: int) -> np.ndarray:
+        """Выдает до count свободных индексов"""
+        count = min(count, self._top)
+        self._top -= count
+        return self._items[self._top : self._top + count].copy()
+
+    def release(self, indices: np.ndarray) -> None:
+        """Возвращает индексы в стек"""
+        self._items[self._top : self._top + len(indices)] = indices
+        self._top += len(indices)
+
+    def copy_from(self, other: "FreeList") -> None:
+        """Переносит состояние стека other (той же емкости)"""
+        np.copyto(self._items, other._items)
+        self._top = other._top
+
+
+class ParticlePool:
+    """Частицы: позиция, скорость, оставшееся время жизни и цвет"""
+
+    def __init__(
+        self,
+        capacity: int = MAX_PARTICLES,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vel_x = np.zeros(capacity, dtype=np.float32)
+        self.vel_y = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)  # 0 - ячейка свободна
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._free = FreeList(capacity)
+        self._rng = rng or np.random.default_rng()
+
+    def __len__(self) -> int:
+        """Количество живых частиц"""
+        return len(self.x) - len(self._free)
+
+    def burst(self, pos, color, count: int = PARTICLES_PER_BRICK) -> int:
+        """Разлет частиц из точки pos. Возвращает количество созданных частиц"""
+        indices = self._free.allocate(count)
+        n = len(indices)
+        if not n:
+            return 0
+        angle = self._rng.uniform(0, 2 * np.pi, n)
+        speed = self._rng.uniform(1.0, 4.0, n)
+        self.x[indices] = pos[0]
+        self.y[indices] = pos[1]
+        self.vel_x[indices] = np.cos(angle) * speed
+        self.vel_y[indices] = np.sin(angle) * speed - 1.5
+        self.life[indices] = self._rng.integers(
+            PARTICLE_LIFETIME // 2, PARTICLE_LIFETIME, n, endpoint=True
+        )
+        self.color[indices] = color
+        return n
+
+    def update(self) -> None:
+        """Перемещает все частицы и освобождает ячейки погасших"""
+        alive = self.life > 0
+        self.x[alive] += self.vel_x[alive]
+        self.y[alive] += self.vel_y[alive]
+        self.vel_y[alive] += PARTICLE_GRAVITY
+        self.life[alive] -= 1
+        expired = np.flatnonzero(alive & (self.life == 0))
+        if len(expired):
+            self._free.release(expired)
+
+    def clear(self) -> None:
+        """Гасит все частицы"""
+        alive = np.flatnonzero(self.life > 0)
+        self.life[alive] = 0
+        self._free.release(alive)
+
+    def draw(self, screen: pygame.Surface, sprite_cache) -> None:
+        alive = self.life > 0
+        if not alive.any():
+            return
+        # Один спрайт на цвет: частицы кубика одного цвета, цветов немного
+        colors, color_index = np.unique(
+            self.color[alive], axis=0, return_inverse=True
+        )
+        sprites = [sprite_cache.particle(color, PARTICLE_SIZE) for color in colors]
+        screen.blits(
+            [
+                (sprites[index], (x, y))
+                for x, y, index in zip(
+                    self.x[alive].astype(np.int32).tolist(),
+                    self.y[alive].astype(np.int32).tolist(),
+                    color_index.ravel().tolist(),
+                )
+            ],
+            doreturn=False,
+        )
+
+
+class PowerUpPool:
+    """Падающие бонусы: позиция и тип"""
+
+    def __init__(self, capacity: int = MAX_POWERUPS, rng=None):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.active = np.zeros(capacity, dtype=bool)
+        self._free = FreeList(capacity)
+        self._rng = rng or np.random.default_rng()
+
+    def __len__(self) -> int:
+        """Количество падающих бонусов"""
+        return len(self.x) - len(self._free)
+
+    def copy(self) -> "PowerUpPool":
+        """Независимая копия бонусов, включая состояние генератора случайных чисел"""
+        clone = PowerUpPool(len(self.x), copy.deepcopy(self._rng))
+        clone.copy_from(self)
+        return clone
+
+    def copy_from(self, other: "PowerUpPool") -> None:
+        """Переносит бонусы other в этот пул (той же емкости)"""
+        for name in ("x", "y", "kind", "active"):
+            np.copyto(getattr(self, name), getattr(other, name))
+        self._free.copy_from(other._free)
+        self._rng.bit_generator.state = other._rng.bit_generator.state
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        """Бонусы, стек свободных ячеек и генератор (опорный кадр записи)"""
+        state = {name: getattr(self, name).copy() for name in POWERUP_STATE_FIELDS}
+        state["free"] = np.append(self._free._items, self._free._top)
+        state["rng"] = numpy_state_array(self._rng)
+        return state
+
+    def restore_arrays(self, state: Dict[str, np.ndarray]) -> None:
+        """Восстанавливает бонусы из state_arrays() на месте"""
+        for name in POWERUP_STATE_FIELDS:
+            np.copyto(getattr(self, name), state[name])
+        np.copyto(self._free._items, state["free"][:-1])
+        self._free._top = int(state["free"][-1])
+        set_numpy_state_array(self._rng, state["rng"])
+
+    def spawn(self, pos, kind: int) -> int:
+        """Создает бонус с центром в pos. Возвращает индекс или -1"""
+        indices = self._free.allocate(1)
+        if not len(indices):
+            return -1
+        index = indices[0]
+        self.x[index] = pos[0] - POWERUP_WIDTH // 2
+        self.y[index] = pos[1] - POWERUP_HEIGHT // 2
+        self.kind[index] = kind
+        self.active[index] = True
+        return int(index)
+
+    def maybe_spawn(self, pos, chance: float = POWERUP_DROP_CHANCE) -> int:
+        """С вероятностью chance создает случайный бонус. Возвращает индекс или -1"""
+        if self._rng.random() >= chance:
+            return -1
+        return self.spawn(pos, int(self._rng.integers(len(POWERUP_TYPES))))
+
+    def update(self, paddle_rect: pygame.Rect, bottom: int) -> List[int]:
+        """
+        Сдвигает бонусы вниз, убирает пойманные платформой и упавшие.
+        Возвращает типы пойманных бонусов.
+        """
+        active = self.active
+        self.y[active] += POWERUP_FALL_SPEED
+        caught = (
+            active
+            & (self.x < paddle_rect.right)
+            & (self.x + POWERUP_WIDTH > paddle_rect.left)
+            & (self.y < paddle_rect.bottom)
+            & (self.y + POWERUP_HEIGHT > paddle_rect.top)
+        )
+        removed = np.flatnonzero(caught | (active & (self.y >= bottom)))
+        if len(removed):
+            self.active[removed] = False
+            self._free.release(removed)
+        return self.kind[caught].tolist()
+
+    def clear(self) -> None:
+        """Убирает все бонусы"""
+        active = np.flatnonzero(self.active)
+        self.active[active] = False
+        self._free.release(active)
+
+    def draw(self, screen: pygame.Surface, sprite_cache) -> None:
+        sprites = [
+            sprite_cache.capsule(t.color, POWERUP_WIDTH, POWERUP_HEIGHT)
+            for t in POWERUP_TYPES
+        ]
+        active = self.active
+        screen.blits(
+            [
+                (sprites[kind], (x, y))
+                for x, y, kind in zip(
+                    self.x[active].tolist(),
+                    self.y[active].tolist(),
+                    self.kind[active].tolist(),
+                )
+            ],
+            doreturn=False,
+        )
@@ -0,0 +1,214 @@
+"""
+Движок экранов игры Арканоид
+Каждый экран игры - состояние (Scene) с методами handle_event/update/draw.
+Все экраны обслуживаются одним игровым циклом SceneManager с одними часами,
+поэтому нет вложенных циклов обработки событий, темп кадров одинаков на всех
+экранах, а замер времени кадра выполняется в одном месте
+"""
+
+import statistics
+import time
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+from config import FRAME_PACING_MODES
+from controls import InputState
+from display import Display
+
+# Сколько последних кадров хранится для статистики
+FRAME_STATS_SIZE = 300
+
+
+class Scene:
+    """Базовый экран игры"""
+
+    # Экран рисуется поверх предыдущего (например, окно настроек)
+    overlay = False
+
+    def __init__(self):
+        self.manager: Optional["SceneManager"] = None
+
+    def enter(self) -> None:
+        """Вызывается, когда экран добавлен в стек"""
+
+    def resume(self) -> None:
+        """Вызывается, когда экран снова оказался на вершине стека"""
+
+    def exit(self) -> None:
+        """Вызывается, когда экран убран из стека"""
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Обработка одного события"""
+
+    def update(self) -> None:
+        """Обновление состояния на один кадр"""
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Отрисовка экрана"""
+
+
+class SceneManager:
+    """
+    Стек экранов и единый игровой цикл.
+    События получает только верхний экран; экраны-оверлеи рисуются
+    поверх экранов, лежащих под ними.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        fps: int = 60,
+        display: Optional[Display] = None,
+        pacing: str = "tick",
+    ):
+        if pacing not in FRAME_PACING_MODES:
+            raise ValueError(f"Неизвестный режим темпа кадров: {pacing}")
+        self.screen = screen
+        # Окно с масштабированием: экраны рисуют в логическую поверхность
+        # screen, а display.present() переносит ее в окно
+        self.display = display
+        self.fps = fps
+        self.pacing = pacing
+        self.clock = pygame.time.Clock()
+        self.running = False
+        self.quit_requested = False
+        self.frame_count = 0
+        # Интервалы между выводами кадров, мс (perf_counter: Clock.tick
+        # округляет до миллисекунды, чего мало для оценки неравномерности)
+        self.frame_times = deque(maxlen=FRAME_STATS_SIZE)
+        self._last_present: Optional[float] = None
+        self.input = InputState(screen.get_width())
+        if display is not None:
+            self.input.width = display.window.get_width()
+            self.input.to_logical = display.to_logical
+        self._stack: List[Scene] = []
+        # Вызывается после каждой смены экрана с ее описанием
+        # (контрольные точки диагностики памяти)
+        self.on_transition: Optional[Callable[[str], None]] = None
+
+    @property
+    def top(self) -> Optional[Scene]:
+        """Текущий (верхний) экран"""
+        return self._stack[-1] if self._stack else None
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+    def push(self, scene: Scene) -> None:
+        """Открывает экран поверх текущего"""
+        scene.manager = self
+        self._stack.append(scene)
+        scene.enter()
+        self._notify("открыт", scene)
+
+    def pop(self) -> Scene:
+        """Закрывает текущий экран и возвращается к предыдущему"""
+        scene = self._stack.pop()
+        scene.exit()
+        if self._stack:
+            self._stack[-1].resume()
+        self._notify("закрыт", scene)
+        return scene
+
+    def replace(self, scene: Scene) -> None:
+        """Заменяет текущий экран другим"""
+        self._stack.pop().exit()
+        self.push(scene)
+
+    def close(self) -> None:
+        """Закрывает все экраны сверху вниз без возврата к ним (выход из игры)"""
+        while self._stack:
+            scene = self._stack.pop()
+            scene.exit()
+            self._notify("закрыт", scene)
+
+    def _notify(self, action: str, scene: Scene) -> None:
+        if self.on_transition is not None:
+            self.on_transition(f"экран {type(scene).__name__} {action}")
+
+    def quit(self) -> None:
+        """Завершает игровой цикл (выход из игры)"""
+        self.quit_requested = True
+        self.running = False
+
+    def run(self, scene: Optional[Scene] = None) -> bool:
+        """
+        Игровой цикл: работает, пока в стеке есть экраны.
+        Возвращает True, если был запрошен выход из игры.
+        """
+        if scene is not None:
+            self.push(scene)
+        self.running = True
+        while self.running and self._stack:
+            self.step()
+        return self.quit_requested
+
+    def step(self) -> None:
+        """Один кадр: события, обновление, отрисовка, ожидание следующего кадра"""
+        self.input.pump()
+        for event in self.input.drain():
+            if event.type == pygame.QUIT:
+                self.quit()  # Выход из игры по крестику с любого экрана
+            elif self._stack:
+                self._stack[-1].handle_event(event)
+            if not self.running or not self._stack:
+                return
+
+        self._stack[-1].update()
+        if not self.running or not self._stack:
+            return
+
+        self.draw()
+        if self.display is not None:
+            self.display.present()
+        else:
+            pygame.display.flip()
+        self.input.presented()
+        # События, пришедшие за время кадра, получают более точную отметку времени
+        self.input.pump()
+        self.wait_next_frame()
+        now = time.perf_counter()
+        if self._last_present is not None:
+            self.frame_times.append(1000 * (now - self._last_present))
+        self._last_present = now
+        self.frame_count += 1
+
+    def wait_next_frame(self) -> None:
+        """Ожидание начала следующего кадра в выбранном режиме темпа"""
+        if self.pacing == "tick":
+            self.clock.tick(self.fps)
+        elif self.pacing == "busy":
+            self.clock.tick_busy_loop(self.fps)
+        else:
+            # vsync: ожидание уже было в display.flip(); uncapped: без ожидания
+            self.clock.tick()
+
+    def draw(self) -> None:
+        """Рисует верхний экран и все экраны под оверлеями"""
+        first = len(self._stack) - 1
+        while first > 0 and self._stack[first].overlay:
+            first -= 1
+        for scene in self._stack[first:]:
+            scene.draw(self.screen)
+
+    def average_fps(self) -> float:
+        """Средняя частота кадров по последним кадрам"""
+        if not self.frame_times:
+            return 0.0
+        total = sum(self.frame_times)
+        return 1000 * len(self.frame_times) / total if total else 0.0
+
+    def frame_stats(self) -> Tuple[float, float, float]:
+        """
+        (среднее время кадра, стандартное отклонение, худший кадр) в мс
+        по последним кадрам: чем меньше отклонение, тем ровнее темп
+        """
+        if len(self.frame_times) < 2:
+            return 0.0, 0.0, 0.0
+        return (
+            statistics.fmean(self.frame_times),
+            statistics.stdev(self.frame_times),
+            max(self.frame_times),
+        )
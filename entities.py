@@ -0,0 +1,157 @@
+"""
+Игровые объекты Арканоида: платформа и мяч
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pygame
+
+from config import (
+    BALL_SIZE,
+    BALL_SPEED_DEFAULT,
+    PADDLE_HEIGHT,
+    PADDLE_SPEED,
+    PADDLE_WIDE_FRAMES,
+    PADDLE_WIDE_WIDTH,
+    PADDLE_WIDTH,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from settings import SettingsManager
+
+
+@dataclass
+class Paddle:
+    rect: pygame.Rect = field(
+        default_factory=lambda: pygame.Rect(
+            (SCREEN_WIDTH - PADDLE_WIDTH) // 2,
+            SCREEN_HEIGHT - 60,
+            PADDLE_WIDTH,
+            PADDLE_HEIGHT,
+        )
+    )
+
+    wide_frames: int = 0  # Сколько кадров еще действует бонус «широкая платформа»
+
+    def move(self, direction: int) -> None:
+        """direction = -1 (влево) / 1 (вправо)."""
+        self.shift(direction * PADDLE_SPEED)
+
+    def shift(self, dx: int) -> None:
+        """Сдвигает платформу на dx пикселей, не выходя за края экрана"""
+        self.rect.x += dx
+        self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
+
+    def resize(self, width: int) -> None:
+        """Меняет ширину платформы, сохраняя положение ее центра"""
+        center_x = self.rect.centerx
+        self.rect.width = width
+        self.rect.centerx = center_x
+        self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
+
+    def widen(self, frames: int = PADDLE_WIDE_FRAMES) -> None:
+        """Бонус «широкая платформа» на frames кадров"""
+        self.resize(PADDLE_WIDE_WIDTH)
+        self.wide_frames = frames
+
+    def reset(self) -> None:
+        """Возвращает платформу в центр с обычной шириной"""
+        self.wide_frames = 0
+        self.rect.size = (PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.rect.topleft = ((SCREEN_WIDTH - PADDLE_WIDTH) // 2, SCREEN_HEIGHT - 60)
+
+    def copy(self) -> "Paddle":
+        return Paddle(self.rect.copy(), self.wide_frames)
+
+    def copy_from(self, other: "Paddle") -> None:
+        """Переносит положение, ширину и бонус other на месте"""
+        self.rect.update(other.rect)
+        self.wide_frames = other.wide_frames
+
+    def tick(self) -> None:
+        """Отсчитывает время действия бонуса и возвращает обычную ширину"""
+        if self.wide_frames:
+            self.wide_frames -= 1
+            if not self.wide_frames:
+                self.resize(PADDLE_WIDTH)
+
+
+@dataclass
+class Ball:
+    """Класс мяча с интегрированным управлением скоростью"""
+
+    rect: pygame.Rect = field(
+        default_factory=lambda: pygame.Rect(
+            (SCREEN_WIDTH - BALL_SIZE) // 2,
+            SCREEN_HEIGHT // 2,
+            BALL_SIZE,
+            BALL_SIZE,
+        )
+    )
+    vel_x: Optional[int] = None  # None - случайное направление из rng
+    vel_y: int = field(default_factory=lambda: -BALL_SPEED_DEFAULT)
+    current_speed: int = field(default_factory=lambda: BALL_SPEED_DEFAULT)
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.vel_x is None:
+            self.vel_x = self.rng.choice([-BALL_SPEED_DEFAULT, BALL_SPEED_DEFAULT])
+
+    def update(self) -> None:
+        self.rect.x += self.vel_x
+        self.rect.y += self.vel_y
+
+        # Скорость направляется от стены: мяч, заехавший в стену (например,
+        # после отскока от платформы у края), не застревает в ней
+        if self.rect.left <= 0:
+            self.vel_x = abs(self.vel_x)
+        elif self.rect.right >= SCREEN_WIDTH:
+            self.vel_x = -abs(self.vel_x)
+        if self.rect.top <= 0:
+            self.vel_y = abs(self.vel_y)
+
+    def bounce_vertical(self) -> None:
+        self.vel_y *= -1
+
+    def reset(self, paddle_rect: pygame.Rect) -> None:
+        """Сброс мяча на платформу с текущей скоростью"""
+        self.rect.center = paddle_rect.midtop
+        self.rect.y -= BALL_SIZE
+        self.vel_x = self.rng.choice([-self.current_speed, self.current_speed])
+        self.vel_y = -self.current_speed
+
+    def serve(self, paddle_rect: pygame.Rect) -> None:
+        """Сброс мяча на платформу в ожидании запуска"""
+        self.reset(paddle_rect)
+        self.vel_y = 0
+
+    def set_speed(self, speed: int, settings_manager: SettingsManager = None) -> None:
+        """Устанавливает скорость мяча и обновляет настройки"""
+        if 1 <= speed <= 10:
+            old_speed = self.current_speed
+            self.current_speed = speed
+            self.vel_x = (
+                int(self.vel_x * speed / old_speed) if old_speed != 0 else speed
+            )
+            self.vel_y = (
+                int(self.vel_y * speed / old_speed) if old_speed != 0 else -speed
+            )
+
+            if settings_manager:
+                settings_manager.set_ball_speed(speed)
+
+    def increase_speed(self, settings_manager: SettingsManager = None) -> None:
+        """Увеличивает скорость на 1 (максимум 10)"""
+        if self.current_speed < 10:
+            self.set_speed(self.current_speed + 1, settings_manager)
+
+    def decrease_speed(self, settings_manager: SettingsManager = None) -> None:
+        """Уменьшает скорость на 1 (минимум 1)"""
+        if self.current_speed > 1:
+            self.set_speed(self.current_speed - 1, settings_manager)
+
+    def get_speed(self) -> int:
+        """Возвращает текущую скорость мяча"""
+        return self.current_speed
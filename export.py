@@ -0,0 +1,204 @@
+"""
+Экспорт записи партии игры Арканоид в видео
+Партия из файла записи (python PyGameBall.py --record FILE) воспроизводится
+без окна (SDL_VIDEODRIVER=dummy), каждый кадр рисуется во внеэкранную
+поверхность и выводится сырым RGB (rgb24) в файл или канал, либо
+последовательностью PNG. Запись на диск выполняет фоновый поток, поэтому
+отрисовка следующего кадра идет одновременно с записью предыдущего.
+Сжатая запись (файл .zrec, chunked_replay.py) с --start перематывается
+к нужной секунде от ближайшего опорного кадра, а не с начала партии.
+
+    python export.py game.replay - | ffmpeg -f rawvideo -pix_fmt rgb24 \\
+        -s 800x600 -r 60 -i - game.mp4
+"""
+
+import argparse
+import os
+import queue
+import sys
+import threading
+from typing import BinaryIO, Callable, Optional, Union
+
+# Драйверы SDL выбираются при инициализации pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Приветствие pygame попало бы в поток кадров при выводе в канал
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from PyGameBall import GameContext, GameScene
+from chunked_replay import ChunkedReplayFile, load_replay, seek
+from config import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+from fonts import default_font_registry
+from replay import Replay, ReplayPilot
+from rng import RandomStreams
+
+EXPORT_QUEUE_SIZE = 8  # Кадров в очереди записи (ограничивает расход памяти)
+
+
+class FrameWriter:
+    """
+    Фоновый поток записи кадров.
+    write() ставит кадр в очередь (ждет, если очередь полна),
+    close() дожидается записи всех кадров. Ошибка записи в потоке
+    передается в вызывающий поток при следующем write() или close().
+    """
+
+    def __init__(
+        self, sink: Callable[[bytes], None], queue_size: int = EXPORT_QUEUE_SIZE
+    ):
+        self.sink = sink
+        self.frames_written = 0
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(queue_size)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="frame-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            if self._error is not None:
+                continue  # После ошибки кадры только забираются из очереди
+            try:
+                self.sink(frame)
+                self.frames_written += 1
+            except BaseException as error:
+                self._error = error
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def write(self, frame: bytes) -> None:
+        """Ставит кадр в очередь записи"""
+        self._check()
+        self._queue.put(frame)
+
+    def close(self) -> None:
+        """Дожидается записи всех кадров и завершает поток"""
+        self._queue.put(None)
+        self._thread.join()
+        self._check()
+
+
+def png_sink(directory: str) -> Callable[[bytes], None]:
+    """Запись кадров файлами frame_000000.png в каталог directory"""
+    os.makedirs(directory, exist_ok=True)
+    counter = iter(range(sys.maxsize))
+
+    def write(frame: bytes) -> None:
+        image = pygame.image.frombytes(frame, (SCREEN_WIDTH, SCREEN_HEIGHT), "RGB")
+        path = os.path.join(directory, f"frame_{next(counter):06d}.png")
+        pygame.image.save(image, path)
+
+    return write
+
+
+def export_replay(
+    replay: Union[Replay, ChunkedReplayFile],
+    sink: Callable[[bytes], None],
+    every: int = 1,
+    start: int = 0,
+) -> int:
+    """
+    Воспроизводит запись с кадра start и передает каждый every-й кадр
+    (RGB, построчно) в sink из фонового потока. Сжатая запись перематывается
+    к start от ближайшего опорного кадра. Возвращает количество записанных кадров.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # Окно драйвера dummy нужно только для convert() спрайтов
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = default_font_registry()
+    context = GameContext(
+        font=fonts.get("arial", 20),
+        big_font=fonts.get("arial", 42, bold=True),
+        fonts=fonts,
+        rng=RandomStreams(replay.seed),
+        music_enabled=False,
+        sounds_loaded=True,  # Без звука: звуки не синтезируются
+    )
+    pilot = ReplayPilot(replay)
+    scene = GameScene(context, pilot)
+    seek(scene, pilot, start)
+    frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    writer = FrameWriter(sink)
+    try:
+        while not pilot.finished:
+            scene.update()
+            if (pilot.frame - 1) % every == 0:
+                scene.draw(frame)
+                # tobytes копирует пиксели: поверхность можно рисовать дальше,
+                # пока поток записи сохраняет копию
+                writer.write(pygame.image.tobytes(frame, "RGB"))
+    finally:
+        writer.close()
+    return writer.frames_written
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Разбор параметров командной строки"""
+    parser = argparse.ArgumentParser(description="Экспорт записи партии в кадры")
+    parser.add_argument("replay", help="файл записи (PyGameBall.py --record FILE)")
+    parser.add_argument(
+        "output",
+        help="файл сырого видео RGB (rgb24, 800x600) или - для вывода в канал; "
+        "с --png - каталог для PNG",
+    )
+    parser.add_argument(
+        "--png",
+        action="store_true",
+        help="сохранить кадры последовательностью PNG в каталог output",
+    )
+    parser.add_argument(
+        "--every",
+        type=int,
+        default=1,
+        metavar="N",
+        help="записывать каждый N-й кадр (по умолчанию каждый)",
+    )
+    parser.add_argument(
+        "--start",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="начать с этой секунды партии (запись .zrec перематывается сразу)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    replay = load_replay(args.replay)
+    start = int(args.start * FPS)
+    try:
+        if args.png:
+            frames = export_replay(replay, png_sink(args.output), args.every, start)
+        elif args.output == "-":
+            stream: BinaryIO = sys.stdout.buffer
+            frames = export_replay(replay, stream.write, args.every, start)
+            stream.flush()
+        else:
+            with open(args.output, "wb") as stream:
+                frames = export_replay(replay, stream.write, args.every, start)
+    finally:
+        if isinstance(replay, ChunkedReplayFile):
+            replay.close()
+    pygame.quit()
+    print(
+        f"Кадров: {frames} ({SCREEN_WIDTH}x{SCREEN_HEIGHT}, "
+        f"{FPS / args.every:g} кадров/с записи)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Шрифты игры Арканоид
+pygame.font.SysFont при каждом вызове ищет шрифт среди всех шрифтов системы
+(на Linux через fc-list), что занимает сотни миллисекунд. Здесь путь к файлу
+шрифта ищется один раз и сохраняется на диске, а объекты pygame.font.Font
+создаются один раз на (семейство, размер, жирность) и используются всеми экранами.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from settings import get_game_directory
+
+FONT_CACHE_FILE_NAME = "font_cache.json"
+
+
+def font_cache_path() -> str:
+    """Файл кэша шрифтов рядом с настройками игры"""
+    return os.path.join(get_game_directory(), "resources", FONT_CACHE_FILE_NAME)
+
+
+class FontPathCache:
+    """
+    Пути к файлам системных шрифтов, сохраняемые между запусками.
+    pygame.font.SysFont при каждом запуске перечисляет все шрифты системы
+    (на Linux через fc-list); найденный один раз путь берется из файла.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or font_cache_path()
+        self._paths: Dict[str, Optional[str]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._paths = json.load(f)
+        except (IOError, json.JSONDecodeError):
+            self._paths = {}
+
+    def save(self) -> None:
+        """Сохраняет найденные пути, если появились новые"""
+        if not self._dirty:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._paths, f, ensure_ascii=False, indent=2)
+            self._dirty = False
+        except IOError:
+            print("Не удалось сохранить кэш шрифтов")
+
+    def resolve(self, family: str, bold: bool = False) -> Optional[str]:
+        """
+        Путь к файлу шрифта семейства family или None (шрифт pygame по умолчанию).
+        Поиск среди системных шрифтов выполняется только при промахе кэша.
+        """
+        key = f"{family.lower()}:{'bold' if bold else 'regular'}"
+        if key in self._paths:
+            path = self._paths[key]
+            if path is None or os.path.exists(path):
+                return path
+        path = pygame.font.match_font(family, bold=bold)
+        self._paths[key] = path
+        self._dirty = True
+        return path
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+def load_font(
+    cache: FontPathCache, family: str, size: int, bold: bool = False
+) -> pygame.font.Font:
+    """Создает шрифт как pygame.font.SysFont, но по пути из кэша"""
+    path = cache.resolve(family, bold)
+    font = pygame.font.Font(path, size)
+    if bold and (path is None or path == cache.resolve(family)):
+        # Жирного начертания нет - жирность имитируется, как в SysFont
+        font.set_bold(True)
+    return font
+
+
+class FontRegistry:
+    """Общие объекты шрифтов по ключу (семейство, размер, жирность)"""
+
+    def __init__(self, cache: Optional[FontPathCache] = None):
+        self.cache = cache if cache is not None else FontPathCache()
+        self._fonts: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+    def get(self, family: str, size: int, bold: bool = False) -> pygame.font.Font:
+        """Шрифт семейства family; создается при первом запросе"""
+        key = (family.lower(), size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self._fonts[key] = load_font(self.cache, family, size, bold)
+            self.cache.save()
+        return font
+
+    def first_available(
+        self, families: Iterable[str], size: int, bold: bool = False
+    ) -> Optional[pygame.font.Font]:
+        """Шрифт первого установленного в системе семейства или None"""
+        for family in families:
+            if self.cache.resolve(family, bold):
+                return self.get(family, size, bold)
+        self.cache.save()
+        return None
+
+    def clear(self) -> None:
+        """Забывает созданные шрифты (перед pygame.quit они становятся недействительны)"""
+        self._fonts.clear()
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+
+@lru_cache(maxsize=1)
+def default_font_registry() -> FontRegistry:
+    """Шрифты игры (один набор на процесс)"""
+    return FontRegistry()
@@ -0,0 +1,148 @@
+"""
+Призрак лучшей партии игры Арканоид
+Во время игры по кадрам записываются положение и ширина платформы
+и положение основного мяча. Запись лучших партий хранится рядом с таблицей
+рекордов (HighScoreManager), а в новой партии полупрозрачные платформа
+и мяч лучшей партии повторяют ее ход на том же уровне (параметр --ghost).
+
+Формат файла: заголовок, оглавление уровней (смещение и число кадров),
+затем кадры уровней подряд. Кадр - 4 разности с прошлым кадром по байту
+со знаком (x платформы, ширина платформы, x и y мяча); если разность
+не помещается в байт (подача мяча, начало уровня), пишется байт GHOST_ESCAPE
+и 4 абсолютных значения по 2 байта. Обычный кадр занимает 4 байта.
+Файл читается частями по мере игры, а не целиком.
+"""
+
+import struct
+from typing import BinaryIO, List, Optional, Tuple
+
+GHOST_MAGIC = b"ARKG"
+GHOST_VERSION = 1
+GHOST_HEADER = struct.Struct("<4sHH")  # Сигнатура, версия, число уровней
+GHOST_LEVEL = struct.Struct("<II")  # Смещение кадров уровня, число кадров
+GHOST_KEYFRAME = struct.Struct("<4h")  # Абсолютные значения кадра
+GHOST_ESCAPE = -128  # Первый байт кадра: дальше абсолютные значения
+GHOST_READ_SIZE = 4096  # Байт, читаемых с диска за раз
+
+GhostFrame = Tuple[int, int, int, int]  # x и ширина платформы, x и y мяча
+
+
+class GhostRecorder:
+    """Запись кадров партии по уровням в разностном виде"""
+
+    def __init__(self):
+        self.levels: List[bytearray] = []
+        self.frames: List[int] = []
+        self._last: Optional[GhostFrame] = None
+        self.next_level()
+
+    def next_level(self) -> None:
+        """Начинает кадры следующего уровня (первый кадр - абсолютный)"""
+        self.levels.append(bytearray())
+        self.frames.append(0)
+        self._last = None
+
+    def clear(self) -> None:
+        """Новая запись с первого уровня"""
+        self.levels.clear()
+        self.frames.clear()
+        self.next_level()
+
+    def record(
+        self, paddle_x: int, paddle_width: int, ball_x: int, ball_y: int
+    ) -> None:
+        """Добавляет кадр текущего уровня"""
+        frame = (int(paddle_x), int(paddle_width), int(ball_x), int(ball_y))
+        data = self.levels[-1]
+        last = self._last
+        if last is not None:
+            deltas = [value - previous for value, previous in zip(frame, last)]
+            if all(GHOST_ESCAPE < delta < 128 for delta in deltas):
+                data += struct.pack("<4b", *deltas)
+                self._last = frame
+                self.frames[-1] += 1
+                return
+        data += struct.pack("<b", GHOST_ESCAPE)
+        data += GHOST_KEYFRAME.pack(*frame)
+        self._last = frame
+        self.frames[-1] += 1
+
+    def to_bytes(self) -> bytes:
+        """Файл призрака"""
+        offset = GHOST_HEADER.size + GHOST_LEVEL.size * len(self.levels)
+        parts = [GHOST_HEADER.pack(GHOST_MAGIC, GHOST_VERSION, len(self.levels))]
+        for data, frames in zip(self.levels, self.frames):
+            parts.append(GHOST_LEVEL.pack(offset, frames))
+            offset += len(data)
+        parts.extend(bytes(data) for data in self.levels)
+        return b"".join(parts)
+
+
+class GhostReader:
+    """
+    Чтение кадров призрака с диска частями по GHOST_READ_SIZE байт.
+    start_level() переходит к кадрам уровня, next_frame() возвращает
+    очередной кадр или None, когда кадры уровня закончились.
+    """
+
+    def __init__(self, path: str):
+        self._file: Optional[BinaryIO] = open(path, "rb")
+        try:
+            magic, version, count = GHOST_HEADER.unpack(
+                self._file.read(GHOST_HEADER.size)
+            )
+            if magic != GHOST_MAGIC or version != GHOST_VERSION:
+                raise ValueError(f"Неподдерживаемый файл призрака: {path}")
+            self.levels = [
+                GHOST_LEVEL.unpack(self._file.read(GHOST_LEVEL.size))
+                for _ in range(count)
+            ]
+        except (struct.error, ValueError):
+            self.close()
+            raise ValueError(f"Поврежденный файл призрака: {path}")
+        self._buffer = b""
+        self._position = 0
+        self._frames_left = 0
+        self._frame: Optional[GhostFrame] = None
+
+    def start_level(self, level_index: int) -> None:
+        """Переходит к первому кадру уровня level_index"""
+        self._buffer = b""
+        self._position = 0
+        self._frame = None
+        if self._file is None or level_index >= len(self.levels):
+            self._frames_left = 0
+            return
+        offset, self._frames_left = self.levels[level_index]
+        self._file.seek(offset)
+
+    def _take(self, size: int) -> bytes:
+        """Следующие size байт кадров (дочитывает с диска по мере надобности)"""
+        end = self._position + size
+        if end > len(self._buffer):
+            rest = self._buffer[self._position :]
+            self._buffer = rest + self._file.read(max(GHOST_READ_SIZE, size))
+            self._position, end = 0, size
+        chunk = self._buffer[self._position : end]
+        self._position = end
+        return chunk
+
+    def next_frame(self) -> Optional[GhostFrame]:
+        """Очередной кадр уровня или None"""
+        if self._frames_left <= 0:
+            return None
+        self._frames_left -= 1
+        first = struct.unpack("<b", self._take(1))[0]
+        if first == GHOST_ESCAPE:
+            self._frame = GHOST_KEYFRAME.unpack(self._take(GHOST_KEYFRAME.size))
+        else:
+            deltas = (first, *struct.unpack("<3b", self._take(3)))
+            self._frame = tuple(
+                value + delta for value, delta in zip(self._frame, deltas)
+            )
+        return self._frame
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
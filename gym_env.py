@@ -0,0 +1,304 @@
+"""
+Среда обучения агентов игры Арканоид
+Интерфейс повторяет Gymnasium (reset, step, render; step возвращает
+наблюдение, награду, terminated, truncated и info), но сам пакет gymnasium
+не нужен. Правила игры - те же, что у игрового экрана GameScene: агент
+управляет платформой так же, как автопилот или запись партии.
+
+Наблюдение - словарь заранее выделенных массивов NumPy, которые
+заполняются на месте при каждом шаге (step возвращает те же объекты):
+    state  - float32[6]: x, y, скорость x, скорость y основного мяча,
+             центр и ширина платформы
+    bricks - bool[MAX]: живые кубики уровня (MAX - кубиков в самом большом
+             уровне набора)
+    pixels - uint8[H, W, 3] (с pixels=True): кадр низкого разрешения;
+             это представление pygame.surfarray.pixels3d внеэкранной
+             поверхности, кадр уменьшается прямо в нее
+
+Эпизод не начинается заново сам: шаг, закончивший партию, возвращает
+наблюдение и info ее итогового кадра, дальше нужен reset().
+VectorArkanoidEnv делает шаг сразу в нескольких средах; их наблюдения -
+строки общих массивов [число сред, ...].
+
+    env = ArkanoidEnv(seed=1)
+    obs, info = env.reset()
+    obs, reward, terminated, truncated, info = env.step(2)  # вправо
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from config import PADDLE_SPEED, SCREEN_HEIGHT, SCREEN_WIDTH
+
+ACTIONS = (0, -1, 1)  # Действие -> направление платформы: стоять, влево, вправо
+STATE_FIELDS = (
+    "ball_x",
+    "ball_y",
+    "ball_vel_x",
+    "ball_vel_y",
+    "paddle_x",
+    "paddle_width",
+)
+PIXEL_SIZE = (80, 60)  # Размер кадра наблюдения pixels (ширина, высота)
+MAX_EPISODE_STEPS = 20000  # Кадров до обрыва эпизода (truncated)
+RENDER_MODES = ("rgb_array", "human")
+
+
+def init_pygame(render_mode: Optional[str] = None) -> None:
+    """
+    Инициализирует pygame для среды. Без окна (render_mode не "human")
+    используется драйвер dummy; окно нужно спрайтам для convert().
+    """
+    if not pygame.get_init():
+        if render_mode != "human":
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+class ActionPilot:
+    """Управление платформой действием агента (как Autopilot и ReplayPilot)"""
+
+    def __init__(self):
+        self.direction = 0
+
+    def control(self, session) -> Tuple[int, int]:
+        """(сдвиг платформы, направление) на этот кадр"""
+        return self.direction * PADDLE_SPEED, self.direction
+
+
+class ArkanoidEnv:
+    """
+    Одна партия для обучения агента.
+    Эпизод - одна партия: terminated, когда потеряны все жизни или пройдены
+    все уровни; truncated - через max_steps кадров. Награда - очки за кадр.
+    Массивы наблюдения можно передать в out (строки массивов
+    VectorArkanoidEnv), тогда среда заполняет их без копирования.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        pixels: bool = False,
+        pixel_size: Tuple[int, int] = PIXEL_SIZE,
+        render_mode: Optional[str] = None,
+        max_steps: int = MAX_EPISODE_STEPS,
+        out: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        if render_mode is not None and render_mode not in RENDER_MODES:
+            raise ValueError(f"Неизвестный режим отрисовки: {render_mode}")
+        init_pygame(render_mode)
+        from PyGameBall import GameContext, GameScene
+        from fonts import default_font_registry
+        from levels import default_level_pack
+        from rng import RandomStreams
+
+        self._scene_class = GameScene
+        self._random_streams = RandomStreams
+        fonts = default_font_registry()
+        self.context = GameContext(
+            font=fonts.get("arial", 20),
+            big_font=fonts.get("arial", 42, bold=True),
+            fonts=fonts,
+            rng=RandomStreams(seed),
+            music_enabled=False,
+            sounds_loaded=True,  # Без звука: звуки не синтезируются
+        )
+        self.render_mode = render_mode
+        self.max_steps = max_steps
+        self.pilot = ActionPilot()
+        self.scene = GameScene(self.context, self.pilot, restart=False)
+        self.steps = 0
+
+        max_bricks = int(default_level_pack().index["bricks"].max())
+        out = {} if out is None else out
+        self.observation: Dict[str, np.ndarray] = {
+            "state": out.get("state", np.zeros(len(STATE_FIELDS), dtype=np.float32)),
+            "bricks": out.get("bricks", np.zeros(max_bricks, dtype=bool)),
+        }
+        self._frame: Optional[pygame.Surface] = None
+        self._small: Optional[pygame.Surface] = None
+        if pixels or render_mode is not None:
+            self._frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if pixels:
+            self._small = pygame.Surface(pixel_size)
+            # Представление пикселей поверхности (ширина, высота, 3),
+            # переставленное в привычный порядок (высота, ширина, 3)
+            self.observation["pixels"] = pygame.surfarray.pixels3d(
+                self._small
+            ).transpose(1, 0, 2)
+
+    @property
+    def session(self):
+        return self.scene.session
+
+    def _observe(self) -> Dict[str, np.ndarray]:
+        """Заполняет массивы наблюдения на месте"""
+        session = self.session
+        balls, paddle = session.balls, session.paddle
+        state = self.observation["state"]
+        index = balls.primary()
+        if index < 0:
+            state[:4] = 0
+        else:
+            state[0] = balls.x[index]
+            state[1] = balls.y[index]
+            state[2] = balls.vel_x[index]
+            state[3] = balls.vel_y[index]
+        state[4] = paddle.rect.centerx
+        state[5] = paddle.rect.width
+
+        mask = self.observation["bricks"]
+        alive = session.bricks.alive
+        mask[: len(alive)] = alive
+        mask[len(alive) :] = False
+
+        if self._small is not None:
+            self.scene.draw(self._frame)
+            pygame.transform.scale(self._frame, self._small.get_size(), self._small)
+        return self.observation
+
+    def _info(self) -> dict:
+        session = self.session
+        return {
+            "score": session.score,
+            "lives": session.lives_left,
+            "level": session.level_index,
+            "bricks_left": len(session.bricks),
+        }
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Dict[str, np.ndarray], dict]:
+        """Новая партия; с seed - с новым зерном генераторов"""
+        if seed is not None:
+            self.context.rng = self._random_streams(seed)
+            self.scene = self._scene_class(self.context, self.pilot, restart=False)
+        else:
+            self.scene.reset()
+        self.pilot.direction = 0
+        self.steps = 0
+        return self._observe(), self._info()
+
+    def step(
+        self, action: int
+    ) -> Tuple[Dict[str, np.ndarray], float, bool, bool, dict]:
+        """Один кадр игры с действием action (индекс в ACTIONS)"""
+        session = self.session
+        score = session.score
+        self.pilot.direction = ACTIONS[action]
+        self.scene.update()
+        self.steps += 1
+        # Партия окончена: экран остановлен на ее итоговом кадре (restart=False)
+        terminated = session.game_over
+        reward = float(session.score - score)
+        truncated = not terminated and self.steps >= self.max_steps
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def render(self) -> Optional[np.ndarray]:
+        """
+        "rgb_array" - кадр (высота, ширина, 3) во весь экран;
+        "human" - кадр в окне игры
+        """
+        if self.render_mode is None:
+            return None
+        self.scene.draw(self._frame)
+        if self.render_mode == "human":
+            pygame.display.get_surface().blit(self._frame, (0, 0))
+            pygame.display.flip()
+            return None
+        return pygame.surfarray.array3d(self._frame).transpose(1, 0, 2)
+
+    def close(self) -> None:
+        # Представление pixels3d держит поверхность заблокированной
+        self.observation.pop("pixels", None)
+        self._small = None
+        self._frame = None
+
+
+class VectorArkanoidEnv:
+    """
+    Несколько сред с общими массивами наблюдения [число сред, ...]:
+    каждая среда заполняет свою строку на месте. step() принимает
+    действие для каждой среды; закончившаяся партия сразу начинается
+    заново (как в векторных средах Gymnasium): наблюдение - уже новой партии,
+    info - итог оконченной.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        seed: Optional[int] = None,
+        pixels: bool = False,
+        pixel_size: Tuple[int, int] = PIXEL_SIZE,
+        max_steps: int = MAX_EPISODE_STEPS,
+    ):
+        init_pygame()
+        from levels import default_level_pack
+
+        max_bricks = int(default_level_pack().index["bricks"].max())
+        self.num_envs = num_envs
+        self.observation: Dict[str, np.ndarray] = {
+            "state": np.zeros((num_envs, len(STATE_FIELDS)), dtype=np.float32),
+            "bricks": np.zeros((num_envs, max_bricks), dtype=bool),
+        }
+        if pixels:
+            width, height = pixel_size
+            self.observation["pixels"] = np.zeros(
+                (num_envs, height, width, 3), dtype=np.uint8
+            )
+        self.envs: List[ArkanoidEnv] = [
+            ArkanoidEnv(
+                None if seed is None else seed + i,
+                pixels,
+                pixel_size,
+                max_steps=max_steps,
+                out={
+                    "state": self.observation["state"][i],
+                    "bricks": self.observation["bricks"][i],
+                },
+            )
+            for i in range(num_envs)
+        ]
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+
+    def _copy_pixels(self) -> None:
+        # Кадры сред лежат в разных поверхностях: копируется только
+        # уменьшенный кадр
+        if "pixels" in self.observation:
+            for i, env in enumerate(self.envs):
+                np.copyto(self.observation["pixels"][i], env.observation["pixels"])
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Dict[str, np.ndarray], list]:
+        infos = []
+        for i, env in enumerate(self.envs):
+            infos.append(env.reset(None if seed is None else seed + i)[1])
+        self._copy_pixels()
+        return self.observation, infos
+
+    def step(
+        self, actions: Sequence[int]
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, list]:
+        """Шаг во всех средах; массивы результата переиспользуются"""
+        infos = []
+        for i, env in enumerate(self.envs):
+            _, reward, terminated, truncated, info = env.step(int(actions[i]))
+            if terminated or truncated:
+                env.reset()
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+            infos.append(info)
+        self._copy_pixels()
+        return self.observation, self.rewards, self.terminated, self.truncated, infos
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
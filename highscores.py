@@ -6,7 +6,7 @@
 import json
 import os
 import sys
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 
 
@@ -51,11 +51,29 @@ def get_highscores_file_path():
 HIGHSCORES_FILE = get_highscores_file_path()
 
 
+def ghosts_directory() -> str:
+    """Каталог записей призраков рядом с файлом рекордов"""
+    return os.path.join(os.path.dirname(os.path.abspath(HIGHSCORES_FILE)), "ghosts")
+
+
 class HighScoreManager:
     def __init__(self):
-        self.highscores = []
+        # Номер версии рекордов: увеличивается при каждом изменении списка,
+        # по нему представление таблицы понимает, что пора перерисоваться
+        self.version = 0
+        self._highscores: List[Dict] = []
+        self._leaderboard = None
         self.load_highscores()
 
+    @property
+    def highscores(self) -> List[Dict]:
+        return self._highscores
+
+    @highscores.setter
+    def highscores(self, value: List[Dict]) -> None:
+        self._highscores = value
+        self.version += 1
+
     def load_highscores(self) -> None:
         """Загружает рекорды из файла"""
         try:
@@ -73,16 +91,23 @@ class HighScoreManager:
         except IOError:
             print("Ошибка сохранения рекордов")
 
-    def add_score(self, player_name: str, score: int, game_time_seconds: int) -> bool:
+    def add_score(
+        self,
+        player_name: str,
+        score: int,
+        game_time_seconds: int,
+        ghost: Optional[bytes] = None,
+    ) -> bool:
         """
         Добавляет новый результат в список рекордов
         Возвращает True если результат попал в топ-10 и сохранен, False если не попал
+        ghost - запись партии для призрака (ghost.GhostRecorder), сохраняется
+        отдельным файлом вместе с результатом
         """
-        # СТРОГОЕ ограничение диапазона очков от 0 до 50 баллов
-        if not (0 <= score <= 50):
-            raise ValueError(
-                f"Очки должны быть в диапазоне от 0 до 50. Получено: {score}"
-            )
+        # Очки не могут быть отрицательными; верхнего предела нет
+        # (наборы уровней, прочные кубики и мультимяч)
+        if score < 0:
+            raise ValueError(f"Очки не могут быть отрицательными. Получено: {score}")
 
         # Ограничиваем время до 59:59 (3599 секунд)
         if game_time_seconds > 3599:
@@ -121,11 +146,54 @@ class HighScoreManager:
                 break
 
         # Результат попал в топ-10, добавляем и сохраняем
+        if ghost:
+            new_score["ghost"] = self._save_ghost(ghost)
+        previous = list(self.highscores)
         self.highscores.append(new_score)
         self.sort_highscores()  # Теперь сортируем и обрезаем основной список
         self.save_highscores()
+        # Записи призраков результатов, выбывших из топ-10, больше не нужны
+        for score_data in previous:
+            if score_data not in self.highscores:
+                self._remove_ghost(score_data)
         return True
 
+    def ghost_path(self, score_data: Dict) -> Optional[str]:
+        """Путь к записи призрака результата или None, если записи нет"""
+        name = score_data.get("ghost")
+        if not name:
+            return None
+        path = os.path.join(ghosts_directory(), name)
+        return path if os.path.exists(path) else None
+
+    def best_ghost_path(self) -> Optional[str]:
+        """Запись призрака лучшего результата, у которого она есть"""
+        for score_data in self.highscores:
+            path = self.ghost_path(score_data)
+            if path is not None:
+                return path
+        return None
+
+    def _save_ghost(self, ghost: bytes) -> Optional[str]:
+        directory = ghosts_directory()
+        name = datetime.now().strftime("%Y%m%d_%H%M%S_%f") + ".ghost"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, name), "wb") as f:
+                f.write(ghost)
+        except IOError:
+            print("Ошибка сохранения записи призрака")
+            return None
+        return name
+
+    def _remove_ghost(self, score_data: Dict) -> None:
+        path = self.ghost_path(score_data)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     def sort_highscores(self) -> None:
         """Сортирует рекорды: сначала по очкам (по убыванию), затем по времени (по возрастанию), затем по имени"""
 
@@ -143,8 +211,7 @@ class HighScoreManager:
 
     def is_top_score(self, score: int) -> bool:
         """Проверяет, попадает ли результат в топ-10"""
-        # Сначала проверяем диапазон очков
-        if not (0 <= score <= 50):
+        if score < 0:
             return False
 
         if len(self.highscores) < 10:
@@ -155,45 +222,90 @@ class HighScoreManager:
             return True
         return False
 
+    def leaderboard(self) -> "Leaderboard":
+        """Представление таблицы рекордов для экрана и текстового вывода"""
+        if self._leaderboard is None:
+            self._leaderboard = Leaderboard(self)
+        return self._leaderboard
+
     def display_highscores(self) -> str:
         """Возвращает строку для отображения таблицы рекордов с заголовком для текстовых файлов"""
-        if not self.highscores:
-            return "Пока нет рекордов"
-
-        # Формируем полную таблицу с заголовком для текстовых файлов
-        result = "ТОП-10 РЕЗУЛЬТАТОВ:\n"
+        return self.leaderboard().text()
 
-        # Линия разделителя под заголовком (69 знаков равенства)
-        result += "=" * 69 + "\n"
 
-        # Заголовки колонок
-        result += "Место | Игрок                | Очки | Время  \n"
+# Линия разделителя таблицы (69 знаков равенства)
+HIGHSCORE_SEPARATOR = "=" * 69
+# Заголовки колонок текстовой таблицы
+HIGHSCORE_HEADER = "Место | Игрок                | Очки | Время  "
 
-        # Линия разделителя под заголовками (69 знаков равенства)
-        result += "=" * 69 + "\n"
 
-        # Данные с точным форматированием каждой колонки
-        for i, score_data in enumerate(self.highscores, 1):
-            # Форматирование места: точно как в правильном файле
-            if i < 10:
-                place = f"   {i}.  "  # 3 пробела + число + точка + 2 пробела
-            else:
-                place = f"  {i}.  "  # 2 пробела + число + точка + 2 пробела
-
-            # Форматирование имени игрока: 20 символов, выравнивание слева
-            player_name = score_data["player_name"]
-            player = f"{player_name[:20]:<20}"  # 20 символов, выравнивание слева
-
-            # Форматирование очков: точно 3 символа, выравнивание справа
-            score = f"{score_data['score']:>3}"  # 3 символа, выравнивание справа
+def format_highscore_row(place: int, score_data: Dict) -> str:
+    """
+    Строка таблицы рекордов, общая для экрана и текстового вывода:
+    место (7 символов), имя (20 символов, влево), очки (3 символа, вправо),
+    время (5 символов, вправо)
+    """
+    return "| ".join(
+        (
+            f"{place:>4}.  ",
+            f"{score_data['player_name'][:20]:<20}",
+            f"{score_data['score']:>3}  ",
+            f"{score_data['time_formatted']:>5}",
+        )
+    )
 
-            # Форматирование времени: 5 символов, выравнивание справа
-            time = (
-                f"{score_data['time_formatted']:>5}"  # 5 символов, выравнивание справа
-            )
 
-            # Собираем строку точно как в правильном файле
-            row = f"{place}| {player}| {score}  | {time}"
-            result += row + "\n"
+class Leaderboard:
+    """
+    Представление таблицы рекордов.
+    Строки таблицы и построенные из них виды (текст, поверхность экрана)
+    кэшируются и пересобираются, только когда меняется версия рекордов.
+    """
 
-        return result
+    def __init__(self, manager: HighScoreManager):
+        self.manager = manager
+        self.version = -1
+        self._rows: List[str] = []
+        self._views: Dict = {}
+
+    def _refresh(self) -> None:
+        """Сбрасывает кэш, если рекорды изменились"""
+        if self.version != self.manager.version:
+            self.version = self.manager.version
+            self._rows = [
+                format_highscore_row(place, score_data)
+                for place, score_data in enumerate(self.manager.get_top_scores(), 1)
+            ]
+            self._views.clear()
+
+    def rows(self) -> List[str]:
+        """Отформатированные строки таблицы"""
+        self._refresh()
+        return self._rows
+
+    def cached(self, key, build: Callable):
+        """
+        Возвращает вид таблицы по ключу key; build() вызывается
+        только при первом запросе после изменения рекордов
+        """
+        self._refresh()
+        if key not in self._views:
+            self._views[key] = build()
+        return self._views[key]
+
+    def text(self) -> str:
+        """Текстовая таблица с заголовком для текстовых файлов"""
+        return self.cached("text", self._build_text)
+
+    def _build_text(self) -> str:
+        rows = self.rows()
+        if not rows:
+            return "Пока нет рекордов"
+        lines = [
+            "ТОП-10 РЕЗУЛЬТАТОВ:",
+            HIGHSCORE_SEPARATOR,
+            HIGHSCORE_HEADER,
+            HIGHSCORE_SEPARATOR,
+            *rows,
+        ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,120 @@
+"""
+Панель состояния (HUD) игры Арканоид
+Строка «Уровень | Очки | Жизни | Скорость» и дополнительные поля
+(частота кадров, время партии, оставшиеся кубики) рисуются в поверхности
+один раз и перерисовываются только при изменении показываемых значений;
+в остальных кадрах поверхности только копируются на экран.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from config import SCREEN_WIDTH
+
+HUD_COLOR = (255, 255, 255)
+HUD_MARGIN = 20  # Отступ от правого и верхнего края экрана
+HUD_LINE_SPACING = 4
+
+# Дополнительные поля (параметр --hud): имя -> подпись
+HUD_OPTIONAL_FIELDS = {
+    "fps": "FPS",
+    "time": "Время",
+    "bricks": "Кубики",
+}
+
+
+def format_time(seconds: int) -> str:
+    """Время партии в виде М:СС"""
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class CachedText:
+    """Текст, который отрисовывается заново только при изменении значения"""
+
+    def __init__(self, font: pygame.font.Font, color=HUD_COLOR):
+        self.font = font
+        self.color = color
+        self.value = None
+        self.surface: Optional[pygame.Surface] = None
+        self.renders = 0  # Сколько раз текст отрисовывался (для тестов и замеров)
+
+    def get(self, value, text) -> pygame.Surface:
+        """
+        Поверхность для значения value; text - строка или функция,
+        которая строит строку (вызывается только при изменении значения)
+        """
+        if self.surface is None or value != self.value:
+            self.value = value
+            self.surface = self.font.render(
+                text() if callable(text) else text, True, self.color
+            )
+            self.renders += 1
+        return self.surface
+
+
+class Hud:
+    """
+    Панель состояния игрового экрана.
+    Основная строка прижата к правому верхнему углу; дополнительные поля
+    fields (из HUD_OPTIONAL_FIELDS) выводятся строкой ниже, каждое поле
+    кэшируется отдельно, поэтому, например, смена FPS не перерисовывает время.
+    """
+
+    def __init__(self, font: pygame.font.Font, fields: Iterable[str] = ()):
+        unknown = set(fields) - set(HUD_OPTIONAL_FIELDS)
+        if unknown:
+            raise ValueError(f"Неизвестные поля HUD: {', '.join(sorted(unknown))}")
+        self.font = font
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.main = CachedText(font)
+        self.extra: Dict[str, CachedText] = {
+            name: CachedText(font) for name in self.fields
+        }
+        self.separator = CachedText(font)
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        level: int,
+        score: int,
+        lives_left: int,
+        speed: int,
+        fps: float = 0.0,
+        elapsed: int = 0,
+        bricks_left: int = 0,
+    ) -> None:
+        """Рисует панель; текст перерисовывается только для изменившихся значений"""
+        values = (level, score, lives_left, speed)
+        surface = self.main.get(
+            values,
+            lambda: f"Уровень: {level} | Очки: {score} | Жизни: {lives_left} "
+            f"| Скорость: {speed} | ↑↓ - скорость",
+        )
+        x = SCREEN_WIDTH - surface.get_width() - HUD_MARGIN
+        screen.blit(surface, (x, HUD_MARGIN))
+        if not self.fields:
+            return
+
+        extra_values = {"fps": round(fps), "time": elapsed, "bricks": bricks_left}
+        parts = []
+        for name in self.fields:
+            value = extra_values[name]
+            parts.append(
+                self.extra[name].get(
+                    value,
+                    lambda: f"{HUD_OPTIONAL_FIELDS[name]}: "
+                    f"{format_time(value) if name == 'time' else value}",
+                )
+            )
+        separator = self.separator.get(None, " | ")
+
+        # Поля выводятся справа налево, чтобы строка была прижата к краю
+        x = SCREEN_WIDTH - HUD_MARGIN
+        y = HUD_MARGIN + surface.get_height() + HUD_LINE_SPACING
+        for index, part in enumerate(reversed(parts)):
+            if index:
+                x -= separator.get_width()
+                screen.blit(separator, (x, y))
+            x -= part.get_width()
+            screen.blit(part, (x, y))
@@ -0,0 +1,308 @@
+"""
+Анализ проходимости и сложности уровней игры Арканоид
+Каждый уровень из текстовых файлов играется автопилотом много раз
+без окна (правила игрового экрана GameScene, разные зерна), партии
+распределяются по процессам. По итогам строится отчет: доля пройденных
+партий, распределение времени прохождения, потерянные жизни, карта
+ударов по кубикам и кубики, которые не удалось разбить ни в одной партии
+(кандидаты в недостижимые).
+
+    python level_analyzer.py [КАТАЛОГ] [--runs N] [--workers N] [--output FILE]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+# Драйверы SDL выбираются при инициализации pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from bricks import BRICK_WALL
+from config import BRICK_COLS, FPS, LEVELS_DIR, resource_path
+from levels import WALL_CELL, Level, LevelPack, level_source_files, parse_level
+
+ANALYZER_RUNS = 20  # Партий на уровень по умолчанию
+ANALYZER_MAX_SECONDS = 300  # Партия дольше (игрового времени) считается непройденной
+# Доля ударов от наибольшей: пусто ... больше всех (без "=": так рисуется стена)
+HEATMAP_SHADES = " .:-+*#%@"
+UNBROKEN_CELL = "XX"  # Кубик не разбит ни в одной партии
+
+
+@dataclass
+class LevelRun:
+    """Итог одной партии на уровне"""
+
+    seed: int
+    cleared: bool
+    frames: int
+    lives_lost: int
+    hits: np.ndarray  # Ударов по каждому кубику (уменьшение прочности)
+    destroyed: np.ndarray  # Кубик разбит в этой партии
+
+    @property
+    def seconds(self) -> float:
+        return self.frames / FPS
+
+
+def simulate_level(level: Level, seed: int, max_frames: int) -> LevelRun:
+    """Одна партия автопилота на уровне level (без окна и звука)"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    from PyGameBall import GameContext, GameScene
+    from autopilot import AIM_OFFSETS, Autopilot
+    from rng import RandomStreams
+
+    font = pygame.font.Font(None, 20)  # Текст не рисуется, реестр шрифтов не нужен
+    context = GameContext(
+        font=font,
+        big_font=font,
+        rng=RandomStreams(seed),
+        music_enabled=False,
+        sounds_loaded=True,  # Без звука: звуки не синтезируются
+        level_pack=LevelPack.from_levels([level]),
+    )
+    # Партии отличаются не только бонусами: автопилот начинает с разных
+    # точек удара и направлений подачи
+    pilot = Autopilot()
+    pilot.aim_index = seed % len(AIM_OFFSETS)
+    pilot.serve_direction = 1 if seed // len(AIM_OFFSETS) % 2 else -1
+    # Экран останавливается на последнем кадре партии, а не начинает новую:
+    # удары и потерянные жизни этого кадра тоже учитываются
+    scene = GameScene(context, pilot, restart=False)
+    session = scene.session
+    bricks = session.bricks
+    hits = np.zeros(bricks.capacity, dtype=np.int32)
+    hp_before = bricks.hp.astype(np.int32)
+    lives_lost = 0
+
+    for frame in range(1, max_frames + 1):
+        lives = session.lives_left
+        scene.update()
+        hp = bricks.hp.astype(np.int32)
+        hits += np.maximum(hp_before - hp, 0)
+        hp_before = hp
+        lives_lost += max(0, lives - session.lives_left)
+        if session.game_over:
+            cleared = scene.last_cleared
+            return LevelRun(seed, cleared, frame, lives_lost, hits, ~bricks.alive)
+    return LevelRun(seed, False, max_frames, lives_lost, hits, ~bricks.alive)
+
+
+def _simulate_task(task: tuple) -> tuple:
+    index, level, seed, max_frames = task
+    return index, simulate_level(level, seed, max_frames)
+
+
+@dataclass
+class LevelReport:
+    """Итоги всех партий одного уровня"""
+
+    level: Level
+    runs: List[LevelRun] = field(default_factory=list)
+
+    @property
+    def cleared(self) -> List[LevelRun]:
+        return [run for run in self.runs if run.cleared]
+
+    def clear_times(self) -> np.ndarray:
+        """Время прохождения пройденных партий, с"""
+        return np.array([run.seconds for run in self.cleared])
+
+    def hits(self) -> np.ndarray:
+        """Ударов по каждому кубику за все партии"""
+        return np.sum([run.hits for run in self.runs], axis=0)
+
+    def walls(self) -> np.ndarray:
+        """Неразрушаемые кубики уровня"""
+        return self.level.bricks["kind"] == BRICK_WALL
+
+    def unbroken(self) -> np.ndarray:
+        """Разрушаемые кубики, не разбитые ни в одной партии"""
+        destroyed = np.any([run.destroyed for run in self.runs], axis=0)
+        return ~destroyed & ~self.walls()
+
+    def heatmap(self) -> List[str]:
+        """Карта ударов в формате сетки уровня (2 символа на клетку)"""
+        records = self.level.bricks
+        hits, walls, unbroken = self.hits(), self.walls(), self.unbroken()
+        rows = int(records["row"].max()) + 1 if len(records) else 0
+        grid = [["  "] * BRICK_COLS for _ in range(rows)]
+        most = max(int(hits.max()) if len(hits) else 0, 1)
+        for i, record in enumerate(records):
+            if walls[i]:
+                cell = WALL_CELL
+            elif unbroken[i]:
+                cell = UNBROKEN_CELL
+            else:
+                # Оттенок по доле ударов от самого битого кубика
+                shade = 1 + (len(HEATMAP_SHADES) - 2) * int(hits[i]) // most
+                cell = HEATMAP_SHADES[shade] * 2
+            grid[record["row"]][record["col"]] = cell
+        return ["|" + "".join(row) + "|" for row in grid]
+
+    def format(self) -> str:
+        """Раздел отчета об уровне (Markdown)"""
+        level = self.level
+        runs, cleared = len(self.runs), len(self.cleared)
+        lines = [
+            f"## {level.name} ({os.path.basename(level.source)})",
+            "",
+            f"- Пройдено: {cleared} из {runs} партий ({100 * cleared / runs:.0f}%)",
+        ]
+        times = self.clear_times()
+        if len(times):
+            low, median, high = np.percentile(times, (10, 50, 90))
+            lines.append(
+                f"- Время прохождения, с: мин {times.min():.1f}, "
+                f"10% {low:.1f}, медиана {median:.1f}, 90% {high:.1f}, "
+                f"макс {times.max():.1f}"
+            )
+        lives = np.array([run.lives_lost for run in self.runs])
+        lines.append(
+            f"- Потеряно жизней за партию: в среднем {lives.mean():.2f}, "
+            f"больше всего {lives.max()}"
+        )
+        unbroken = self.unbroken()
+        if unbroken.any():
+            cells = ", ".join(
+                f"ряд {record['row'] + 1} клетка {record['col'] + 1}"
+                for record in level.bricks[unbroken]
+            )
+            lines.append(f"- Не разбиты ни разу ({unbroken.sum()}): {cells}")
+        else:
+            lines.append("- Каждый разрушаемый кубик разбит хотя бы в одной партии")
+        lines += [
+            "",
+            f"Карта ударов (`{HEATMAP_SHADES[1:]}` - меньше ... больше, "
+            f"`{WALL_CELL}` - стена, `{UNBROKEN_CELL}` - не разбит):",
+            "",
+            "```",
+            *self.heatmap(),
+            "```",
+        ]
+        return "\n".join(lines)
+
+
+def load_levels(directory: str) -> List[Level]:
+    """Текстовые уровни каталога в порядке прохождения"""
+    levels = []
+    for path in level_source_files(directory):
+        with open(path, "r", encoding="utf-8") as f:
+            levels.append(parse_level(f.read(), path))
+    return levels
+
+
+def analyze_levels(
+    levels: Sequence[Level],
+    runs: int = ANALYZER_RUNS,
+    seed: int = 0,
+    max_seconds: int = ANALYZER_MAX_SECONDS,
+    workers: Optional[int] = None,
+) -> List[LevelReport]:
+    """
+    Играет runs партий на каждом уровне (зерна seed, seed + 1, ...)
+    в workers процессах (1 - в этом процессе)
+    """
+    reports = [LevelReport(level) for level in levels]
+    tasks = [
+        (index, level, seed + run, max_seconds * FPS)
+        for index, level in enumerate(levels)
+        for run in range(runs)
+    ]
+    if workers == 1:
+        results = map(_simulate_task, tasks)
+        for index, run in results:
+            reports[index].runs.append(run)
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            for index, run in executor.map(_simulate_task, tasks):
+                reports[index].runs.append(run)
+    return reports
+
+
+def format_report(reports: Sequence[LevelReport], seconds: float = 0.0) -> str:
+    """Отчет по всем уровням (Markdown)"""
+    runs = sum(len(report.runs) for report in reports)
+    lines = [
+        "# Анализ уровней",
+        "",
+        f"Уровней: {len(reports)}, партий: {runs}"
+        + (f", время анализа {seconds:.1f} с" if seconds else ""),
+    ]
+    for report in reports:
+        lines += ["", report.format()]
+    return "\n".join(lines) + "\n"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Разбор параметров командной строки"""
+    parser = argparse.ArgumentParser(description="Анализ проходимости уровней")
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=None,
+        help=f"каталог текстовых уровней (по умолчанию {LEVELS_DIR})",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=ANALYZER_RUNS,
+        metavar="N",
+        help=f"партий на уровень (по умолчанию {ANALYZER_RUNS})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="процессов (по умолчанию по числу ядер, 1 - без процессов)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, metavar="N", help="зерно первой партии"
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=int,
+        default=ANALYZER_MAX_SECONDS,
+        metavar="S",
+        help="предел игрового времени партии; дольше - уровень не пройден "
+        f"(по умолчанию {ANALYZER_MAX_SECONDS})",
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", help="файл отчета (по умолчанию вывод на экран)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    directory = args.directory or resource_path(LEVELS_DIR)
+    levels = load_levels(directory)
+    if not levels:
+        print(f"В каталоге {directory} нет уровней", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    reports = analyze_levels(
+        levels, args.runs, args.seed, args.max_seconds, args.workers
+    )
+    report = format_report(reports, time.perf_counter() - started)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"Отчет сохранен в {args.output}")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""
+Уровни игры Арканоид
+Уровни описываются текстовыми файлами resources/levels/*.txt
+и компилируются в один двоичный файл levels.bin, который
+загружается одним чтением и разбирается через numpy.frombuffer.
+
+Формат текстового файла:
+    # комментарий
+    name: Название уровня
+    r1 r1 .. g2 ...
+
+Каждая строка сетки - ряд кубиков (не более BRICK_COLS клеток),
+клетка - буква цвета из BRICK_PALETTE и код типа кубика:
+1 - обычный, 2 - прочный (2 удара), 3 - бронированный (3 удара);
+"==" - неразрушаемая стена, ".." - пустая клетка.
+"""
+
+import glob
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from bricks import (
+    BRICK_ARMORED,
+    BRICK_COLOR_KEYS,
+    BRICK_NORMAL,
+    BRICK_STRONG,
+    BRICK_WALL,
+    BrickStore,
+)
+from config import (
+    BRICK_COLS,
+    BRICK_HEIGHT,
+    BRICK_OFFSET_TOP,
+    BRICK_PADDING,
+    BRICK_ROWS,
+    BRICK_WIDTH,
+    LEVEL_MAX_ROWS,
+    LEVELS_DIR,
+    SCREEN_WIDTH,
+    resource_path,
+)
+
+EMPTY_CELL = ".."
+WALL_CELL = "=="
+# Код типа в клетке уровня -> индекс в BRICK_TYPES
+CELL_KINDS = {"1": BRICK_NORMAL, "2": BRICK_STRONG, "3": BRICK_ARMORED}
+PACK_FILE_NAME = "levels.bin"
+PACK_MAGIC = b"ARKL"
+PACK_VERSION = 3
+LEVEL_NAME_SIZE = 32  # Байт под название уровня в UTF-8
+LEVEL_SOURCE_SIZE = 64  # Байт под имя исходного файла уровня
+
+# Двоичный формат: заголовок, оглавление уровней, записи кубиков всех уровней подряд
+HEADER_DTYPE = np.dtype([("magic", "S4"), ("version", "<u2"), ("count", "<u2")])
+INDEX_DTYPE = np.dtype(
+    [
+        ("offset", "<u4"),
+        ("bricks", "<u2"),
+        ("name", f"S{LEVEL_NAME_SIZE}"),
+        ("source", f"S{LEVEL_SOURCE_SIZE}"),
+    ]
+)
+RECORD_DTYPE = np.dtype(
+    [("col", "u1"), ("row", "u1"), ("kind", "u1"), ("color", "u1")]
+)
+
+
+@dataclass
+class Level:
+    """Уровень: название, записи кубиков (массив RECORD_DTYPE) и имя исходного файла"""
+
+    name: str
+    bricks: np.ndarray
+    source: str = ""
+
+
+def grid_origin() -> tuple:
+    """Координаты левого верхнего кубика сетки (сетка выровнена по центру экрана)"""
+    start_x = (
+        SCREEN_WIDTH - (BRICK_COLS * BRICK_WIDTH + (BRICK_COLS - 1) * BRICK_PADDING)
+    ) // 2
+    return start_x, BRICK_OFFSET_TOP
+
+
+def parse_level(text: str, source: str = "<строка>") -> Level:
+    """Разбирает текстовое описание уровня"""
+    name = os.path.splitext(os.path.basename(source))[0]
+    records = []
+    row = 0
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("name:"):
+            name = line[len("name:") :].strip()
+            continue
+
+        if row >= LEVEL_MAX_ROWS:
+            raise ValueError(
+                f"{source}:{line_number}: больше {LEVEL_MAX_ROWS} рядов кубиков"
+            )
+        cells = line.split()
+        if len(cells) > BRICK_COLS:
+            raise ValueError(
+                f"{source}:{line_number}: больше {BRICK_COLS} клеток в ряду"
+            )
+        for col, cell in enumerate(cells):
+            if cell == EMPTY_CELL:
+                continue
+            if cell == WALL_CELL:
+                records.append((col, row, BRICK_WALL, 0))
+                continue
+            if (
+                len(cell) != 2
+                or cell[0] not in BRICK_COLOR_KEYS
+                or cell[1] not in CELL_KINDS
+            ):
+                raise ValueError(f"{source}:{line_number}: неверная клетка '{cell}'")
+            records.append(
+                (col, row, CELL_KINDS[cell[1]], BRICK_COLOR_KEYS.index(cell[0]))
+            )
+        row += 1
+
+    return Level(
+        name, np.array(records, dtype=RECORD_DTYPE), os.path.basename(source)
+    )
+
+
+def classic_level() -> Level:
+    """Стандартный уровень BRICK_ROWS x BRICK_COLS (если файлы уровней недоступны)"""
+    rows, cols = np.divmod(np.arange(BRICK_ROWS * BRICK_COLS), BRICK_COLS)
+    bricks = np.zeros(len(rows), dtype=RECORD_DTYPE)
+    bricks["col"] = cols
+    bricks["row"] = rows
+    bricks["kind"] = BRICK_NORMAL
+    bricks["color"] = rows % len(BRICK_COLOR_KEYS)
+    return Level("Классика", bricks)
+
+
+def compile_levels(levels: Sequence[Level]) -> bytes:
+    """Компилирует уровни в двоичный формат"""
+    header = np.array([(PACK_MAGIC, PACK_VERSION, len(levels))], dtype=HEADER_DTYPE)
+    index = np.zeros(len(levels), dtype=INDEX_DTYPE)
+    offset = 0
+    for i, level in enumerate(levels):
+        index[i] = (
+            offset,
+            len(level.bricks),
+            level.name.encode("utf-8")[:LEVEL_NAME_SIZE],
+            level.source.encode("utf-8")[:LEVEL_SOURCE_SIZE],
+        )
+        offset += len(level.bricks)
+
+    parts = [header.tobytes(), index.tobytes()]
+    parts.extend(level.bricks.astype(RECORD_DTYPE).tobytes() for level in levels)
+    return b"".join(parts)
+
+
+class LevelPack:
+    """
+    Набор уровней, разобранный из двоичных данных без копирования:
+    оглавление и записи кубиков - представления (views) над исходным буфером.
+    """
+
+    def __init__(self, data: bytes):
+        header = np.frombuffer(data, dtype=HEADER_DTYPE, count=1)[0]
+        if header["magic"] != PACK_MAGIC or header["version"] != PACK_VERSION:
+            raise ValueError("Неверный формат файла уровней")
+
+        count = int(header["count"])
+        self._data = data
+        self.index = np.frombuffer(
+            data, dtype=INDEX_DTYPE, count=count, offset=HEADER_DTYPE.itemsize
+        )
+        self.records = np.frombuffer(
+            data,
+            dtype=RECORD_DTYPE,
+            offset=HEADER_DTYPE.itemsize + INDEX_DTYPE.itemsize * count,
+        )
+
+    @classmethod
+    def from_levels(cls, levels: Sequence[Level]) -> "LevelPack":
+        return cls(compile_levels(levels))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def name(self, level_index: int) -> str:
+        """Название уровня"""
+        return self.index[level_index]["name"].decode("utf-8", errors="ignore")
+
+    def sources(self) -> List[str]:
+        """Имена исходных файлов уровней, из которых собран набор"""
+        return [
+            source.decode("utf-8", errors="ignore") for source in self.index["source"]
+        ]
+
+    def level_records(self, level_index: int) -> np.ndarray:
+        """Записи кубиков уровня (представление без копирования)"""
+        entry = self.index[level_index]
+        start = int(entry["offset"])
+        return self.records[start : start + int(entry["bricks"])]
+
+    def build(self, level_index: int) -> BrickStore:
+        """Создает хранилище кубиков для уровня"""
+        records = self.level_records(level_index)
+        return BrickStore.grid(
+            records["col"],
+            records["row"],
+            records["kind"],
+            records["color"],
+            origin=grid_origin(),
+            brick_size=(BRICK_WIDTH, BRICK_HEIGHT),
+            padding=BRICK_PADDING,
+        )
+
+
+def level_source_files(directory: str) -> List[str]:
+    """Текстовые файлы уровней в порядке прохождения (по имени файла)"""
+    return sorted(glob.glob(os.path.join(directory, "*.txt")))
+
+
+def compile_level_directory(directory: str) -> bytes:
+    """Компилирует все текстовые уровни каталога"""
+    levels = []
+    for path in level_source_files(directory):
+        with open(path, "r", encoding="utf-8") as f:
+            levels.append(parse_level(f.read(), path))
+    return compile_levels(levels)
+
+
+def read_level_pack(pack_path: str, sources: List[str]) -> Optional[LevelPack]:
+    """
+    Читает levels.bin, если он соответствует текстовым файлам уровней:
+    не старее их, собран из тех же файлов и в текущей версии формата.
+    Иначе возвращает None.
+    """
+    if not os.path.exists(pack_path):
+        return None
+    newest_source = max((os.path.getmtime(path) for path in sources), default=0)
+    if os.path.getmtime(pack_path) < newest_source:
+        return None
+
+    with open(pack_path, "rb") as f:
+        try:
+            pack = LevelPack(f.read())
+        except ValueError:
+            print("Файл уровней устарел и будет пересобран")
+            return None
+    # Без текстовых файлов (сборка игры) используется levels.bin как есть
+    if sources and pack.sources() != [os.path.basename(path) for path in sources]:
+        return None
+    return pack
+
+
+def load_level_pack(directory: str) -> LevelPack:
+    """
+    Загружает уровни из каталога.
+    Если levels.bin отсутствует, старее текстовых файлов, собран из другого
+    набора файлов или в старом формате, уровни компилируются заново
+    и (по возможности) сохраняются в levels.bin.
+    """
+    pack_path = os.path.join(directory, PACK_FILE_NAME)
+    sources = level_source_files(directory)
+    pack = read_level_pack(pack_path, sources)
+    if pack is not None:
+        return pack
+    if not sources:
+        return LevelPack.from_levels([classic_level()])
+
+    data = compile_level_directory(directory)
+    try:
+        with open(pack_path, "wb") as f:
+            f.write(data)
+    except IOError:
+        print("Не удалось сохранить скомпилированные уровни")
+    return LevelPack(data)
+
+
+@lru_cache(maxsize=1)
+def default_level_pack() -> LevelPack:
+    """Уровни игры из каталога ресурсов (загружаются один раз)"""
+    return load_level_pack(resource_path(LEVELS_DIR))
+
+
+if __name__ == "__main__":
+    # Компиляция уровней: python levels.py [каталог]
+    directory = sys.argv[1] if len(sys.argv) > 1 else LEVELS_DIR
+    data = compile_level_directory(directory)
+    with open(os.path.join(directory, PACK_FILE_NAME), "wb") as f:
+        f.write(data)
+    print(f"Скомпилировано уровней: {LevelPack(data).index.size} ({len(data)} байт)")
@@ -0,0 +1,125 @@
+"""
+Диагностика памяти игры Арканоид (--trace-memory)
+Снимки tracemalloc при каждом перезапуске партии и смене экрана:
+рост памяти между контрольными точками, строки кода с наибольшими
+выделениями и проверка предела роста памяти за долгий прогон.
+"""
+
+import tracemalloc
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+# Сколько последних контрольных точек хранится и выводится в отчете
+REPORT_CHECKPOINTS = 20
+
+# Выделения самого tracemalloc и механизма импорта в отчет не попадают
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryTracker:
+    """
+    Контрольные точки памяти.
+    checkpoint() отмечает смену экрана, restart() - перезапуск партии и делает
+    снимок. Рост считается от первого перезапуска после разогрева
+    (warmup перезапусков): за первую партию заполняются кэши уровней,
+    спрайтов и шрифтов, и этот рост утечкой не является.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        top: int = 10,
+        warmup: int = 1,
+        frames: int = 1,
+    ):
+        self.limit = limit  # Допустимый рост между перезапусками, байт
+        self.top = top
+        self.warmup = warmup
+        self.frames = frames  # Глубина стека для каждого выделения
+        self.restarts = 0
+        # Последние контрольные точки (метка, память, рост); хранятся не все,
+        # чтобы сам журнал не рос за долгий прогон
+        self.checkpoints: Deque[Tuple[str, int, int]] = deque(
+            maxlen=REPORT_CHECKPOINTS
+        )
+        self.checkpoint_count = 0
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_size = 0
+        self._last: Optional[tracemalloc.Snapshot] = None
+        self._last_size = 0
+        self._started = False
+
+    def start(self) -> None:
+        """Включает трассировку выделений памяти"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+
+    def stop(self) -> None:
+        """Выключает трассировку, если ее включил этот объект"""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def checkpoint(self, label: str) -> int:
+        """Отмечает контрольную точку. Возвращает рост памяти с прошлой точки"""
+        current = tracemalloc.get_traced_memory()[0]
+        delta = current - self.checkpoints[-1][1] if self.checkpoints else 0
+        self.checkpoints.append((label, current, delta))
+        self.checkpoint_count += 1
+        return delta
+
+    def restart(self) -> None:
+        """Перезапуск партии: контрольная точка и снимок выделений"""
+        self.checkpoint(f"перезапуск {self.restarts}")
+        self.restarts += 1
+        if self.restarts <= self.warmup:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        # Размер считается по снимку: без памяти, занятой самими снимками
+        size = sum(stat.size for stat in snapshot.statistics("filename"))
+        if self._baseline is None:
+            self._baseline, self._baseline_size = snapshot, size
+        self._last, self._last_size = snapshot, size
+
+    @property
+    def growth(self) -> int:
+        """Рост памяти от первого до последнего снимка перезапуска, байт"""
+        if self._baseline is None:
+            return 0
+        return self._last_size - self._baseline_size
+
+    def exceeded(self) -> bool:
+        """Память выросла больше допустимого"""
+        return self.limit is not None and self.growth > self.limit
+
+    def report(self) -> str:
+        """Отчет: контрольные точки, рост и строки кода с наибольшими выделениями"""
+        limit = "" if self.limit is None else f", предел {self.limit / 1024:.0f} КБ"
+        lines = [
+            f"Память: перезапусков {self.restarts}, "
+            f"рост после разогрева {self.growth / 1024:+.1f} КБ{limit}"
+        ]
+        if len(self.checkpoints) < self.checkpoint_count:
+            lines.append(f"Последние {len(self.checkpoints)} контрольных точек:")
+        for label, current, delta in self.checkpoints:
+            lines.append(f"  {current / 1024:10.1f} КБ {delta / 1024:+9.1f} КБ  {label}")
+
+        if self._last is not None and self._last is not self._baseline:
+            lines.append("Наибольший рост после разогрева:")
+            stats = self._last.compare_to(self._baseline, "lineno")
+        elif tracemalloc.is_tracing():
+            lines.append("Наибольшие выделения:")
+            snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+            stats = snapshot.statistics("lineno")
+        else:
+            stats = []
+        lines.extend(f"  {stat}" for stat in stats[: self.top])
+        if self.exceeded():
+            lines.append("ОШИБКА: рост памяти превысил предел")
+        return "\n".join(lines)
@@ -0,0 +1,78 @@
+"""
+Запись партии игры Арканоид
+Партия полностью определяется зерном генераторов случайных чисел (--seed)
+и вводом игрока: для каждого кадра записываются сдвиг платформы,
+направление (запуск мяча) и скорость мяча. Воспроизведение подает
+записанный ввод кадр за кадром, и партия повторяется (см. export.py).
+"""
+
+import json
+from typing import List, Optional, Tuple
+
+REPLAY_VERSION = 1  # Версия формата файла записи
+
+
+class Replay:
+    """Зерно партии и ввод по кадрам: (сдвиг платформы, направление, скорость)"""
+
+    def __init__(
+        self, seed: int, frames: Optional[List[Tuple[int, int, int]]] = None
+    ):
+        self.seed = seed
+        self.frames = frames if frames is not None else []
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def keyframe_due(self) -> bool:
+        """Опорных кадров в этом формате нет (см. chunked_replay.py)"""
+        return False
+
+    def record(self, travel: int, direction: int, speed: int) -> None:
+        """Добавляет ввод очередного кадра"""
+        self.frames.append((int(travel), int(direction), int(speed)))
+
+    def save(self, path: str) -> None:
+        """Сохраняет запись в файл JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": REPLAY_VERSION, "seed": self.seed, "frames": self.frames},
+                f,
+                separators=(",", ":"),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """Загружает запись из файла JSON"""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Неподдерживаемая версия записи: {data.get('version')}")
+        return cls(data["seed"], [tuple(frame) for frame in data["frames"]])
+
+
+class ReplayPilot:
+    """
+    Управление платформой по записи партии (вместо игрока или автопилота).
+    control() возвращает записанный ввод очередного кадра и выставляет
+    записанную скорость мяча.
+    """
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.frame = 0  # Номер следующего кадра записи
+
+    @property
+    def finished(self) -> bool:
+        """Весь записанный ввод воспроизведен"""
+        return self.frame >= len(self.replay)
+
+    def control(self, session) -> Tuple[int, int]:
+        """(сдвиг платформы, направление) на этот кадр"""
+        if self.finished:
+            return 0, 0
+        travel, direction, speed = self.replay.frames[self.frame]
+        self.frame += 1
+        if session.balls.get_speed() != speed:
+            session.balls.set_speed(speed)
+        return travel, direction
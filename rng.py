@@ -0,0 +1,111 @@
+"""
+Генераторы случайных чисел игры Арканоид
+Вместо общего модуля random у каждой подсистемы (физика, звук, эффекты)
+свой генератор, полученный из одного зерна: партия воспроизводится
+по зерну (параметр --seed), а параллельные прогоны не делят скрытое
+глобальное состояние.
+"""
+
+import random
+import secrets
+from typing import Optional
+
+# Подсистемы с генераторами random.Random (атрибуты RandomStreams); пулы
+# с векторной генерацией получают генераторы NumPy через RandomStreams.numpy()
+SUBSYSTEMS = ("physics", "audio")
+
+
+def new_seed() -> int:
+    """Случайное зерно для новой игры"""
+    return secrets.randbits(32)
+
+
+class RandomStreams:
+    """
+    Генераторы random.Random по подсистемам:
+    physics - направление подачи мяча (влияет на игру),
+    audio - выбор звука удара. Выпадение бонусов и разлет осколков берут
+    генераторы NumPy numpy("physics") и numpy("effects").
+    Генератор каждой подсистемы зависит только от зерна и имени подсистемы,
+    поэтому, например, отключение звука не меняет ход партии.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = new_seed() if seed is None else int(seed)
+        self.physics = self.stream("physics")
+        self.audio = self.stream("audio")
+
+    def stream(self, name: str) -> random.Random:
+        """Новый генератор подсистемы name в начальном состоянии"""
+        return random.Random(f"{self.seed}:{name}")
+
+    def numpy(self, name: str):
+        """
+        Генератор NumPy подсистемы name для пулов с векторной генерацией
+        (частицы, бонусы). Для одного зерна и имени всегда одинаков.
+        """
+        import numpy as np  # NumPy загружается только вместе с игровым экраном
+
+        return np.random.default_rng(self.stream(name).getrandbits(64))
+
+    def copy(self) -> "RandomStreams":
+        """Копия с тем же зерном и состоянием всех генераторов"""
+        clone = RandomStreams(self.seed)
+        clone.copy_from(self)
+        return clone
+
+    def copy_from(self, other: "RandomStreams") -> None:
+        """Переносит зерно и состояние генераторов other на месте"""
+        self.seed = other.seed
+        for name in SUBSYSTEMS:
+            getattr(self, name).setstate(getattr(other, name).getstate())
+
+
+def random_state_array(generator: random.Random):
+    """Состояние генератора random.Random массивом NumPy (опорные кадры записи)"""
+    import numpy as np
+
+    # Игра не вызывает gauss(), поэтому третий элемент состояния всегда None
+    return np.array(generator.getstate()[1], dtype=np.uint32)
+
+
+def set_random_state_array(generator: random.Random, state) -> None:
+    """Восстанавливает состояние random_state_array() в generator"""
+    version = generator.getstate()[0]
+    generator.setstate((version, tuple(int(value) for value in state), None))
+
+
+def numpy_state_array(generator):
+    """Состояние генератора NumPy (PCG64) массивом из шести uint64"""
+    import numpy as np
+
+    state = generator.bit_generator.state
+    mask = (1 << 64) - 1
+    value, increment = state["state"]["state"], state["state"]["inc"]
+    return np.array(
+        [
+            value >> 64,
+            value & mask,
+            increment >> 64,
+            increment & mask,
+            state["has_uint32"],
+            state["uinteger"],
+        ],
+        dtype=np.uint64,
+    )
+
+
+def set_numpy_state_array(generator, state) -> None:
+    """Восстанавливает состояние numpy_state_array() в generator"""
+    high, low, increment_high, increment_low, has_uint32, uinteger = (
+        int(value) for value in state
+    )
+    generator.bit_generator.state = {
+        "bit_generator": generator.bit_generator.state["bit_generator"],
+        "state": {
+            "state": high << 64 | low,
+            "inc": increment_high << 64 | increment_low,
+        },
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
@@ -36,6 +36,13 @@ def build_executable():
         build_dir = os.path.join(project_root, "build")
         os.makedirs(build_dir, exist_ok=True)
 
+        # Компилируем уровни в levels.bin, чтобы игра не разбирала текстовые файлы при запуске
+        subprocess.run(
+            [sys.executable, "levels.py", os.path.join("resources", "levels")],
+            cwd=project_root,
+            check=True,
+        )
+
         # Запускаем PyInstaller
         cmd = [
             "pyinstaller",
@@ -61,6 +68,14 @@ def build_executable():
             "pygame",
             "--hidden-import",
             "numpy",
+            # Модули, загружаемые через startup.lazy_import: PyInstaller
+            # не видит их в операторах import
+            "--hidden-import",
+            "effects",
+            "--hidden-import",
+            "levels",
+            "--hidden-import",
+            "trajectory",
             "--exclude-module",
             "tkinter",
             "--exclude-module",
@@ -0,0 +1,234 @@
+"""
+Состояние одной партии игры Арканоид
+Все изменяемое состояние игры собрано в одном объекте GameSession
+вместо кортежа из девяти значений, который передавался между функциями.
+Объекты партии (платформа, пул мячей, кубики, бонусы, шлейф) создаются
+один раз и при перезапуске сбрасываются на месте.
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+from balls import BallPool
+from config import MAX_LIVES
+from effects import PowerUpPool
+from entities import Paddle
+from levels import LevelPack, default_level_pack
+from rng import RandomStreams, random_state_array, set_random_state_array
+
+TRAIL_LENGTH = 20  # Позиций мяча в шлейфе
+
+
+class GameSession:
+    """
+    Партия: платформа, мячи, кубики текущего уровня, бонусы, счет и жизни.
+    snapshot()/restore() сохраняют и возвращают состояние целиком
+    (быстрый перезапуск, повторы), copy() дает независимую партию
+    для перебора ходов ботом. Случайность партии берется из генераторов
+    rng, поэтому партия с тем же зерном (seed) и вводом повторяется.
+    """
+
+    __slots__ = (
+        "level_pack",
+        "paddle",
+        "balls",
+        "bricks",
+        "powerups",
+        "level_index",
+        "score",
+        "lives_left",
+        "game_over",
+        "game_started",
+        "ball_trail",
+        "trail_ball",
+        "start_time",
+        "rng",
+        "_first_level",
+    )
+
+    def __init__(
+        self,
+        level_pack: Optional[LevelPack] = None,
+        powerups: Optional[PowerUpPool] = None,
+        rng: Optional[RandomStreams] = None,
+    ):
+        # Генераторы случайных чисел партии; зерно воспроизводит партию
+        self.rng = RandomStreams() if rng is None else rng
+        if level_pack is None:
+            level_pack = default_level_pack()
+        self.level_pack = level_pack
+        # Исходное состояние первого уровня: из него кубики восстанавливаются
+        # при перезапуске без повторного разбора уровня
+        self._first_level = self.level_pack.build(0)
+        self.paddle = Paddle()
+        # Все мячи (включая бонусные) хранятся в одном пуле
+        self.balls = BallPool(rng=self.rng.physics)
+        self.bricks = self._first_level.copy()
+        if powerups is None:
+            powerups = PowerUpPool(rng=self.rng.numpy("physics"))
+        self.powerups = powerups
+        self.ball_trail = deque(maxlen=TRAIL_LENGTH)  # Позиции мяча для шлейфа
+        self.reset()
+
+    def reset(self, ball_speed: Optional[int] = None) -> None:
+        """Начинает новую партию с первого уровня (объекты переиспользуются)"""
+        if ball_speed is not None:
+            self.balls.set_speed(ball_speed)
+        self.bricks.copy_from(self._first_level)
+        self.level_index = 0
+        self.score = 0
+        self.lives_left = MAX_LIVES
+        self.game_over = False
+        self.start_time = time.time()  # Отсчет времени игры
+        self._serve_level()
+
+    def _serve_level(self) -> None:
+        """Платформа в центре, мяч на платформе, бонусы убраны"""
+        self.powerups.clear()
+        self.paddle.reset()
+        self.serve()
+
+    def serve(self) -> None:
+        """Мяч на платформе в ожидании запуска"""
+        self.balls.serve(self.paddle.rect)
+        self.trail_ball = self.balls.primary()
+        self.ball_trail.clear()
+        self.game_started = False
+
+    @property
+    def seed(self) -> int:
+        """Зерно генераторов случайных чисел партии"""
+        return self.rng.seed
+
+    def has_next_level(self) -> bool:
+        return self.level_index + 1 < len(self.level_pack)
+
+    def next_level(self) -> None:
+        """Переход на следующий уровень"""
+        self.level_index += 1
+        self.bricks.copy_from(self.level_pack.build(self.level_index))
+        self._serve_level()
+
+    def elapsed_seconds(self) -> int:
+        """Время партии в секундах"""
+        return int(time.time() - self.start_time)
+
+    def copy(self) -> "GameSession":
+        """
+        Независимая копия партии. Набор уровней и неизменяемые массивы
+        кубиков общие, поэтому копия дешевая.
+        """
+        clone = object.__new__(GameSession)
+        clone.level_pack = self.level_pack
+        clone._first_level = self._first_level
+        clone.rng = self.rng.copy()
+        clone.paddle = self.paddle.copy()
+        clone.balls = self.balls.copy()
+        clone.balls.rng = clone.rng.physics
+        clone.bricks = self.bricks.copy()
+        clone.powerups = self.powerups.copy()
+        clone.ball_trail = deque(self.ball_trail, maxlen=TRAIL_LENGTH)
+        clone.level_index = self.level_index
+        clone.score = self.score
+        clone.lives_left = self.lives_left
+        clone.game_over = self.game_over
+        clone.game_started = self.game_started
+        clone.trail_ball = self.trail_ball
+        clone.start_time = self.start_time
+        return clone
+
+    def copy_from(self, other: "GameSession") -> None:
+        """Переносит состояние other в эту партию на месте"""
+        self.level_pack = other.level_pack
+        self._first_level = other._first_level
+        self.rng.copy_from(other.rng)
+        self.paddle.copy_from(other.paddle)
+        self.balls.copy_from(other.balls)
+        self.bricks.copy_from(other.bricks)
+        self.powerups.copy_from(other.powerups)
+        self.ball_trail.clear()
+        self.ball_trail.extend(other.ball_trail)
+        self.level_index = other.level_index
+        self.score = other.score
+        self.lives_left = other.lives_left
+        self.game_over = other.game_over
+        self.game_started = other.game_started
+        self.trail_ball = other.trail_ball
+        self.start_time = other.start_time
+
+    def snapshot(self) -> "GameSession":
+        """Снимок состояния для restore()"""
+        return self.copy()
+
+    def restore(self, snapshot: "GameSession") -> None:
+        """Возвращает партию к снимку; объекты партии не пересоздаются"""
+        self.copy_from(snapshot)
+
+    def keyframe(self) -> Dict[str, np.ndarray]:
+        """
+        Опорный кадр записи партии (chunked_replay.py): состояние, от которого
+        партия продолжается так же, массивами NumPy. Шлейф мяча не входит.
+        """
+        rect = self.paddle.rect
+        state = {
+            "session": np.array(
+                [
+                    self.level_index,
+                    self.score,
+                    self.lives_left,
+                    self.game_over,
+                    self.game_started,
+                    self.trail_ball,
+                    rect.x,
+                    rect.y,
+                    rect.width,
+                    rect.height,
+                    self.paddle.wide_frames,
+                ],
+                dtype=np.int64,
+            ),
+            "rng.physics": random_state_array(self.rng.physics),
+        }
+        for prefix, pool in (
+            ("balls.", self.balls),
+            ("bricks.", self.bricks),
+            ("powerups.", self.powerups),
+        ):
+            for name, array in pool.state_arrays().items():
+                state[prefix + name] = array
+        return state
+
+    def restore_keyframe(self, state: Dict[str, np.ndarray]) -> None:
+        """Возвращает партию к опорному кадру keyframe() на месте"""
+        (
+            level_index,
+            self.score,
+            self.lives_left,
+            game_over,
+            game_started,
+            self.trail_ball,
+            *paddle,
+            self.paddle.wide_frames,
+        ) = state["session"].tolist()
+        if level_index != self.level_index:
+            self.level_index = level_index
+            self.bricks.copy_from(self.level_pack.build(level_index))
+        self.game_over, self.game_started = bool(game_over), bool(game_started)
+        self.paddle.rect.update(*paddle)
+        set_random_state_array(self.rng.physics, state["rng.physics"])
+        for prefix, pool in (
+            ("balls.", self.balls),
+            ("bricks.", self.bricks),
+            ("powerups.", self.powerups),
+        ):
+            pool.restore_arrays(
+                {
+                    name[len(prefix) :]: array
+                    for name, array in state.items()
+                    if name.startswith(prefix)
+                }
+            )
+        self.ball_trail.clear()
@@ -8,6 +8,8 @@ import os
 import sys
 from typing import Dict
 
+from config import FRAME_PACING_MODES
+
 
 def get_game_directory():
     """
@@ -75,3 +77,17 @@ class SettingsManager:
             self.save_settings()
         else:
             raise ValueError("Скорость мяча должна быть в диапазоне от 1 до 10")
+
+    def get_frame_pacing(self) -> str:
+        """Возвращает режим темпа кадров (tick, busy, vsync, uncapped)"""
+        pacing = self.settings.get("frame_pacing", "tick")
+        return pacing if pacing in FRAME_PACING_MODES else "tick"
+
+    def set_frame_pacing(self, pacing: str) -> None:
+        """Устанавливает режим темпа кадров (применяется при следующем запуске)"""
+        if pacing not in FRAME_PACING_MODES:
+            raise ValueError(
+                f"Режим темпа кадров должен быть одним из: {', '.join(FRAME_PACING_MODES)}"
+            )
+        self.settings["frame_pacing"] = pacing
+        self.save_settings()
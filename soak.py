@@ -0,0 +1,92 @@
+"""
+Долгий прогон игры Арканоид (--autoplay --games N)
+Автопилот играет N партий подряд; по итогам выводится частота кадров,
+рост памяти и все исключения, возникшие во время прогона.
+"""
+
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from engine import SceneManager
+
+MAX_SOAK_ERRORS = 100  # После стольких исключений прогон прерывается
+MAX_GAME_FRAMES = 60 * 60 * 60  # Партия дольше часа игрового времени считается зависшей
+
+
+@dataclass
+class SoakReport:
+    """Итоги прогона"""
+
+    games: int = 0
+    frames: int = 0
+    seconds: float = 0.0
+    # Блоки памяти интерпретатора (sys.getallocatedblocks) после первого кадра
+    # и в конце прогона: счетчик дешевый и не замедляет игру
+    blocks_start: int = 0
+    blocks_end: int = 0
+    errors: List[str] = field(default_factory=list)
+    seed: Optional[int] = None  # Зерно случайных чисел: повтор прогона с --seed
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+
+    @property
+    def blocks_growth(self) -> int:
+        return self.blocks_end - self.blocks_start
+
+    def format(self) -> str:
+        """Текст отчета"""
+        lines = [
+            f"Партий: {self.games}",
+            f"Кадров: {self.frames} за {self.seconds:.1f} с ({self.fps:.1f} FPS)",
+            f"Блоков памяти: {self.blocks_start} -> {self.blocks_end} "
+            f"(рост {self.blocks_growth:+d})",
+            f"Исключений: {len(self.errors)}",
+        ]
+        if self.seed is not None:
+            lines.insert(0, f"Зерно: {self.seed}")
+        lines.extend(self.errors)
+        return "\n".join(lines)
+
+
+def run_soak(manager: SceneManager, scene, games: int) -> SoakReport:
+    """
+    Играет games партий на экране scene (GameScene с автопилотом).
+    Исключение в кадре записывается в отчет, и партия начинается заново.
+    """
+    report = SoakReport()
+    manager.push(scene)
+    manager.running = True
+    manager.step()
+    first_frame = manager.frame_count
+    report.blocks_start = sys.getallocatedblocks()
+    started = time.perf_counter()
+    game_started_frame = manager.frame_count
+
+    while manager.running and scene.games_played < games:
+        played = scene.games_played
+        try:
+            manager.step()
+        except Exception:
+            report.errors.append(traceback.format_exc())
+            if len(report.errors) >= MAX_SOAK_ERRORS:
+                break
+            scene.reset()
+        if scene.games_played != played:
+            game_started_frame = manager.frame_count
+        elif manager.frame_count - game_started_frame > MAX_GAME_FRAMES:
+            report.errors.append(
+                f"Партия {played + 1} не закончилась за {MAX_GAME_FRAMES} кадров"
+            )
+            scene.reset()
+            game_started_frame = manager.frame_count
+
+    report.seconds = time.perf_counter() - started
+    report.frames = manager.frame_count - first_frame
+    report.games = scene.games_played
+    report.blocks_end = sys.getallocatedblocks()
+    return report
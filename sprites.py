@@ -0,0 +1,246 @@
+"""
+Кэш заранее отрисованных спрайтов игры Арканоид
+Платформа и мяч рисуются один раз в отдельные поверхности,
+а в игровом цикле только копируются на экран через blit.
+Кубики рисуются из атласа BrickAtlas одним вызовом Surface.blits()
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+# Цвета секций платформы: красный - отскок влево, белый - прямо, синий - вправо
+PADDLE_SECTION_COLORS = ((255, 0, 0), (240, 240, 240), (0, 0, 255))
+
+# Цвет мяча
+BALL_COLOR = (230, 90, 90)
+
+BRICK_ATLAS_WIDTH = 512  # Ширина атласа кубиков; высота растет по мере надобности
+BRICK_BORDER_WIDTH = 2  # Толщина рамки кубика
+GHOST_ALPHA = 90  # Прозрачность призрака лучшей партии (0 - невидим, 255 - непрозрачен)
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+    """Приводит поверхность к формату экрана, если окно уже создано"""
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if alpha else surface.convert()
+    return surface
+
+
+def render_paddle(width: int, height: int) -> pygame.Surface:
+    """Рисует платформу с цветными секциями для подсказки направления отскока"""
+    surface = pygame.Surface((width, height))
+    third = width // 3
+    sections = (
+        pygame.Rect(0, 0, third, height),
+        pygame.Rect(third, 0, third, height),
+        pygame.Rect(2 * third, 0, width - 2 * third, height),
+    )
+    for color, rect in zip(PADDLE_SECTION_COLORS, sections):
+        pygame.draw.rect(surface, color, rect)
+    return _to_display_format(surface, alpha=False)
+
+
+def render_ball(width: int, height: int, color=BALL_COLOR) -> pygame.Surface:
+    """Рисует мяч на прозрачном фоне"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.ellipse(surface, color, surface.get_rect())
+    return _to_display_format(surface, alpha=True)
+
+
+def render_capsule(width: int, height: int, color) -> pygame.Surface:
+    """Рисует капсулу бонуса со светлой рамкой"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    rect = surface.get_rect()
+    pygame.draw.rect(surface, color, rect, border_radius=height // 2)
+    pygame.draw.rect(surface, (255, 255, 255), rect, 1, border_radius=height // 2)
+    return _to_display_format(surface, alpha=True)
+
+
+def render_particle(size: int, color) -> pygame.Surface:
+    """Рисует частицу: квадрат, залитый цветом"""
+    surface = pygame.Surface((size, size))
+    surface.fill(color)
+    return _to_display_format(surface, alpha=False)
+
+
+def render_brick(width: int, height: int, color) -> pygame.Surface:
+    """Рисует кубик: заливка цветом и темная рамка (как pygame.draw.rect)"""
+    from bricks import BRICK_BORDER_COLOR  # NumPy загружается вместе с уровнями
+
+    surface = pygame.Surface((width, height))
+    rect = surface.get_rect()
+    pygame.draw.rect(surface, color, rect)
+    pygame.draw.rect(surface, BRICK_BORDER_COLOR, rect, BRICK_BORDER_WIDTH)
+    return surface
+
+
+class BrickAtlas:
+    """
+    Атлас спрайтов кубиков: каждый вариант (цвет, размер) рисуется один раз
+    в общую поверхность, варианты укладываются рядами слева направо.
+    Поле кубиков рисуется одним вызовом Surface.blits() со списком
+    (атлас, позиция кубика, область спрайта в атласе); список собирается
+    заново, только когда кубики изменились (BrickStore.version).
+    """
+
+    def __init__(self, width: int = BRICK_ATLAS_WIDTH):
+        self.initial_width = width
+        self.clear()
+
+    def __len__(self) -> int:
+        """Количество вариантов кубиков в атласе"""
+        return len(self._areas)
+
+    def area(self, color, width: int, height: int) -> pygame.Rect:
+        """Область спрайта кубика в атласе; спрайт рисуется при первом запросе"""
+        key = (*color, width, height)
+        area = self._areas.get(key)
+        if area is None:
+            area = self._areas[key] = self._add(render_brick(width, height, color))
+        return area
+
+    def _add(self, sprite: pygame.Surface) -> pygame.Rect:
+        """Помещает спрайт в атлас, при необходимости увеличивая атлас"""
+        width, height = sprite.get_size()
+        x, y = self._cursor
+        if x + width > self.width and x > 0:
+            # Новый ряд
+            x, y = 0, y + self._row_height
+            self._row_height = 0
+        self._row_height = max(self._row_height, height)
+        self._reserve(max(self.width, x + width), y + self._row_height)
+        self.surface.blit(sprite, (x, y))
+        self._cursor = (x + width, y)
+        return pygame.Rect(x, y, width, height)
+
+    def _reserve(self, width: int, height: int) -> None:
+        """Увеличивает атлас до размера не меньше width x height"""
+        if (
+            self.surface is not None
+            and self.surface.get_width() >= width
+            and self.surface.get_height() >= height
+        ):
+            return
+        old = self.surface
+        if old is not None:
+            # Высота удваивается, чтобы атлас перевыделялся редко
+            height = max(height, 2 * old.get_height())
+        self.width = max(self.width, width)
+        surface = _to_display_format(pygame.Surface((self.width, height)), alpha=False)
+        if old is not None:
+            surface.blit(old, (0, 0))
+        self.surface = surface
+
+    def blits(self, bricks) -> List[tuple]:
+        """Список для Surface.blits(): оставшиеся кубики BrickStore"""
+        key = (bricks, bricks.version)
+        if self._blits_key is None or key != self._blits_key:
+            import numpy as np  # Кубики хранятся в массивах NumPy (bricks.py)
+
+            alive = bricks.alive_indices()
+            # Вариант кубика (цвет, ширина, высота) одним числом: область
+            # в атласе ищется один раз на вариант, а не на каждый кубик
+            color = bricks.color[alive].astype(np.int64)
+            variants, inverse = np.unique(
+                (color[:, 0] << 16 | color[:, 1] << 8 | color[:, 2])
+                | bricks.width[alive].astype(np.int64) << 24
+                | bricks.height[alive].astype(np.int64) << 40,
+                return_inverse=True,
+            )
+            areas = [
+                self.area(
+                    (variant >> 16 & 255, variant >> 8 & 255, variant & 255),
+                    variant >> 24 & 0xFFFF,
+                    variant >> 40,
+                )
+                for variant in variants.tolist()
+            ]
+            # Атлас мог вырасти при добавлении спрайтов - берем его после
+            surface = self.surface
+            self._blits = [
+                (surface, position, areas[variant])
+                for position, variant in zip(
+                    zip(bricks.x[alive].tolist(), bricks.y[alive].tolist()),
+                    inverse.tolist(),
+                )
+            ]
+            self._blits_key = key
+        return self._blits
+
+    def draw(self, screen: pygame.Surface, bricks) -> None:
+        """Рисует оставшиеся кубики одним вызовом blits()"""
+        screen.blits(self.blits(bricks), doreturn=False)
+
+    def clear(self) -> None:
+        """Удаляет все спрайты (например, после пересоздания окна)"""
+        self.width = self.initial_width
+        self.surface: Optional[pygame.Surface] = None
+        self._areas: Dict[Tuple[int, ...], pygame.Rect] = {}
+        self._cursor = (0, 0)  # Место следующего спрайта в текущем ряду
+        self._row_height = 0
+        # Список отрисовки и состояние кубиков, для которого он собран
+        self._blits: List[tuple] = []
+        self._blits_key: Optional[tuple] = None
+
+
+class SpriteCache:
+    """
+    Хранит отрисованные спрайты по ключу (вид, размеры).
+    Спрайт перерисовывается только при появлении новых размеров,
+    например когда бонус меняет ширину платформы.
+    """
+
+    def __init__(self):
+        self._sprites: Dict[Tuple, pygame.Surface] = {}
+        self.bricks = BrickAtlas()  # Атлас кубиков
+
+    def paddle(self, width: int, height: int) -> pygame.Surface:
+        """Возвращает спрайт платформы заданного размера"""
+        key = ("paddle", width, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = render_paddle(width, height)
+        return sprite
+
+    def ball(self, width: int, height: int) -> pygame.Surface:
+        """Возвращает спрайт мяча заданного размера"""
+        key = ("ball", width, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = render_ball(width, height)
+        return sprite
+
+    def ghost(self, kind: str, width: int, height: int) -> pygame.Surface:
+        """Полупрозрачная копия спрайта kind ("paddle" или "ball") для призрака"""
+        key = ("ghost", kind, width, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = getattr(self, kind)(width, height).copy()
+            sprite.set_alpha(GHOST_ALPHA)
+            self._sprites[key] = sprite
+        return sprite
+
+    def capsule(self, color, width: int, height: int) -> pygame.Surface:
+        """Возвращает спрайт капсулы бонуса заданного цвета"""
+        key = ("capsule", tuple(color), width, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = render_capsule(width, height, color)
+        return sprite
+
+    def particle(self, color, size: int) -> pygame.Surface:
+        """Возвращает спрайт частицы заданного цвета"""
+        key = ("particle", tuple(color), size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = render_particle(size, color)
+        return sprite
+
+    def clear(self) -> None:
+        """Очищает кэш (например, после пересоздания окна)"""
+        self._sprites.clear()
+        self.bricks.clear()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
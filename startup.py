@@ -0,0 +1,87 @@
+"""
+Быстрый старт игры Арканоид
+Отложенный импорт тяжелых модулей и замер этапов запуска
+(параметр --startup-profile). Кэш шрифтов - в модуле fonts.py.
+"""
+
+import importlib.util
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+
+def lazy_import(name: str):
+    """
+    Возвращает модуль, который будет загружен при первом обращении к его атрибуту.
+    Так модули с NumPy не загружаются, пока не понадобится игровой экран.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class StartupProfile:
+    """
+    Замер этапов запуска. Этапы могут быть вложенными; отчет
+    повторяет формат python -X importtime: собственное время этапа,
+    время вместе с вложенными этапами и название с отступом по вложенности.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        # (глубина, название, собственное время, общее время) в порядке завершения
+        self.records: List[Tuple[int, str, float, float]] = []
+        self._stack: List[List[float]] = []  # [начало, время вложенных этапов]
+        self.first_frame: Optional[float] = None  # Время до первого кадра, секунд
+        self._first_frame_line = 0  # Сколько этапов завершилось до первого кадра
+
+    @contextmanager
+    def phase(self, name: str):
+        """Замеряет этап запуска"""
+        self._stack.append([time.perf_counter(), 0.0])
+        try:
+            yield
+        finally:
+            self.add(name, *self._stack.pop())
+
+    def add(self, name: str, started: float, nested: float = 0.0) -> None:
+        """Записывает этап, начатый в момент started (time.perf_counter)"""
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self.records.append((len(self._stack), name, cumulative - nested, cumulative))
+
+    def mark_first_frame(self) -> None:
+        """Отмечает вывод первого кадра (конец запуска)"""
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.origin
+            self._first_frame_line = len(self.records)
+
+    def report(self) -> str:
+        """
+        Отчет по этапам запуска в микросекундах.
+        Этапы, отложенные до первого обращения, идут после строки первого кадра.
+        """
+        lines = [
+            f"startup time: {own * 1e6:9.0f} | {cumulative * 1e6:10.0f} | "
+            f"{'  ' * depth}{name}"
+            for depth, name, own, cumulative in self.records
+        ]
+        if self.first_frame is not None:
+            lines.insert(
+                self._first_frame_line,
+                f"startup time: {'':9} | {self.first_frame * 1e6:10.0f} | первый кадр",
+            )
+        return "\n".join(["startup time: self [us] | cumulative | phase"] + lines)
+
+
+# Профиль запуска текущего процесса (отчет выводится по --startup-profile)
+STARTUP = StartupProfile()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Тест менеджера ресурсов"""
+
+import sys
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import AssetManager
+
+
+def resolve(relative_path):
+    """Путь к ресурсу относительно корня проекта"""
+    return os.path.join(ROOT_DIR, relative_path)
+
+
+def test_image_cached_by_path():
+    """Изображение загружается один раз и берётся из кэша"""
+    print("=== Testing asset cache ===")
+    manager = AssetManager(resolve)
+
+    first = manager.image("resources/icon.png")
+    assert manager.image("resources/icon.png") is first
+    assert "resources/icon.png" in manager
+    assert len(manager) == 1
+    print("OK: Image cached by path")
+
+
+def test_convert_after_set_mode():
+    """Изображения, загруженные до создания окна, приводятся к формату экрана"""
+    print("=== Testing deferred convert ===")
+    pygame.display.quit()
+    manager = AssetManager(resolve)
+    manager.image("resources/icon.png")
+
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((64, 64))
+        assert manager.convert_pending() == 1
+        assert manager.convert_pending() == 0
+    finally:
+        pygame.display.quit()
+    print("OK: Pending surfaces converted")
+
+
+def test_preload_manifest_stats():
+    """Предзагрузка возвращает время загрузки и пропускает отсутствующие файлы"""
+    print("=== Testing manifest preload ===")
+    manager = AssetManager(resolve)
+
+    stats = manager.preload(["resources/icon.png", "resources/missing.png"])
+    assert list(stats) == ["resources/icon.png"]
+    assert stats["resources/icon.png"] >= 0
+    assert "Всего: 1" in manager.format_stats()
+    print(f"OK: Preload stats:\n{manager.format_stats()}")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_image_cached_by_path()
+    test_convert_after_set_mode()
+    test_preload_manifest_stats()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
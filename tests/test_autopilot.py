@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Тест автопилота и долгого прогона (--autoplay)"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from autopilot import Autopilot, predict_landing
+from balls import BallPool
+from engine import Scene, SceneManager
+from soak import run_soak
+
+
+def test_predict_landing_matches_pool():
+    """Предсказанная точка совпадает с движением мяча в пуле"""
+    print("=== Testing landing prediction ===")
+    line_y = 540
+    for vel_x, vel_y in ((7, 5), (-3, 4), (5, -5), (0, 6)):
+        pool = BallPool()
+        index = pool.spawn(400, 300, vel_x, vel_y)
+        frames, x = predict_landing(400, 300, vel_x, vel_y, pool.size, line_y)
+        for _ in range(frames):
+            pool.update()
+        assert pool.y[index] + pool.size >= line_y
+        assert x == pool.x[index] + pool.size / 2
+    assert predict_landing(400, 300, 0, 0, 16, line_y) is None
+    print("OK: Prediction matches pool")
+
+
+class FakeSession:
+    """Минимальная партия для автопилота"""
+
+    def __init__(self):
+        from bricks import BrickStore
+        from entities import Paddle
+
+        self.paddle = Paddle()
+        self.balls = BallPool()
+        self.bricks = BrickStore([100], [60], [60], [20], [0], [0])
+        self.game_started = True
+
+
+def test_autopilot_moves_to_ball():
+    """Платформа идет туда, где упадет мяч"""
+    print("=== Testing autopilot steering ===")
+    session = FakeSession()
+    session.balls.spawn(100, 300, 0, 5)
+    autopilot = Autopilot()
+    assert autopilot.steer(session) == -1
+
+    session.balls.clear()
+    session.balls.spawn(700, 300, 0, 5)
+    assert autopilot.steer(session) == 1
+    print("OK: Autopilot steers to the landing point")
+
+
+class SoakScene(Scene):
+    """Экран, который заканчивает партию каждые 3 кадра и однажды падает"""
+
+    def __init__(self):
+        super().__init__()
+        self.games_played = 0
+        self.frames = 0
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+        self.frames = 0
+
+    def update(self):
+        self.frames += 1
+        if self.games_played == 1 and self.resets == 0:
+            raise RuntimeError("сбой в кадре")
+        if self.frames == 3:
+            self.games_played += 1
+            self.frames = 0
+
+
+def test_soak_reports_errors():
+    """Прогон доигрывает все партии, исключения попадают в отчет"""
+    print("=== Testing soak run ===")
+    pygame.display.init()
+    try:
+        manager = SceneManager(pygame.display.set_mode((10, 10)), fps=0)
+        scene = SoakScene()
+        report = run_soak(manager, scene, games=4)
+        assert report.games == 4
+        assert len(report.errors) == 1 and "RuntimeError" in report.errors[0]
+        assert report.frames > 0
+        assert "Партий: 4" in report.format()
+    finally:
+        pygame.display.quit()
+    print("OK: Soak run finished with error report")
+
+
+if __name__ == "__main__":
+    test_predict_landing_matches_pool()
+    test_autopilot_moves_to_ball()
+    test_soak_reports_errors()
+    print("All autopilot tests passed")
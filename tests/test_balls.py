@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Тест пула мячей"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from balls import BallPool
+from bricks import BRICK_ARMORED, BRICK_WALL, BrickStore
+from entities import Ball, Paddle
+
+
+def test_pool_matches_single_ball():
+    """Движение и отскоки мяча в пуле совпадают с классом Ball"""
+    print("=== Testing pool vs Ball ===")
+    paddle = Paddle()
+    ball = Ball()
+    pool = BallPool()
+    index = pool.spawn(ball.rect.x, ball.rect.y, 7, -5)
+    ball.vel_x, ball.vel_y = 7, -5
+
+    for _ in range(300):
+        ball.update()
+        pool.update()
+        if ball.rect.colliderect(paddle.rect) and ball.vel_y > 0:
+            ball.bounce_vertical()
+            offset = (ball.rect.centerx - paddle.rect.centerx) / (paddle.rect.width / 2)
+            ball.vel_x = int(
+                max(-ball.get_speed(), min(ball.get_speed(), ball.get_speed() * offset))
+            )
+        pool.collide_paddle(paddle.rect)
+        assert pool.rect(index) == ball.rect
+        assert (pool.vel_x[index], pool.vel_y[index]) == (ball.vel_x, ball.vel_y)
+    print("OK: Pool follows Ball trajectory")
+
+
+def test_batched_brick_collisions():
+    """Пакетная проверка по индексу кубиков совпадает с проверкой по одному"""
+    print("=== Testing batched brick collisions ===")
+    rng = random.Random(1)
+    rows, cols = np.divmod(np.arange(60), 10)
+    bricks = BrickStore.grid(
+        cols, rows, np.zeros(60), np.zeros(60), (55, 60), (60, 20), 10
+    )
+    for index in range(0, 60, 7):
+        bricks.hit(index)
+
+    x = np.array([rng.randrange(0, 790) for _ in range(500)])
+    y = np.array([rng.randrange(0, 300) for _ in range(500)])
+    batched = bricks.collide_boxes(x, y, 16, 16)
+    for i in range(len(x)):
+        assert batched[i] == bricks.collide(pygame.Rect(int(x[i]), int(y[i]), 16, 16))
+    print(f"OK: {np.count_nonzero(batched != -1)} hits match")
+
+
+def test_side_contact_hits_once():
+    """Касание сбоку прочного кубика или стены - один удар и отскок в сторону"""
+    print("=== Testing side contact ===")
+    for kind in (BRICK_ARMORED, BRICK_WALL):
+        bricks = BrickStore([300], [200], [60], [20], [kind], [0])
+        pool = BallPool()
+        index = pool.spawn(280, 203, 5, 5)
+
+        hits = []
+        for _ in range(20):
+            pool.update()
+            hits += pool.collide_bricks(bricks)
+        assert hits == [0]
+        assert pool.vel_x[index] < 0
+        assert pool.x[index] + pool.size <= 300
+        assert bricks.alive[0]
+    print("OK: Side contact counted once and ball pushed out")
+
+
+def test_ball_inside_wall_leaves_it():
+    """Мяч, заехавший в стену, уходит из нее, а не дрожит на месте"""
+    print("=== Testing wall escape ===")
+    pool = BallPool()
+    index = pool.spawn(790, 300, 4, 5)
+    ball = Ball()
+    ball.rect.topleft = (790, 300)
+    ball.vel_x, ball.vel_y = 4, 5
+    for _ in range(5):
+        pool.update()
+        ball.update()
+    assert pool.vel_x[index] < 0 and ball.vel_x < 0
+    assert pool.x[index] + pool.size < 800 and ball.rect.right < 800
+    print("OK: Ball leaves the wall")
+
+
+def test_speed_api():
+    """Управление скоростью работает для всех мячей пула"""
+    print("=== Testing pool speed API ===")
+    pool = BallPool()
+    pool.spawn(100, 100, 5, -5)
+    pool.spawn(200, 100, -5, -5)
+
+    pool.set_speed(10)
+    assert pool.get_speed() == 10
+    assert pool.vel_x[pool.indices()].tolist() == [10, -10]
+
+    for _ in range(15):
+        pool.increase_speed()
+    assert pool.get_speed() == 10
+    for _ in range(15):
+        pool.decrease_speed()
+    assert pool.get_speed() == 1
+    print("OK: Speed limits work on the pool")
+
+
+def test_split_and_lost_balls():
+    """Мультимяч добавляет мячи, упавшие мячи убираются из пула"""
+    print("=== Testing split and lost balls ===")
+    paddle = Paddle()
+    pool = BallPool(capacity=5)
+    pool.serve(paddle.rect)
+    assert len(pool) == 1
+    assert pool.vel_y[pool.primary()] == 0
+
+    assert pool.split() == 2
+    assert pool.split() == 2  # Пул заполнен: добавлено только 2 из 6
+    assert len(pool) == 5
+
+    pool.y[pool.indices()[:3]] = 600
+    assert pool.remove_lost(600) == 3
+    assert len(pool) == 2
+    print("OK: Split and lost balls handled")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_pool_matches_single_ball()
+    test_batched_brick_collisions()
+    test_side_contact_hits_once()
+    test_ball_inside_wall_leaves_it()
+    test_speed_api()
+    test_split_and_lost_balls()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Тест сжатой записи партии (битовые поля, части, опорные кадры, перемотка)"""
+
+import sys
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from autopilot import Autopilot
+from chunked_replay import (
+    ChunkedReplay,
+    ChunkedReplayFile,
+    decode_inputs,
+    encode_inputs,
+    load_replay,
+    seek,
+)
+from export import export_replay
+from fonts import default_font_registry
+from PyGameBall import GameContext, GameScene
+from replay import Replay, ReplayPilot
+from rng import RandomStreams
+
+FRAMES = 3000
+
+
+def make_context(seed):
+    fonts = default_font_registry()
+    return GameContext(
+        font=fonts.get("arial", 20),
+        big_font=fonts.get("arial", 42, bold=True),
+        fonts=fonts,
+        rng=RandomStreams(seed),
+        music_enabled=False,
+        sounds_loaded=True,
+    )
+
+
+def state(scene):
+    session = scene.session
+    balls, powerups = session.balls, session.powerups
+    return (
+        session.score,
+        session.lives_left,
+        session.paddle.rect.x,
+        balls.x[balls.indices()].tolist(),
+        balls.y[balls.indices()].tolist(),
+        session.bricks.alive.tolist(),
+        powerups.y[powerups.active].tolist(),
+    )
+
+
+def record_game(path, seed=5):
+    """Партия автопилота, записанная частями по 200 кадров"""
+    recording = ChunkedReplay(seed, chunk_frames=200, keyframe_chunks=3)
+    scene = GameScene(make_context(seed), Autopilot(), recording)
+    for _ in range(FRAMES):
+        scene.update()
+    recording.save(path)
+    return scene
+
+
+def playback(replay):
+    pilot = ReplayPilot(replay)
+    return GameScene(make_context(replay.seed), pilot), pilot
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+
+
+def teardown_module(module):
+    # Шрифты общего реестра недействительны после pygame.quit
+    default_font_registry().clear()
+    pygame.quit()
+
+
+def test_input_runs_roundtrip():
+    """Одинаковые подряд кадры сворачиваются, ввод восстанавливается"""
+    inputs = np.array(
+        [(0, 0, 5)] * 50 + [(-7, 0, 5)] * 3 + [(7, 1, 5), (-640, -1, 10)],
+        dtype=np.int32,
+    )
+    runs = encode_inputs(inputs)
+    assert runs["count"].tolist() == [50, 3, 1, 1]
+    assert decode_inputs(runs) == [tuple(row) for row in inputs.tolist()]
+
+
+def test_chunk_size_fits_run_count():
+    """Часть длиннее 16-битного числа кадров пары не создается"""
+    recording = ChunkedReplay(1, chunk_frames=65535)
+    for _ in range(65535):
+        recording.record(0, 0, 5)
+    assert len(recording.chunks) == 1
+    for chunk_frames in (0, 65536):
+        try:
+            ChunkedReplay(1, chunk_frames=chunk_frames)
+            assert False, "Неверная длина части должна вызывать ValueError"
+        except ValueError:
+            pass
+
+
+def test_recording_replays_game():
+    """Сжатая запись повторяет партию и меньше записи JSON"""
+    print("=== Testing chunked recording ===")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "game.zrec")
+        original = record_game(path)
+        replay = load_replay(path)
+        try:
+            assert isinstance(replay, ChunkedReplayFile)
+            assert len(replay) == FRAMES and replay.seed == 5
+            # Открытие читает только оглавление
+            assert replay._cached_index == -1 and len(replay.index) == 15
+            assert [entry[3] for entry in replay.index[:4]] == [1, 0, 0, 1]
+
+            scene, pilot = playback(replay)
+            while not pilot.finished:
+                scene.update()
+            assert state(scene) == state(original)
+
+            json_path = os.path.join(directory, "game.replay")
+            Replay(5, [replay.frames[i] for i in range(FRAMES)]).save(json_path)
+            assert os.path.getsize(path) < os.path.getsize(json_path)
+        finally:
+            replay.close()
+    print("OK: Chunked recording replays the game")
+
+
+def test_seek_matches_linear_playback():
+    """Перемотка от опорного кадра вперед и назад совпадает с игрой подряд"""
+    print("=== Testing replay seeking ===")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "game.zrec")
+        record_game(path)
+        replay = ChunkedReplayFile(path)
+        try:
+            scene, pilot = playback(replay)
+            reference, reference_pilot = playback(replay)
+            for target in (2450, 700):
+                assert seek(scene, pilot, target) == target
+                if target < reference_pilot.frame:
+                    reference, reference_pilot = playback(replay)
+                while reference_pilot.frame < target:
+                    reference.update()
+                assert state(scene) == state(reference)
+            # Запись JSON перематывается только вперед
+            json_scene, json_pilot = playback(Replay(5, [replay.frames[0]] * 10))
+            seek(json_scene, json_pilot, 10)
+            try:
+                seek(json_scene, json_pilot, 5)
+                assert False, "JSON replay rewound"
+            except ValueError:
+                pass
+        finally:
+            replay.close()
+    print("OK: Seeking restores keyframes")
+
+
+def test_export_from_start():
+    """Экспорт с --start выводит кадры только после точки перемотки"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "game.zrec")
+        record_game(path)
+        replay = ChunkedReplayFile(path)
+        try:
+            frames = []
+            assert export_replay(replay, frames.append, every=10, start=2800) == 20
+            assert len(frames[0]) == 800 * 600 * 3
+        finally:
+            replay.close()
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_input_runs_roundtrip()
+    test_chunk_size_fits_run_count()
+    test_recording_replays_game()
+    test_seek_matches_linear_playback()
+    test_export_from_start()
+    teardown_module(None)
+    print("All chunked replay tests passed")
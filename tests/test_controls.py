@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Тест ввода: отметки времени, короткие нажатия, геймпад, мышь и задержка"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from controls import InputState
+from engine import Scene, SceneManager
+from PyGameBall import GameContext, GameScene
+from rng import RandomStreams
+
+
+class FakeClock:
+    """Часы, которые двигает тест"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def post(*events):
+    pygame.event.get()
+    for event_type, attributes in events:
+        pygame.event.post(pygame.event.Event(event_type, **attributes))
+
+
+def key(key_code):
+    return {"key": key_code, "mod": 0, "scancode": 0, "unicode": ""}
+
+
+def setup_module(module):
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+
+
+def teardown_module(module):
+    pygame.display.quit()
+
+
+def test_tap_between_frames_not_lost():
+    """Нажатие и отпускание между кадрами сдвигает платформу на полный кадр"""
+    print("=== Testing quick tap ===")
+    clock = FakeClock()
+    state = InputState(clock=clock)
+    clock.now = 0.01
+    post((pygame.KEYDOWN, key(pygame.K_RIGHT)), (pygame.KEYUP, key(pygame.K_RIGHT)))
+    state.pump()
+    clock.now = 0.016
+    assert state.paddle(9) == (9, 1)
+    assert state.paddle(9) == (0, 0)
+    print("OK: Tap moves the paddle")
+
+
+def test_sub_frame_hold():
+    """Клавиша, нажатая в середине кадра, сдвигает платформу на половину шага"""
+    clock = FakeClock()
+    state = InputState(clock=clock)
+    clock.now = 0.5
+    post((pygame.KEYDOWN, key(pygame.K_LEFT)))
+    state.pump()
+    clock.now = 1.0
+    assert state.paddle(10) == (-5, -1)
+    clock.now = 2.0
+    assert state.paddle(10) == (-10, -1)
+
+
+def test_gamepad_axis():
+    """Отклонение стика задает долю скорости, мертвая зона гасит дрожание"""
+    clock = FakeClock()
+    state = InputState(clock=clock)
+    post((pygame.JOYAXISMOTION, {"instance_id": 0, "axis": 0, "value": 0.5}))
+    state.pump()
+    clock.now = 1.0
+    assert state.paddle(10) == (5, 1)
+    post((pygame.JOYAXISMOTION, {"instance_id": 0, "axis": 0, "value": 0.1}))
+    state.pump()
+    clock.now = 2.0
+    assert state.paddle(10) == (0, 0)
+
+
+def test_pointer_and_touch():
+    """Мышь и касание задают положение платформы и запуск мяча"""
+    state = InputState(width=800)
+    post(
+        (pygame.MOUSEMOTION, {"pos": (120, 50), "rel": (1, 0), "buttons": (0, 0, 0)}),
+        (pygame.MOUSEBUTTONDOWN, {"pos": (120, 50), "button": 1}),
+    )
+    state.pump()
+    assert state.take_pointer() == 120
+    assert state.take_click() == 120
+    assert state.take_pointer() is None
+
+    post((pygame.FINGERDOWN, {"x": 0.25, "y": 0.5, "dx": 0, "dy": 0, "finger_id": 0}))
+    state.pump()
+    assert state.take_pointer() == 200
+    assert state.take_click() == 200
+
+
+def test_input_latency():
+    """Задержка считается от получения события до вывода кадра"""
+    clock = FakeClock()
+    state = InputState(clock=clock)
+    clock.now = 1.0
+    post((pygame.KEYDOWN, key(pygame.K_LEFT)))
+    state.pump()
+    events = state.drain()
+    assert [event.type for event in events] == [pygame.KEYDOWN]
+    clock.now = 1.02
+    state.presented()
+    average, worst, count = state.latency_stats()
+    assert count == 1
+    assert abs(average - 20.0) < 1e-6 and abs(worst - 20.0) < 1e-6
+
+
+def test_game_resume_clears_input():
+    """Щелчок на экране поверх игры не достается платформе после возврата"""
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    context = GameContext(
+        font=font,
+        big_font=font,
+        rng=RandomStreams(1),
+        music_enabled=False,
+        sounds_loaded=True,
+    )
+    manager = SceneManager(pygame.Surface((800, 600)))
+    manager.push(GameScene(context))
+    manager.push(Scene())  # Например, окно настроек
+    post((pygame.MOUSEBUTTONDOWN, {"pos": (120, 50), "button": 1}))
+    manager.input.pump()
+    manager.pop()
+    assert manager.input.take_click() is None
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_tap_between_frames_not_lost()
+    test_sub_frame_hold()
+    test_gamepad_axis()
+    test_pointer_and_touch()
+    test_input_latency()
+    test_game_resume_clears_input()
+    teardown_module(None)
+    print("All input tests passed")
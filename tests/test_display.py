@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Тест окна с масштабированием логической поверхности"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from display import Display, fit_rect
+from engine import SceneManager
+
+
+def setup_module(module):
+    pygame.display.init()
+
+
+def teardown_module(module):
+    pygame.display.quit()
+
+
+def test_fit_rect():
+    """Изображение вписывается в окно по центру с сохранением пропорций"""
+    print("=== Testing fit_rect ===")
+    assert fit_rect((800, 600), (1920, 1080)) == pygame.Rect(240, 0, 1440, 1080)
+    assert fit_rect((800, 600), (1920, 1080), integer=True) == pygame.Rect(
+        560, 240, 800, 600
+    )
+    assert fit_rect((800, 600), (3840, 2160), integer=True).size == (2400, 1800)
+    # Окно меньше изображения: целое увеличение невозможно, уменьшаем
+    assert fit_rect((800, 600), (400, 300), integer=True).size == (400, 300)
+    print("OK: Image fits the window")
+
+
+def test_smooth_scaling():
+    """Логическая поверхность постоянного размера масштабируется в окно"""
+    display = Display((800, 600), (1600, 1200), mode="smooth")
+    surface = display.open()
+    assert surface.get_size() == (800, 600)
+    assert display.window.get_size() == (1600, 1200)
+    assert display.scaled
+
+    surface.fill((255, 0, 0))
+    display.present()
+    assert display.window.get_at((1599, 1199))[:3] == (255, 0, 0)
+    assert display.to_logical((800, 600)) == (400, 300)
+
+
+def test_integer_scale_one_draws_into_window():
+    """При масштабе 1 игра рисует прямо в область окна, без копирования"""
+    display = Display((800, 600), (1000, 700), mode="integer")
+    surface = display.open()
+    assert not display.scaled
+    assert surface.get_size() == (800, 600)
+    assert display.area.topleft == (100, 50)
+    assert display.to_logical((100, 50)) == (0, 0)
+
+    surface.fill((0, 255, 0))
+    display.present()
+    assert display.window.get_at((100, 50))[:3] == (0, 255, 0)
+    assert display.window.get_at((0, 0))[:3] == (0, 0, 0)
+
+
+def test_mouse_in_logical_coordinates():
+    """Мышь в масштабированном окне управляет в координатах игры"""
+    display = Display((800, 600), (1600, 1200), mode="integer")
+    manager = SceneManager(display.open(), fps=0, display=display)
+    pygame.event.get()
+    pygame.event.post(
+        pygame.event.Event(
+            pygame.MOUSEMOTION, pos=(1000, 10), rel=(0, 0), buttons=(0, 0, 0)
+        )
+    )
+    manager.input.pump()
+    assert manager.input.take_pointer() == 500
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_fit_rect()
+    test_smooth_scaling()
+    test_integer_scale_one_draws_into_window()
+    test_mouse_in_logical_coordinates()
+    teardown_module(None)
+    print("All display tests passed")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Тест частиц и бонусов"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from config import PADDLE_WIDE_WIDTH, PADDLE_WIDTH
+from effects import (
+    PARTICLE_LIFETIME,
+    POWERUP_LIFE,
+    POWERUP_WIDE,
+    FreeList,
+    ParticlePool,
+    PowerUpPool,
+)
+from entities import Paddle
+from sprites import SpriteCache
+
+
+def test_free_list_recycling():
+    """Свободные индексы выдаются и возвращаются без новых выделений"""
+    print("=== Testing free list ===")
+    free = FreeList(4)
+    first = free.allocate(3)
+    assert sorted(first.tolist()) == [0, 1, 2]
+    assert len(free.allocate(5)) == 1
+    assert len(free) == 0
+
+    free.release(first)
+    assert sorted(free.allocate(10).tolist()) == [0, 1, 2]
+    print("OK: Free list recycles slots")
+
+
+def test_particles_expire_and_recycle():
+    """Частицы гаснут, а их ячейки переиспользуются"""
+    print("=== Testing particle pool ===")
+    particles = ParticlePool(capacity=20, rng=np.random.default_rng(0))
+
+    assert particles.burst((100, 100), (255, 0, 0), count=16) == 16
+    assert particles.burst((100, 100), (255, 0, 0), count=16) == 4
+    assert len(particles) == 20
+
+    start_y = particles.y.copy()
+    particles.update()
+    assert not np.array_equal(start_y, particles.y)
+
+    for _ in range(PARTICLE_LIFETIME):
+        particles.update()
+    assert len(particles) == 0
+    assert particles.burst((50, 50), (0, 255, 0), count=16) == 16
+    print("OK: Particles expire and slots are reused")
+
+
+def test_particles_drawn_with_cached_sprites():
+    """Частицы рисуются спрайтами по цвету: один спрайт на цвет"""
+    print("=== Testing particle drawing ===")
+    particles = ParticlePool(capacity=40, rng=np.random.default_rng(0))
+    particles.burst((100, 100), (255, 0, 0), count=16)
+    particles.burst((300, 100), (0, 255, 0), count=16)
+    cache = SpriteCache()
+    screen = pygame.Surface((800, 600))
+    particles.draw(screen, cache)
+    assert len(cache) == 2
+    assert screen.get_at((101, 101))[:3] == (255, 0, 0)
+    assert screen.get_at((301, 101))[:3] == (0, 255, 0)
+    print("OK: Particles drawn in one batch")
+
+
+def test_powerups_caught_and_missed():
+    """Пойманный бонус возвращается, упавший - исчезает"""
+    print("=== Testing power-up pool ===")
+    paddle = Paddle()
+    powerups = PowerUpPool(capacity=4)
+    powerups.spawn((paddle.rect.centerx, paddle.rect.top - 20), POWERUP_WIDE)
+    powerups.spawn((10, 590), POWERUP_LIFE)
+
+    caught = []
+    for _ in range(20):
+        caught += powerups.update(paddle.rect, 600)
+    assert caught == [POWERUP_WIDE]
+    assert len(powerups) == 0
+    print("OK: Power-ups caught and removed")
+
+
+def test_paddle_widen():
+    """Бонус расширяет платформу на время, затем ширина возвращается"""
+    print("=== Testing wide paddle ===")
+    paddle = Paddle()
+    center = paddle.rect.centerx
+
+    paddle.widen(frames=3)
+    assert paddle.rect.width == PADDLE_WIDE_WIDTH
+    assert paddle.rect.centerx == center
+    for _ in range(3):
+        paddle.tick()
+    assert paddle.rect.width == PADDLE_WIDTH
+    print("OK: Paddle widened and restored")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_free_list_recycling()
+    test_particles_expire_and_recycle()
+    test_particles_drawn_with_cached_sprites()
+    test_powerups_caught_and_missed()
+    test_paddle_widen()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Тест стека экранов и игрового цикла"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from engine import Scene, SceneManager
+
+
+class RecordingScene(Scene):
+    """Экран, записывающий вызовы в общий журнал"""
+
+    def __init__(self, name, log, overlay=False, frames=None):
+        super().__init__()
+        self.name = name
+        self.log = log
+        self.overlay = overlay
+        self.frames = frames
+
+    def enter(self):
+        self.log.append(f"{self.name}.enter")
+
+    def resume(self):
+        self.log.append(f"{self.name}.resume")
+
+    def exit(self):
+        self.log.append(f"{self.name}.exit")
+
+    def update(self):
+        if self.frames is not None:
+            self.frames -= 1
+            if self.frames <= 0:
+                self.manager.pop()
+
+    def draw(self, screen):
+        self.log.append(f"{self.name}.draw")
+
+
+def test_push_pop_resume():
+    """Закрытие экрана возвращает управление предыдущему"""
+    print("=== Testing scene stack ===")
+    log = []
+    manager = SceneManager(pygame.Surface((10, 10)))
+    manager.push(RecordingScene("game", log))
+    manager.push(RecordingScene("menu", log))
+    assert manager.top.name == "menu"
+
+    manager.pop()
+    assert manager.top.name == "game"
+    assert log == ["game.enter", "menu.enter", "menu.exit", "game.resume"]
+    print("OK: Scenes pushed and popped")
+
+
+def test_transition_hook():
+    """О каждой смене экрана сообщается через on_transition"""
+    transitions = []
+    manager = SceneManager(pygame.Surface((10, 10)))
+    manager.on_transition = transitions.append
+    manager.push(RecordingScene("game", []))
+    manager.replace(RecordingScene("menu", []))
+    manager.pop()
+    assert transitions == [
+        "экран RecordingScene открыт",
+        "экран RecordingScene открыт",
+        "экран RecordingScene закрыт",
+    ]
+
+
+def test_overlay_draw_order():
+    """Оверлей рисуется поверх экрана под ним, обычный экран - один"""
+    print("=== Testing overlay drawing ===")
+    log = []
+    manager = SceneManager(pygame.Surface((10, 10)))
+    manager.push(RecordingScene("game", log))
+    manager.push(RecordingScene("results", log))
+    manager.push(RecordingScene("settings", log, overlay=True))
+    log.clear()
+
+    manager.draw()
+    assert log == ["results.draw", "settings.draw"]
+    print("OK: Overlay drawn over the scene below")
+
+
+def test_run_until_stack_empty():
+    """
+    Цикл работает, пока в стеке есть экраны, и сообщает о выходе;
+    close() закрывает оставшиеся экраны
+    """
+    print("=== Testing main loop ===")
+    pygame.display.init()
+    log = []
+    manager = SceneManager(pygame.display.set_mode((10, 10)), fps=0)
+    assert manager.run(RecordingScene("game", log, frames=3)) is False
+    assert manager.frame_count == 2
+    assert len(manager) == 0
+
+    quitting = RecordingScene("game", log)
+    quitting.update = lambda: quitting.manager.quit()
+    assert manager.run(quitting) is True
+    assert manager.top is quitting
+
+    manager.push(RecordingScene("results", log))
+    log.clear()
+    manager.close()
+    assert log == ["results.exit", "game.exit"] and len(manager) == 0
+    print("OK: Loop stops when stack is empty or on quit")
+
+
+def test_frame_pacing():
+    """Темп кадров: busy держит частоту, uncapped не ждет, статистика кадров"""
+    print("=== Testing frame pacing ===")
+    pygame.display.init()
+    screen = pygame.display.set_mode((10, 10))
+    busy = SceneManager(screen, fps=100, pacing="busy")
+    busy.run(RecordingScene("game", [], frames=21))
+    average, deviation, worst = busy.frame_stats()
+    assert len(busy.frame_times) == 19
+    assert 9.0 < average < 12.0
+    assert worst >= average and deviation >= 0
+
+    uncapped = SceneManager(screen, fps=100, pacing="uncapped")
+    uncapped.run(RecordingScene("game", [], frames=21))
+    assert uncapped.frame_stats()[0] < 5.0
+
+    try:
+        SceneManager(screen, pacing="sleep")
+        assert False, "Неизвестный режим должен вызывать ValueError"
+    except ValueError:
+        pass
+    print("OK: Pacing modes hold or skip the frame rate")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_push_pop_resume()
+    test_transition_hook()
+    test_overlay_draw_order()
+    test_run_until_stack_empty()
+    test_frame_pacing()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
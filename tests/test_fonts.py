@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Тест кэша путей к шрифтам и общих шрифтов"""
+
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from fonts import FontPathCache, FontRegistry, load_font
+
+
+def test_font_path_cache():
+    """Путь к шрифту ищется один раз и берется из файла при следующем запуске"""
+    print("=== Testing font path cache ===")
+    pygame.font.init()
+    calls = []
+    real_match_font = pygame.font.match_font
+
+    def counting_match_font(name, bold=False, italic=False):
+        calls.append((name, bold))
+        return real_match_font(name, bold, italic)
+
+    pygame.font.match_font = counting_match_font
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "font_cache.json")
+            cache = FontPathCache(path)
+            first = cache.resolve("arial")
+            cache.resolve("arial")
+            cache.save()
+            assert len(calls) == 1
+            with open(path, encoding="utf-8") as f:
+                assert json.load(f) == {"arial:regular": first}
+
+            # Следующий запуск: системные шрифты не перечисляются
+            font = load_font(FontPathCache(path), "arial", 20)
+            assert len(calls) == 1
+            assert font.get_height() > 0
+    finally:
+        pygame.font.match_font = real_match_font
+    print("OK: Font path resolved once and persisted")
+
+
+def test_registry_shares_fonts():
+    """Один объект шрифта на (семейство, размер, жирность)"""
+    print("=== Testing font registry ===")
+    pygame.font.init()
+    with tempfile.TemporaryDirectory() as directory:
+        fonts = FontRegistry(FontPathCache(os.path.join(directory, "fonts.json")))
+        font = fonts.get("Arial", 20)
+        assert fonts.get("arial", 20) is font
+        assert fonts.get("arial", 20, bold=True) is not font
+        assert fonts.get("arial", 24) is not font
+        assert len(fonts) == 3
+
+        assert fonts.first_available(["no-such-font-family"], 18) is None
+        assert os.path.exists(os.path.join(directory, "fonts.json"))
+    print("OK: Fonts shared between screens")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_font_path_cache()
+    test_registry_shares_fonts()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
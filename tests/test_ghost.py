@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Тест призрака лучшей партии (разностная запись, чтение частями, рекорды)"""
+
+import sys
+import os
+import random
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import highscores
+from autopilot import Autopilot
+from fonts import default_font_registry
+from ghost import GhostReader, GhostRecorder
+from highscores import HighScoreManager
+from PyGameBall import GameContext, GameScene
+from rng import RandomStreams
+
+
+def record_walk(recorder, frames, rng):
+    """Случайное движение с редкими скачками (подача мяча)"""
+    frame = [340, 120, 390, 500]
+    written = []
+    for _ in range(frames):
+        frame[0] += rng.randint(-9, 9)
+        frame[2] += rng.randint(-8, 8)
+        frame[3] += rng.randint(-8, 8)
+        if rng.random() < 0.01:
+            frame[2], frame[3] = rng.randint(0, 784), 520
+        recorder.record(*frame)
+        written.append(tuple(frame))
+    return written
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+
+
+def teardown_module(module):
+    # Шрифты общего реестра недействительны после pygame.quit
+    default_font_registry().clear()
+    pygame.quit()
+
+
+def test_roundtrip_streamed():
+    """Кадры уровней читаются с диска частями и совпадают с записанными"""
+    print("=== Testing ghost recording ===")
+    rng = random.Random(1)
+    recorder = GhostRecorder()
+    levels = [record_walk(recorder, 3000, rng)]
+    recorder.next_level()
+    levels.append(record_walk(recorder, 500, rng))
+    data = recorder.to_bytes()
+    # Обычный кадр - 4 байта разностей
+    assert len(data) < 4.2 * 3500
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "test.ghost")
+        with open(path, "wb") as f:
+            f.write(data)
+        reader = GhostReader(path)
+        try:
+            reader.start_level(1)
+            assert [reader.next_frame() for _ in range(500)] == levels[1]
+            assert reader.next_frame() is None
+
+            reader.start_level(0)
+            assert [reader.next_frame() for _ in range(10)] == levels[0][:10]
+            assert reader._file.tell() < len(data) // 2  # Файл не прочитан целиком
+            reader.start_level(2)
+            assert reader.next_frame() is None
+        finally:
+            reader.close()
+    print("OK: Ghost frames are delta-encoded and streamed")
+
+
+def test_ghost_saved_with_highscore():
+    """Запись призрака хранится рядом с рекордом и удаляется вместе с ним"""
+    original = highscores.HIGHSCORES_FILE
+    with tempfile.TemporaryDirectory() as directory:
+        highscores.HIGHSCORES_FILE = os.path.join(directory, "highscores.json")
+        try:
+            manager = HighScoreManager()
+            recorder = GhostRecorder()
+            recorder.record(1, 2, 3, 4)
+            assert manager.add_score("first", 10, 60, recorder.to_bytes())
+            best = manager.best_ghost_path()
+            assert best is not None and os.path.dirname(best) == os.path.join(
+                directory, "ghosts"
+            )
+            for place in range(10):
+                manager.add_score(f"p{place}", 20 + place, 60)
+            # Результат выбыл из топ-10 - записи призрака больше нет
+            assert manager.best_ghost_path() is None
+            assert not os.path.exists(best)
+        finally:
+            highscores.HIGHSCORES_FILE = original
+
+
+def test_scene_plays_best_ghost():
+    """Игровой экран повторяет кадры лучшей партии и рисует призрак"""
+    print("=== Testing ghost in game scene ===")
+    rng = random.Random(2)
+    recorder = GhostRecorder()
+    frames = record_walk(recorder, 50, rng)
+    original = highscores.HIGHSCORES_FILE
+    with tempfile.TemporaryDirectory() as directory:
+        highscores.HIGHSCORES_FILE = os.path.join(directory, "highscores.json")
+        try:
+            fonts = default_font_registry()
+            context = GameContext(
+                font=fonts.get("arial", 20),
+                big_font=fonts.get("arial", 42, bold=True),
+                highscore_manager=HighScoreManager(),
+                fonts=fonts,
+                rng=RandomStreams(4),
+                music_enabled=False,
+                sounds_loaded=True,
+                ghost=True,
+            )
+            context.highscore_manager.add_score("best", 30, 60, recorder.to_bytes())
+            scene = GameScene(context, Autopilot())
+            screen = pygame.Surface((800, 600))
+            for frame in frames[:20]:
+                scene.update()
+                assert scene.ghost_frame == frame
+            scene.draw(screen)
+            sprite = context.sprite_cache.ghost("ball", 16, 16)
+            assert sprite is context.sprite_cache.ghost("ball", 16, 16)
+            assert sprite.get_alpha() < 255
+            reader = scene.ghost
+            scene.exit()
+            # Файл призрака закрыт вместе с экраном
+            assert scene.ghost is None and reader._file is None
+        finally:
+            highscores.HIGHSCORES_FILE = original
+    print("OK: Scene replays the best run ghost")
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_roundtrip_streamed()
+    test_ghost_saved_with_highscore()
+    test_scene_plays_best_ghost()
+    teardown_module(None)
+    print("All ghost tests passed")
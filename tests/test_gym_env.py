@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Тест среды обучения агентов (наблюдения на месте, кадр pixels, векторная среда)"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from fonts import default_font_registry
+from gym_env import ACTIONS, ArkanoidEnv, VectorArkanoidEnv
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+
+
+def teardown_module(module):
+    # Шрифты общего реестра недействительны после pygame.quit
+    default_font_registry().clear()
+    pygame.quit()
+
+
+def test_observation_filled_in_place():
+    """step возвращает те же массивы, заполненные состоянием партии"""
+    print("=== Testing environment observations ===")
+    env = ArkanoidEnv(seed=1)
+    obs, info = env.reset()
+    state, bricks = obs["state"], obs["bricks"]
+    assert info["lives"] > 0 and bricks.sum() == info["bricks_left"]
+
+    obs, reward, terminated, truncated, info = env.step(ACTIONS.index(1))
+    assert obs["state"] is state and obs["bricks"] is bricks
+    session = env.session
+    assert state[4] == session.paddle.rect.centerx
+    index = session.balls.primary()
+    assert state[1] == session.balls.y[index] and state[3] < 0  # Мяч запущен
+    assert not terminated and not truncated
+    print("OK: Observation arrays are reused")
+
+
+def test_episode_rewards_and_termination():
+    """
+    Награда - очки за кадр; без движения платформы партия заканчивается,
+    и последний шаг возвращает итог партии, а не начало новой
+    """
+    env = ArkanoidEnv(seed=2, max_steps=50000)
+    env.reset()
+    total = 0.0
+    for _ in range(50000):
+        # Платформа стоит на месте и только запускает мяч
+        action = 0 if env.session.game_started else ACTIONS.index(-1)
+        obs, reward, terminated, truncated, info = env.step(action)
+        total += reward
+        if terminated:
+            break
+    assert terminated and total == env.scene.last_score == info["score"]
+    assert info["lives"] == 0 and obs["bricks"].sum() == info["bricks_left"]
+
+    obs, info = env.reset()
+    assert info["score"] == 0 and info["lives"] > 0
+
+
+def test_pixels_are_surface_view():
+    """Наблюдение pixels - представление уменьшенной поверхности без копии"""
+    env = ArkanoidEnv(seed=3, pixels=True, pixel_size=(40, 30))
+    obs, _ = env.reset()
+    pixels = obs["pixels"]
+    assert pixels.shape == (30, 40, 3) and pixels.base is not None
+    before = pixels.copy()
+    for _ in range(30):
+        obs, *_ = env.step(ACTIONS.index(1))
+    assert obs["pixels"] is pixels
+    assert not np.array_equal(before, pixels)  # Кадр обновился на месте
+    env.close()
+
+
+def test_vector_env_rows():
+    """Векторная среда: наблюдения сред - строки общих массивов"""
+    print("=== Testing vector environment ===")
+    envs = VectorArkanoidEnv(3, seed=10, pixels=True, pixel_size=(20, 15))
+    obs, infos = envs.reset()
+    assert obs["state"].shape == (3, 6) and len(infos) == 3
+    assert obs["pixels"].shape == (3, 15, 20, 3)
+    obs, rewards, terminated, truncated, infos = envs.step([0, 1, 2])
+    assert rewards.shape == (3,) and not terminated.any()
+    paddles = obs["state"][:, 4]
+    assert paddles[1] < paddles[0] < paddles[2]
+    assert np.shares_memory(obs["state"], envs.envs[1].observation["state"])
+    envs.close()
+    print("OK: Vector environment steps all games")
+
+
+def test_vector_env_resets_once():
+    """Векторная среда начинает закончившуюся партию заново один раз"""
+    envs = VectorArkanoidEnv(1, seed=2, max_steps=50000)
+    envs.reset()
+    env = envs.envs[0]
+    resets = []
+    reset = env.scene.reset
+    env.scene.reset = lambda: (resets.append(1), reset())
+    for _ in range(50000):
+        action = 0 if env.session.game_started else ACTIONS.index(-1)
+        obs, rewards, terminated, truncated, infos = envs.step([action])
+        if terminated[0]:
+            break
+    assert terminated[0] and infos[0]["lives"] == 0
+    assert len(resets) == 1 and env.session.lives_left > 0
+    envs.close()
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_observation_filled_in_place()
+    test_episode_rewards_and_termination()
+    test_pixels_are_surface_view()
+    test_vector_env_rows()
+    test_vector_env_resets_once()
+    teardown_module(None)
+    print("All environment tests passed")
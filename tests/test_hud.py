@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Тест панели состояния (HUD): перерисовка только при изменениях"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from hud import Hud, format_time
+
+
+def setup_module(module):
+    pygame.font.init()
+
+
+def make_hud(fields=()):
+    return Hud(pygame.font.Font(None, 20), fields)
+
+
+def test_main_line_rendered_on_change():
+    """Строка очков перерисовывается только после изменения значений"""
+    print("=== Testing HUD cache ===")
+    screen = pygame.Surface((800, 600))
+    hud = make_hud()
+    for _ in range(10):
+        hud.draw(screen, 1, 10, 3, 5)
+    assert hud.main.renders == 1
+    hud.draw(screen, 1, 11, 3, 5)
+    hud.draw(screen, 1, 11, 3, 6)
+    assert hud.main.renders == 3
+    print("OK: HUD text rendered only on change")
+
+
+def test_optional_fields_cached_separately():
+    """Дополнительные поля кэшируются отдельно друг от друга"""
+    screen = pygame.Surface((800, 600))
+    hud = make_hud(("fps", "time", "bricks"))
+    hud.draw(screen, 1, 0, 3, 5, fps=59.8, elapsed=5, bricks_left=50)
+    hud.draw(screen, 1, 0, 3, 5, fps=60.2, elapsed=5, bricks_left=50)
+    assert hud.extra["fps"].renders == 1  # Оба значения показываются как 60
+    hud.draw(screen, 1, 0, 3, 5, fps=30.0, elapsed=5, bricks_left=49)
+    assert hud.extra["fps"].renders == 2
+    assert hud.extra["bricks"].renders == 2
+    assert hud.extra["time"].renders == 1
+    assert hud.main.renders == 1
+
+
+def test_unknown_field_rejected():
+    """Неизвестное поле HUD - ошибка"""
+    try:
+        make_hud(("ping",))
+        assert False, "Ожидалась ошибка ValueError"
+    except ValueError:
+        pass
+    assert format_time(125) == "2:05"
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_main_line_rendered_on_change()
+    test_optional_fields_cached_separately()
+    test_unknown_field_rejected()
+    print("All HUD tests passed")
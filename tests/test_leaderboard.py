@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Тест представления таблицы рекордов (версия рекордов и кэш видов)"""
+
+import sys
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import highscores
+from highscores import HighScoreManager, format_highscore_row
+from PyGameBall import GameContext, ResultsScene
+
+
+def make_manager(directory: str) -> HighScoreManager:
+    highscores.HIGHSCORES_FILE = os.path.join(directory, "highscores.json")
+    return HighScoreManager()
+
+
+def test_row_format():
+    """Строка таблицы совпадает с прежним форматом столбцов"""
+    print("=== Testing leaderboard row format ===")
+    score_data = {"player_name": "Игрок", "score": 42, "time_formatted": "1:05"}
+    assert format_highscore_row(1, score_data) == (
+        "   1.  | Игрок               |  42  |  1:05"
+    )
+    assert format_highscore_row(10, score_data).startswith("  10.  | ")
+    long_name = dict(score_data, player_name="x" * 30)
+    assert format_highscore_row(2, long_name) == f"   2.  | {'x' * 20}|  42  |  1:05"
+    print("[OK] Row format")
+
+
+def test_views_rebuilt_only_on_change():
+    """Текст и другие виды таблицы пересобираются только после изменения рекордов"""
+    print("=== Testing leaderboard cache ===")
+    original_file = highscores.HIGHSCORES_FILE
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            manager = make_manager(directory)
+            leaderboard = manager.leaderboard()
+            assert manager.display_highscores() == "Пока нет рекордов"
+
+            builds = []
+
+            def build():
+                builds.append(1)
+                return object()
+
+            surface = leaderboard.cached("surface", build)
+            assert leaderboard.cached("surface", build) is surface
+            assert len(builds) == 1
+
+            version = manager.version
+            assert manager.add_score("Аня", 10, 65)
+            assert manager.version > version
+
+            text = manager.display_highscores()
+            lines = text.split("\n")
+            assert lines[0] == "ТОП-10 РЕЗУЛЬТАТОВ:"
+            assert lines[4] == "   1.  | Аня                 |  10  |  1:05"
+            # Повторный запрос без изменений возвращает тот же объект
+            assert manager.display_highscores() is text
+            # Вид строится заново после изменения рекордов
+            assert leaderboard.cached("surface", object) is not surface
+    finally:
+        highscores.HIGHSCORES_FILE = original_file
+    print("[OK] Leaderboard cache")
+
+
+def test_direct_assignment_bumps_version():
+    """Замена списка рекордов целиком тоже меняет версию"""
+    original_file = highscores.HIGHSCORES_FILE
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            manager = make_manager(directory)
+            version = manager.version
+            manager.highscores = []
+            assert manager.version == version + 1
+    finally:
+        highscores.HIGHSCORES_FILE = original_file
+
+
+def test_large_score_saved_from_results():
+    """Счет больше 999 (несколько уровней) сохраняется экраном результатов"""
+    print("=== Testing large score ===")
+    original_file = highscores.HIGHSCORES_FILE
+    pygame.font.init()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            font = pygame.font.Font(None, 20)
+            context = GameContext(
+                font=font,
+                big_font=font,
+                highscore_manager=make_manager(directory),
+                player_name="Игрок",
+            )
+            scene = ResultsScene(context, 1234, 600, None)
+            scene.enter()
+            scene.draw(pygame.Surface((800, 600)))
+            assert scene.score_saved
+            assert context.highscore_manager.get_top_scores()[0]["score"] == 1234
+            try:
+                context.highscore_manager.add_score("Игрок", -1, 60)
+                assert False, "Отрицательный счет должен вызывать ValueError"
+            except ValueError:
+                pass
+    finally:
+        highscores.HIGHSCORES_FILE = original_file
+    print("[OK] Large score saved")
+
+
+if __name__ == "__main__":
+    test_row_format()
+    test_views_rebuilt_only_on_change()
+    test_direct_assignment_bumps_version()
+    test_large_score_saved_from_results()
+    print("All leaderboard tests passed")
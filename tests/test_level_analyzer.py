@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Тест анализа уровней (партии автопилота, пул процессов, отчет)"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from autopilot import Autopilot
+from config import MAX_LIVES
+from level_analyzer import (
+    HEATMAP_SHADES,
+    UNBROKEN_CELL,
+    LevelReport,
+    LevelRun,
+    analyze_levels,
+    format_report,
+    simulate_level,
+)
+from levels import WALL_CELL, parse_level
+
+# Два кубика под потолком: автопилот разбивает их быстро
+EASY_LEVEL = """
+name: Легкий
+.. .. .. .. r1 r1
+"""
+
+# Прочные кубики: последний кадр партии добивает кубик с прочностью 2
+STRONG_LEVEL = """
+name: Прочный
+.. .. .. .. r2 r2
+"""
+
+WALLED_LEVEL = """
+name: Клетка
+== == ==
+== r1 ==
+== == ==
+.. .. .. g2
+"""
+
+
+def test_easy_level_cleared():
+    """Партия на простом уровне проходит, удары по кубикам считаются"""
+    print("=== Testing level simulation ===")
+    run = simulate_level(parse_level(EASY_LEVEL, "easy.txt"), seed=1, max_frames=6000)
+    assert run.cleared and run.frames < 6000
+    assert run.hits.tolist() == [1, 1] and run.destroyed.all()
+    assert run.lives_lost == 0
+    print(f"OK: Level cleared in {run.seconds:.1f} s")
+
+
+def test_final_frame_hits_counted():
+    """Удары последнего кадра учитываются по прочности, а не по одному на кубик"""
+    level = parse_level(STRONG_LEVEL, "strong.txt")
+    run = simulate_level(level, seed=1, max_frames=6000)
+    assert run.cleared
+    assert run.hits.tolist() == [2, 2] and run.destroyed.all()
+
+
+def test_lost_game_counts_all_lives():
+    """Проигранная партия: потеряны все жизни, удары последнего кадра учтены"""
+    level = parse_level(STRONG_LEVEL, "strong.txt")
+    control = Autopilot.control
+    # Платформа стоит на месте и только запускает мяч
+    Autopilot.control = lambda self, session: (0, 1)
+    try:
+        run = simulate_level(level, seed=1, max_frames=50000)
+    finally:
+        Autopilot.control = control
+    assert not run.cleared and run.frames < 50000
+    assert run.lives_lost == MAX_LIVES
+    assert (run.hits >= 2 * run.destroyed).all()
+
+
+def test_runs_in_process_pool():
+    """Партии уровней распределяются по процессам"""
+    levels = [parse_level(EASY_LEVEL, "easy.txt")] * 2
+    reports = analyze_levels(levels, runs=2, max_seconds=100, workers=2)
+    assert [len(report.runs) for report in reports] == [2, 2]
+    assert all(len(report.cleared) == 2 for report in reports)
+    assert len(reports[0].clear_times()) == 2
+
+
+def test_unbroken_brick_report():
+    """Кубик, не разбитый ни в одной партии, попадает в отчет и на карту"""
+    print("=== Testing analyzer report ===")
+    level = parse_level(WALLED_LEVEL, "walled.txt")
+    report = LevelReport(level)
+    for destroyed in (9, None):
+        hits = np.zeros(10, dtype=np.int32)
+        flags = np.zeros(10, dtype=bool)
+        if destroyed is not None:
+            hits[destroyed], flags[destroyed] = 2, True
+        report.runs.append(LevelRun(1, False, 600, 1, hits, flags))
+    assert report.unbroken().tolist() == [False] * 4 + [True] + [False] * 5
+    text = format_report([report])
+    assert "Пройдено: 0 из 2" in text
+    assert "Не разбиты ни разу (1): ряд 2 клетка 2" in text
+    assert "в среднем 1.00" in text
+    # Карта ударов в формате сетки уровня
+    assert "|==XX==" in text and "|      @@" in text
+    print("OK: Unbroken brick is reported")
+
+
+def test_heatmap_cells_distinct():
+    """Оттенки карты ударов не совпадают со знаками стены и неразбитого кубика"""
+    assert not set(HEATMAP_SHADES) & set(WALL_CELL + UNBROKEN_CELL)
+    report = LevelReport(parse_level(WALLED_LEVEL, "walled.txt"))
+    hits = np.zeros(10, dtype=np.int32)
+    hits[4], hits[9] = 3, 8  # Средний оттенок и самый битый кубик
+    report.runs.append(LevelRun(1, False, 600, 1, hits, np.ones(10, dtype=bool)))
+    heatmap = "".join(report.heatmap())
+    assert heatmap.count(WALL_CELL) == report.walls().sum() == 8
+
+
+if __name__ == "__main__":
+    test_easy_level_cleared()
+    test_final_frame_hits_counted()
+    test_lost_game_counts_all_lives()
+    test_runs_in_process_pool()
+    test_unbroken_brick_report()
+    test_heatmap_cells_distinct()
+    print("All level analyzer tests passed")
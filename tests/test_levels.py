@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Тест формата уровней и хранилища кубиков"""
+
+import sys
+import os
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pygame
+
+from bricks import BRICK_ARMORED, BRICK_STRONG, BRICK_WALL
+from levels import (
+    LevelPack,
+    classic_level,
+    compile_levels,
+    grid_origin,
+    load_level_pack,
+    parse_level,
+)
+
+LEVEL_TEXT = """
+# Тестовый уровень
+name: Тест
+r1 .. g2
+.. p3
+"""
+
+
+def test_parse_level():
+    """Разбор текстового описания уровня"""
+    print("=== Testing level parser ===")
+    level = parse_level(LEVEL_TEXT)
+
+    assert level.name == "Тест"
+    assert len(level.bricks) == 3
+    assert level.bricks[1]["col"] == 2 and level.bricks[1]["kind"] == BRICK_STRONG
+    assert level.bricks[2]["row"] == 1 and level.bricks[2]["kind"] == BRICK_ARMORED
+    print("OK: Level parsed")
+
+
+def test_parse_level_errors():
+    """Неверные клетки и слишком длинные ряды отклоняются"""
+    print("=== Testing level parser errors ===")
+    for text in ("x1 r1", "r0", "r1 " * 11):
+        try:
+            parse_level(text)
+        except ValueError as e:
+            print(f"OK: Rejected: {e}")
+        else:
+            raise AssertionError(f"Уровень должен быть отклонен: {text!r}")
+
+
+def test_pack_roundtrip():
+    """Уровни компилируются в двоичный формат и читаются обратно"""
+    print("=== Testing binary level pack ===")
+    levels = [classic_level(), parse_level(LEVEL_TEXT)]
+    pack = LevelPack(compile_levels(levels))
+
+    assert len(pack) == 2
+    assert pack.name(0) == "Классика"
+    assert pack.name(1) == "Тест"
+    assert (pack.level_records(1) == levels[1].bricks).all()
+    print("OK: Pack roundtrip")
+
+
+def test_build_classic_level():
+    """Стандартный уровень совпадает с прежней раскладкой кубиков"""
+    print("=== Testing classic level layout ===")
+    bricks = LevelPack.from_levels([classic_level()]).build(0)
+
+    assert len(bricks) == 50
+    assert bricks.rect(0) == pygame.Rect(*grid_origin(), 60, 20)
+    assert bricks.rect(11) == pygame.Rect(grid_origin()[0] + 70, 90, 60, 20)
+    print("OK: Classic layout")
+
+
+def test_brick_hits():
+    """Прочные кубики разрушаются только после нескольких ударов"""
+    print("=== Testing brick hits ===")
+    bricks = LevelPack.from_levels([parse_level(LEVEL_TEXT)]).build(0)
+    target = bricks.rect(1)
+
+    index = bricks.collide(target.inflate(-10, -10))
+    assert index == 1
+    assert bricks.hit(index) == 0
+    assert bricks.hit(index) == 2  # Прочный кубик приносит 2 очка
+    assert len(bricks) == 2
+    assert bricks.collide(target) == -1
+    print("OK: Multi-hit brick destroyed after two hits")
+
+
+def test_indestructible_bricks():
+    """Неразрушаемые кубики не мешают пройти уровень"""
+    print("=== Testing indestructible bricks ===")
+    level = parse_level("== r1 ==")
+    assert level.bricks[0]["kind"] == BRICK_WALL
+    bricks = LevelPack.from_levels([level]).build(0)
+
+    assert len(bricks) == 1
+    assert bricks.hit(0) == 0
+    assert bricks.alive[0]
+    assert bricks.collide(bricks.rect(0)) == 0
+
+    assert bricks.hit(1) == 1
+    assert len(bricks) == 0
+    assert bricks.alive[2]
+    print("OK: Walls survive, level cleared")
+
+
+def test_load_level_pack_compiles_directory():
+    """Каталог уровней компилируется в levels.bin и затем читается из него"""
+    print("=== Testing level directory loading ===")
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "01.txt"), "w", encoding="utf-8") as f:
+            f.write(LEVEL_TEXT)
+
+        pack = load_level_pack(directory)
+        assert os.path.exists(os.path.join(directory, "levels.bin"))
+        assert len(pack) == 1
+
+        reloaded = load_level_pack(directory)
+        assert reloaded.name(0) == "Тест"
+    print("OK: Level directory compiled and reloaded")
+
+
+def test_stale_level_pack_rebuilt():
+    """levels.bin старой версии или от удаленных файлов пересобирается"""
+    print("=== Testing stale level pack ===")
+    with tempfile.TemporaryDirectory() as directory:
+        pack_path = os.path.join(directory, "levels.bin")
+        for name in ("01.txt", "02.txt"):
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+                f.write(LEVEL_TEXT)
+        assert len(load_level_pack(directory)) == 2
+
+        # Удаленный файл уровня: levels.bin новее, но собран из других файлов
+        os.remove(os.path.join(directory, "02.txt"))
+        pack = load_level_pack(directory)
+        assert len(pack) == 1 and pack.sources() == ["01.txt"]
+
+        # Старая версия формата: levels.bin новее файлов, но не читается
+        data = bytearray(compile_levels([classic_level()]))
+        data[4] = 1  # Версия формата в заголовке
+        with open(pack_path, "wb") as f:
+            f.write(data)
+        assert load_level_pack(directory).name(0) == "Тест"
+    print("OK: Stale level pack rebuilt")
+
+
+def test_game_levels_valid():
+    """Все уровни игры разбираются без ошибок"""
+    print("=== Testing game levels ===")
+    with tempfile.TemporaryDirectory() as directory:
+        source_dir = os.path.join(ROOT_DIR, "resources", "levels")
+        for name in os.listdir(source_dir):
+            if name.endswith(".txt"):
+                with open(os.path.join(source_dir, name), encoding="utf-8") as src:
+                    with open(os.path.join(directory, name), "w", encoding="utf-8") as dst:
+                        dst.write(src.read())
+        pack = load_level_pack(directory)
+        assert len(pack) >= 1
+        for i in range(len(pack)):
+            assert len(pack.build(i)) > 0
+    print(f"OK: {len(pack)} game levels")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_parse_level()
+    test_parse_level_errors()
+    test_pack_roundtrip()
+    test_build_classic_level()
+    test_brick_hits()
+    test_indestructible_bricks()
+    test_load_level_pack_compiles_directory()
+    test_stale_level_pack_rebuilt()
+    test_game_levels_valid()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
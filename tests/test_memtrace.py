@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Тест диагностики памяти (--trace-memory)"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memtrace import MemoryTracker
+
+
+def test_growth_after_warmup():
+    """Рост считается от первого перезапуска после разогрева"""
+    print("=== Testing memory growth ===")
+    tracker = MemoryTracker(limit=64 * 1024)
+    tracker.start()
+    leaked = []
+    try:
+        # Разогрев: выделения первой партии ростом не считаются
+        cache = [bytearray(256 * 1024)]
+        tracker.restart()
+        tracker.restart()
+        assert tracker.growth == 0 and not tracker.exceeded()
+
+        tracker.checkpoint("экран Results открыт")
+        for _ in range(3):
+            leaked.append(bytearray(64 * 1024))
+            tracker.restart()
+        assert tracker.growth >= 3 * 64 * 1024
+        assert tracker.exceeded()
+
+        report = tracker.report()
+        assert "test_memtrace.py" in report
+        assert "экран Results открыт" in report
+        assert "превысил предел" in report
+    finally:
+        tracker.stop()
+    del cache
+    print("OK: Growth detected after warmup")
+
+
+def test_no_growth_passes():
+    """Без утечек предел не превышается"""
+    tracker = MemoryTracker(limit=64 * 1024)
+    tracker.start()
+    try:
+        for _ in range(4):
+            frame = [bytearray(1024) for _ in range(100)]
+            tracker.restart()
+            del frame
+        assert not tracker.exceeded()
+    finally:
+        tracker.stop()
+
+
+if __name__ == "__main__":
+    test_growth_after_warmup()
+    test_no_growth_passes()
+    print("All memory tracking tests passed")
@@ -128,6 +128,10 @@ def test_reset_game():
     print(f"  Game started: {new_game_started}")
     print(f"  Trail cleared: {len(new_trail) == 0}")
 
+    # Объекты сбрасываются на месте, а не создаются заново
+    assert new_paddle is paddle and new_ball is ball and new_trail is ball_trail
+    assert new_ball.vel_y == 0 and len(new_trail) == 0
+
     print("OK: All reset_game tests passed!\n")
 
 
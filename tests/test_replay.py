@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Тест записи партии и экспорта записи в кадры"""
+
+import sys
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from autopilot import Autopilot
+from export import FrameWriter, export_replay
+from fonts import default_font_registry
+from PyGameBall import GameContext, GameScene
+from replay import Replay, ReplayPilot
+from rng import RandomStreams
+
+FRAMES = 600
+
+
+def make_context(seed):
+    fonts = default_font_registry()
+    return GameContext(
+        font=fonts.get("arial", 20),
+        big_font=fonts.get("arial", 42, bold=True),
+        fonts=fonts,
+        rng=RandomStreams(seed),
+        music_enabled=False,
+        sounds_loaded=True,
+    )
+
+
+def state(scene):
+    session = scene.session
+    balls = session.balls
+    return (
+        session.score,
+        session.lives_left,
+        session.paddle.rect.x,
+        balls.x[balls.indices()].tolist(),
+        balls.y[balls.indices()].tolist(),
+        len(session.bricks),
+    )
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_replay_repeats_game():
+    """Партия по записи ввода и зерну повторяется кадр в кадр"""
+    print("=== Testing replay ===")
+    recording = Replay(7)
+    scene = GameScene(make_context(7), Autopilot(), recording)
+    for _ in range(FRAMES):
+        scene.update()
+    assert len(recording) == FRAMES
+    assert scene.session.score > 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "test.replay")
+        recording.save(path)
+        loaded = Replay.load(path)
+    assert loaded.seed == 7 and loaded.frames == recording.frames
+
+    pilot = ReplayPilot(loaded)
+    replayed = GameScene(make_context(loaded.seed), pilot)
+    while not pilot.finished:
+        replayed.update()
+    assert state(replayed) == state(scene)
+    print("OK: Replay reproduces the game")
+
+
+def test_export_frames():
+    """Экспорт передает каждый every-й кадр сырым RGB из фонового потока"""
+    recording = Replay(3)
+    scene = GameScene(make_context(3), Autopilot(), recording)
+    for _ in range(20):
+        scene.update()
+
+    frames = []
+    assert export_replay(recording, frames.append, every=5) == 4
+    assert all(len(frame) == 800 * 600 * 3 for frame in frames)
+    assert frames[0] != frames[-1]  # Платформа сдвинулась
+
+
+def test_writer_error_reaches_caller():
+    """Ошибка записи в фоновом потоке не теряется"""
+
+    def broken(frame):
+        raise OSError("диск заполнен")
+
+    writer = FrameWriter(broken)
+    writer.write(b"frame")
+    try:
+        writer.close()
+        assert False, "Ошибка записи должна передаваться в close()"
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    setup_module(None)
+    test_replay_repeats_game()
+    test_export_frames()
+    test_writer_error_reaches_caller()
+    teardown_module(None)
+    print("All replay tests passed")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Тест состояния партии"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from config import MAX_LIVES
+from effects import PowerUpPool
+from levels import LevelPack, classic_level
+from session import GameSession
+
+
+def play(session, frames):
+    """Простая партия без экрана: мяч запущен, кубики разрушаются"""
+    balls, bricks = session.balls, session.bricks
+    balls.launch(1)
+    session.game_started = True
+    for _ in range(frames):
+        balls.update()
+        balls.collide_paddle(session.paddle.rect)
+        for index in balls.collide_bricks(bricks):
+            session.score += bricks.hit(index)
+        session.ball_trail.append(balls.rect(balls.primary()).center)
+
+
+def test_session_slots():
+    """Атрибуты партии фиксированы через __slots__"""
+    print("=== Testing session slots ===")
+    session = GameSession(LevelPack.from_levels([classic_level()]))
+    assert not hasattr(session, "__dict__")
+    try:
+        session.unknown = 1
+        assert False, "Неизвестный атрибут не должен создаваться"
+    except AttributeError:
+        pass
+    print("OK: GameSession uses __slots__")
+
+
+def test_given_pools_used():
+    """Переданный пустой пул бонусов используется, а не заменяется новым"""
+    print("=== Testing injected pools ===")
+    powerups = PowerUpPool(capacity=4)
+    session = GameSession(LevelPack.from_levels([classic_level()]), powerups)
+    assert session.powerups is powerups
+    print("OK: Injected power-up pool kept")
+
+
+def test_reset_in_place():
+    """Перезапуск не создает новых объектов партии"""
+    print("=== Testing in-place reset ===")
+    session = GameSession(LevelPack.from_levels([classic_level()]))
+    objects = (session.paddle, session.balls, session.bricks, session.ball_trail)
+    bricks_total = len(session.bricks)
+
+    play(session, 200)
+    session.lives_left = 1
+    session.paddle.widen()
+    session.reset(ball_speed=7)
+
+    assert (session.paddle, session.balls, session.bricks, session.ball_trail) == objects
+    assert len(session.bricks) == bricks_total
+    assert session.score == 0 and session.lives_left == MAX_LIVES
+    assert session.balls.get_speed() == 7 and len(session.balls) == 1
+    assert not session.ball_trail and not session.game_started
+    print("OK: Session reset in place")
+
+
+def test_snapshot_restore():
+    """Восстановление снимка повторяет партию с того же места"""
+    print("=== Testing snapshot/restore ===")
+    session = GameSession(LevelPack.from_levels([classic_level()]))
+    play(session, 50)
+    snapshot = session.snapshot()
+    play(session, 300)
+    after = (session.score, session.balls.x.copy(), session.bricks.alive.copy())
+
+    session.restore(snapshot)
+    play(session, 300)
+    assert session.score == after[0]
+    assert np.array_equal(session.balls.x, after[1])
+    assert np.array_equal(session.bricks.alive, after[2])
+    print("OK: Restored session replays identically")
+
+
+def test_copy_independent():
+    """Копия партии не влияет на исходную"""
+    print("=== Testing session copy ===")
+    session = GameSession(LevelPack.from_levels([classic_level()]))
+    play(session, 20)
+    clone = session.copy()
+    play(clone, 400)
+
+    assert clone.score > 0 and session.score == 0
+    assert session.bricks.alive.all()
+    assert clone.bricks.x is session.bricks.x  # Неизменяемые массивы общие
+    print("OK: Copy is independent")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_session_slots()
+    test_given_pools_used()
+    test_reset_in_place()
+    test_snapshot_restore()
+    test_copy_independent()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Тест кэша спрайтов платформы и мяча и атласа кубиков"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from sprites import BrickAtlas, SpriteCache, PADDLE_SECTION_COLORS, BALL_COLOR
+
+
+def test_paddle_sprite_sections():
+    """Спрайт платформы содержит три цветные секции"""
+    print("=== Testing paddle sprite ===")
+    cache = SpriteCache()
+    sprite = cache.paddle(120, 15)
+
+    assert sprite.get_size() == (120, 15)
+    assert tuple(sprite.get_at((5, 7)))[:3] == PADDLE_SECTION_COLORS[0]
+    assert tuple(sprite.get_at((60, 7)))[:3] == PADDLE_SECTION_COLORS[1]
+    assert tuple(sprite.get_at((115, 7)))[:3] == PADDLE_SECTION_COLORS[2]
+    print("OK: Paddle sections rendered")
+
+
+def test_sprite_reused_until_size_changes():
+    """Спрайт перерисовывается только при изменении размера"""
+    print("=== Testing sprite reuse ===")
+    cache = SpriteCache()
+
+    first = cache.paddle(120, 15)
+    assert cache.paddle(120, 15) is first
+    assert len(cache) == 1
+
+    wide = cache.paddle(180, 15)
+    assert wide is not first
+    assert wide.get_width() == 180
+    assert len(cache) == 2
+
+    ball = cache.ball(16, 16)
+    assert cache.ball(16, 16) is ball
+    print("OK: Sprites cached by size")
+
+
+def test_ball_sprite_transparent_corners():
+    """У спрайта мяча прозрачные углы и закрашенный центр"""
+    print("=== Testing ball sprite ===")
+    cache = SpriteCache()
+    sprite = cache.ball(16, 16)
+
+    assert sprite.get_at((0, 0)).a == 0
+    assert tuple(sprite.get_at((8, 8)))[:3] == BALL_COLOR
+    print("OK: Ball sprite has transparent corners")
+
+
+def test_brick_atlas_matches_draw_rect():
+    """Атлас рисует кубики так же, как заливка и рамка pygame.draw.rect"""
+    print("=== Testing brick atlas ===")
+    from bricks import BRICK_BORDER_COLOR, BRICK_NORMAL, BRICK_STRONG, BrickStore
+
+    bricks = BrickStore.grid(
+        [0, 1, 2, 3],
+        [0, 0, 1, 1],
+        [BRICK_NORMAL, BRICK_STRONG, BRICK_NORMAL, BRICK_STRONG],
+        [0, 1, 0, 1],
+        origin=(10, 10),
+        brick_size=(60, 20),
+        padding=10,
+    )
+    bricks.hit(1)  # Поврежденный кубик темнее - отдельный вариант в атласе
+    bricks.hit(2)  # Разрушенный кубик не рисуется
+
+    expected = pygame.Surface((400, 100))
+    for brick, color in bricks:
+        pygame.draw.rect(expected, color, brick)
+        pygame.draw.rect(expected, BRICK_BORDER_COLOR, brick, 2)
+
+    atlas = BrickAtlas(width=100)  # Узкий атлас: спрайты в нескольких рядах
+    actual = pygame.Surface((400, 100))
+    atlas.draw(actual, bricks)
+    assert len(atlas) == 3
+    assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+        expected, "RGB"
+    )
+    print("OK: Atlas draws the same pixels")
+
+
+def test_brick_blits_rebuilt_on_change():
+    """Список отрисовки кубиков собирается заново только после удара"""
+    from bricks import BRICK_NORMAL, BrickStore
+
+    bricks = BrickStore.grid(
+        [0, 1], [0, 0], [BRICK_NORMAL] * 2, [0, 0], (0, 0), (60, 20), 10
+    )
+    atlas = BrickAtlas()
+    first = atlas.blits(bricks)
+    assert len(first) == 2 and len(atlas) == 1
+    assert atlas.blits(bricks) is first
+
+    bricks.hit(0)
+    assert len(atlas.blits(bricks)) == 1
+
+    restored = bricks.copy()
+    restored.alive[:] = True
+    bricks.copy_from(restored)
+    assert len(atlas.blits(bricks)) == 2
+
+
+def main():
+    """Основная функция тестирования"""
+    test_paddle_sprite_sections()
+    test_sprite_reused_until_size_changes()
+    test_ball_sprite_transparent_corners()
+    test_brick_atlas_matches_draw_rect()
+    test_brick_blits_rebuilt_on_change()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Тест быстрого старта: отложенный импорт и профиль запуска"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from startup import StartupProfile, lazy_import
+
+
+def test_lazy_import():
+    """Модуль выполняется только при первом обращении к атрибуту"""
+    print("=== Testing lazy import ===")
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "lazy_probe.py"), "w") as f:
+            f.write("import sys\nsys.lazy_probe_loaded = True\nVALUE = 42\n")
+        sys.path.insert(0, directory)
+        try:
+            module = lazy_import("lazy_probe")
+            assert not hasattr(sys, "lazy_probe_loaded")
+            assert module.VALUE == 42
+            assert sys.lazy_probe_loaded
+        finally:
+            sys.path.remove(directory)
+            sys.modules.pop("lazy_probe", None)
+            del sys.lazy_probe_loaded
+    print("OK: Module loaded on first attribute access")
+
+
+def test_startup_report():
+    """Отчет повторяет формат -X importtime и учитывает вложенные этапы"""
+    print("=== Testing startup profile ===")
+    profile = StartupProfile()
+    with profile.phase("outer"):
+        with profile.phase("inner"):
+            pass
+    profile.mark_first_frame()
+    with profile.phase("deferred"):
+        pass
+
+    lines = profile.report().splitlines()
+    assert lines[0] == "startup time: self [us] | cumulative | phase"
+    assert lines[1].endswith("|   inner") and lines[2].endswith("| outer")
+    assert lines[3].endswith("| первый кадр") and lines[4].endswith("| deferred")
+    depth, name, own, cumulative = profile.records[1]
+    assert (depth, name) == (0, "outer") and own <= cumulative
+    print("OK: Startup report formatted")
+
+
+def main():
+    """Основная функция тестирования"""
+    test_lazy_import()
+    test_startup_report()
+    print("SUCCESS: ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Тест предсказания траектории мяча без покадрового повторения движения"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from balls import BallPool
+from bricks import BrickStore
+from trajectory import predict_landing, step_landing, wall_path, wall_position
+
+
+def test_matches_stepping():
+    """Аналитический расчет совпадает с покадровым, в том числе за стенами"""
+    print("=== Testing analytic prediction ===")
+    rng = random.Random(1)
+    for _ in range(20000):
+        size = rng.choice((8, 16, 20))
+        state = (
+            rng.randint(-40, 840),  # Мяч может начать за стеной
+            rng.randint(-40, 590),
+            rng.randint(-30, 30),
+            rng.randint(-20, 20),
+            size,
+            rng.choice((540, 560, 100)),
+        )
+        assert predict_landing(*state) == step_landing(*state), state
+    print("OK: Analytic prediction matches stepping")
+
+
+def test_wall_position_far_ahead():
+    """Положение через тысячи кадров совпадает с последним кадром пути"""
+    rng = random.Random(2)
+    for _ in range(500):
+        x, vel = rng.randint(-20, 800), rng.randint(-25, 25)
+        frames = rng.randint(1, 5000)
+        path = wall_path(x, vel, frames, 784)
+        assert len(path) == frames
+        assert path[-1] == wall_position(x, vel, frames, 784)
+
+
+def test_bricks_block_prediction():
+    """С кубиками подсказки нет, если мяч ударится о кубик до платформы"""
+    print("=== Testing prediction with bricks ===")
+    bricks = BrickStore([300], [100], [200], [30], [0], [0])
+    line_y = 540
+    for vel_x, vel_y, blocked in ((0, -5, True), (6, -5, False), (0, 5, False)):
+        pool = BallPool()
+        index = pool.spawn(390, 300, vel_x, vel_y)
+        landing = predict_landing(
+            390, 300, vel_x, vel_y, pool.size, line_y, bricks=bricks
+        )
+        assert (landing is None) == blocked
+        assert predict_landing(390, 300, vel_x, vel_y, pool.size, line_y)
+
+        # Тот же путь в пуле мячей: удар о кубик до линии платформы
+        frames = step_landing(390, 300, vel_x, vel_y, pool.size, line_y)[0]
+        hit = False
+        for _ in range(frames):
+            pool.update()
+            hit = hit or bricks.collide(pool.rect(index)) != -1
+        assert hit == blocked
+    print("OK: Bricks on the path block the prediction")
+
+
+if __name__ == "__main__":
+    test_matches_stepping()
+    test_wall_position_far_ahead()
+    test_bricks_block_prediction()
+    print("All trajectory tests passed")
@@ -0,0 +1,169 @@
+"""
+Предсказание траектории мяча игры Арканоид
+Мяч движется на целое число пикселей за кадр и отражается от стен
+и потолка так же, как в BallPool.update: скорость разворачивается
+в кадре, когда мяч дошел до стены или зашел за нее. Поэтому точки разворота
+у стен постоянны (это ближайшие к стенам точки шага скорости), движение
+между ними периодично, и положение мяча через любое число кадров
+вычисляется за O(1) - без покадрового повторения движения.
+Используется автопилотом и подсказкой точки падения (--assist).
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from config import SCREEN_WIDTH
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def _steps_to_turn(x: int, direction: int, speed: int, right: int) -> int:
+    """Кадров до разворота у стены 0 (direction < 0) или right (direction > 0)"""
+    if direction > 0:
+        return max(1, _ceil_div(right - x, speed))
+    return max(1, _ceil_div(x, speed))
+
+
+def wall_position(x: int, vel: int, frames: int, right: int) -> int:
+    """
+    Координата мяча через frames кадров при движении со скоростью vel
+    между стенами: разворот при x <= 0 и при x >= right.
+    После двух разворотов движение периодично, поэтому число шагов
+    не зависит от frames.
+    """
+    if vel == 0 or frames <= 0:
+        return x
+    speed = abs(vel)
+    direction = 1 if vel > 0 else -1
+    turns = 0
+    while True:
+        steps = _steps_to_turn(x, direction, speed, right)
+        if frames <= steps:
+            return x + direction * frames * speed
+        x += direction * steps * speed
+        frames -= steps
+        direction = -direction
+        turns += 1
+        if turns == 2:
+            # Дальше разворот у другой стены и снова в этой точке
+            # (первый разворот мог быть за стеной, если мяч начал там)
+            there = _steps_to_turn(x, direction, speed, right)
+            back = x + direction * there * speed
+            period = there + _steps_to_turn(back, -direction, speed, right)
+            frames %= period
+            if frames == 0:
+                return x
+
+
+def wall_path(x: int, vel: int, frames: int, right: int) -> np.ndarray:
+    """Координаты мяча после каждого из frames кадров (как wall_position)"""
+    if vel == 0 or frames <= 0:
+        return np.full(max(frames, 0), x, dtype=np.int32)
+    speed = abs(vel)
+    direction = 1 if vel > 0 else -1
+    parts = []
+    while frames > 0:
+        steps = min(_steps_to_turn(x, direction, speed, right), frames)
+        parts.append(x + direction * speed * np.arange(1, steps + 1, dtype=np.int32))
+        x += direction * steps * speed
+        frames -= steps
+        direction = -direction
+    return np.concatenate(parts)
+
+
+def frames_to_line(y: int, vel_y: int, size: int, line_y: int) -> Optional[int]:
+    """
+    Кадров до того, как падающий мяч дойдет нижним краем до линии line_y
+    (летящий вверх мяч сначала отражается от потолка), или None,
+    если мяч движется только по горизонтали
+    """
+    if vel_y == 0:
+        return None
+    speed = abs(vel_y)
+    up = 0
+    if vel_y < 0:
+        up = _steps_to_turn(y, -1, speed, 0)
+        y -= up * speed
+    return up + max(0, _ceil_div(line_y - size - y, speed))
+
+
+def _first_brick_frame(x, y, vel_x, vel_y, size, frames, width, bricks) -> int:
+    """Номер кадра (от 1) первого удара о кубик за frames кадров или 0"""
+    speed = abs(vel_y)
+    steps = np.arange(1, frames + 1, dtype=np.int32)
+    if vel_y > 0:
+        ys = y + speed * steps
+    else:
+        # Вверх до разворота у потолка, затем вниз
+        up = _steps_to_turn(y, -1, speed, 0)
+        top = y - up * speed
+        ys = np.where(steps <= up, y - speed * steps, top + speed * (steps - up))
+    # Проверяются только кадры, где мяч выше нижнего края кубиков
+    near = np.flatnonzero(ys < int((bricks.y + bricks.height).max()))
+    if not len(near):
+        return 0
+    xs = wall_path(x, vel_x, int(near[-1]) + 1, width - size)[near]
+    hits = np.flatnonzero(bricks.collide_boxes(xs, ys[near], size, size) != -1)
+    return int(near[hits[0]]) + 1 if len(hits) else 0
+
+
+def predict_landing(
+    x: int,
+    y: int,
+    vel_x: int,
+    vel_y: int,
+    size: int,
+    line_y: int,
+    width: int = SCREEN_WIDTH,
+    max_frames: int = 2000,
+    bricks=None,
+) -> Optional[Tuple[int, float]]:
+    """
+    Точка, в которой нижний край мяча дойдет до линии line_y
+    (с отскоками от стен и потолка, как в BallPool.update).
+    Возвращает (кадров до линии, x центра мяча) или None, если мяч
+    не долетит до линии за max_frames кадров.
+    Если передан набор кубиков bricks, путь проверяется по индексу кубиков
+    (BrickStore.collide_boxes): при ударе о кубик до линии возвращается None -
+    после отскока от кубика мяч полетит иначе.
+    """
+    frames = frames_to_line(y, vel_y, size, line_y)
+    if frames is None or frames >= max_frames:
+        return None
+    if bricks is not None and frames and len(bricks):
+        if _first_brick_frame(x, y, vel_x, vel_y, size, frames, width, bricks):
+            return None
+    return frames, wall_position(x, vel_x, frames, width - size) + size / 2
+
+
+def step_landing(
+    x: int,
+    y: int,
+    vel_x: int,
+    vel_y: int,
+    size: int,
+    line_y: int,
+    width: int = SCREEN_WIDTH,
+    max_frames: int = 2000,
+) -> Optional[Tuple[int, float]]:
+    """
+    То же, что predict_landing без кубиков, но покадровым повторением
+    движения мяча. Образец для проверки и замеров (benchmarks/bench_predictor.py).
+    """
+    if vel_x == 0 and vel_y == 0:
+        return None
+    for frame in range(max_frames):
+        if vel_y > 0 and y + size >= line_y:
+            return frame, x + size / 2
+        x += vel_x
+        y += vel_y
+        if x <= 0:
+            vel_x = abs(vel_x)
+        elif x + size >= width:
+            vel_x = -abs(vel_x)
+        if y <= 0:
+            vel_y = abs(vel_y)
+    return None